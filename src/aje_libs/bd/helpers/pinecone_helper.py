@@ -1,10 +1,10 @@
 from typing import Optional, Dict, List, Any, Union
 import json
-import boto3
 from pinecone import Pinecone
 from botocore.exceptions import ClientError
 
 from ...common.logger import custom_logger
+from ...common.helpers.client_registry import get_client
 
 logger = custom_logger(__name__)
 
@@ -39,7 +39,7 @@ class PineconeHelper:
         self.min_threshold = min_threshold
         
         # Initialize AWS client for embeddings
-        self.bedrock_client = boto3.client("bedrock-runtime", region_name=self.embeddings_region)
+        self.bedrock_client = get_client("bedrock-runtime", region_name=self.embeddings_region)
         
         # Initialize Pinecone client (Serverless-compatible)
         self.pinecone_client = Pinecone(api_key=self.api_key)
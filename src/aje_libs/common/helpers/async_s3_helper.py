@@ -0,0 +1,449 @@
+# src/aje_libs/common/helpers/async_s3_helper.py
+
+import asyncio
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from typing import Optional, Dict, List, Any, Union, Tuple, Iterable, AsyncIterator, Awaitable, TypeVar
+
+from ..logger import custom_logger
+from .s3.concurrency import chunked
+
+logger = custom_logger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_MAX_CONCURRENCY = 64
+DELETE_BATCH_SIZE = 1000
+
+
+class AsyncS3Helper:
+    """asyncio S3 helper built on aiobotocore, with bounded request concurrency."""
+
+    def __init__(
+        self,
+        bucket_name: str,
+        region_name: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        config: Optional[Config] = None,
+        endpoint_url: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the async S3 helper.
+
+        The client is created when the helper is entered (async with) or on the
+        first call, and every request holds one of max_concurrency semaphore
+        slots, so batch methods can be given thousands of keys at once.
+
+        :param bucket_name: Name of the S3 bucket.
+        :param region_name: AWS region (optional, defaults to boto3 default).
+        :param max_concurrency: Maximum number of requests in flight.
+        :param config: botocore Config merged over the pool size (optional).
+        :param endpoint_url: Custom endpoint, e.g. a local S3 stand-in (optional).
+        """
+        self.bucket_name = bucket_name
+        self.region_name = region_name
+        self.max_concurrency = max_concurrency
+        self.endpoint_url = endpoint_url
+        self.config = Config(max_pool_connections=max_concurrency)
+        if config is not None:
+            self.config = self.config.merge(config)
+        self._client = None
+        self._client_context = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncS3Helper":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _get_client(self):
+        """Create the aiobotocore client on first use"""
+        if self._client is not None:
+            return self._client
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._client is None:
+                try:
+                    from aiobotocore.session import get_session
+                except ImportError:
+                    raise ImportError("AsyncS3Helper requires the 'aiobotocore' package")
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._client_context = get_session().create_client(
+                    's3',
+                    region_name=self.region_name,
+                    endpoint_url=self.endpoint_url,
+                    config=self.config
+                )
+                self._client = await self._client_context.__aenter__()
+                logger.info(f"Configured async helper for S3 bucket: {self.bucket_name}")
+        return self._client
+
+    async def close(self) -> None:
+        """Close the client and its connection pool."""
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+        self._client = None
+        self._client_context = None
+
+    async def _call(self, operation: str, **kwargs: Any) -> Dict[str, Any]:
+        """Run one API call while holding a concurrency slot"""
+        client = await self._get_client()
+        async with self._semaphore:
+            return await getattr(client, operation)(**kwargs)
+
+    def _log_error(self, action: str, object_key: Optional[str], error: ClientError) -> None:
+        logger.error(
+            f"Failed to {action} - Bucket: {self.bucket_name} | Key: {object_key} | "
+            f"Error: {error.response['Error']['Code']} | "
+            f"Message: {error.response['Error']['Message']}"
+        )
+
+    async def get_object(self, object_key: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Get an object with its body read into memory.
+
+        :param object_key: Key name in S3.
+        :param kwargs: Extra arguments for get_object (Range, IfMatch, ...).
+        :return: get_object response with 'Body' as bytes.
+        """
+        client = await self._get_client()
+        try:
+            async with self._semaphore:
+                response = await client.get_object(Bucket=self.bucket_name, Key=object_key, **kwargs)
+                async with response['Body'] as stream:
+                    response['Body'] = await stream.read()
+            return response
+        except ClientError as error:
+            self._log_error("get object", object_key, error)
+            raise error
+
+    async def read_object(self, object_key: str) -> bytes:
+        """
+        Read an object's content.
+
+        :param object_key: Key name in S3.
+        :return: Object content.
+        """
+        return (await self.get_object(object_key))['Body']
+
+    async def put_object(
+        self,
+        object_key: str,
+        body: Union[str, bytes],
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Put object content to S3.
+
+        :param object_key: Key name in S3.
+        :param body: Content to upload.
+        :param extra_args: Extra arguments to pass to put_object.
+        :return: S3 path of the uploaded object.
+        """
+        try:
+            await self._call('put_object', Bucket=self.bucket_name, Key=object_key, Body=body, **(extra_args or {}))
+            return f"s3://{self.bucket_name}/{object_key}"
+        except ClientError as error:
+            self._log_error("put object", object_key, error)
+            raise error
+
+    async def head_object(self, object_key: str) -> Dict[str, Any]:
+        """
+        Get object metadata without downloading the content.
+
+        :param object_key: Key name in S3.
+        :return: Object metadata.
+        """
+        try:
+            response = await self._call('head_object', Bucket=self.bucket_name, Key=object_key)
+            response.pop('ResponseMetadata', None)
+            return response
+        except ClientError as error:
+            self._log_error("get object metadata", object_key, error)
+            raise error
+
+    async def object_exists(self, object_key: str) -> bool:
+        """
+        Check if an object exists.
+
+        :param object_key: Key name in S3.
+        :return: True if object exists, False otherwise.
+        """
+        try:
+            await self._call('head_object', Bucket=self.bucket_name, Key=object_key)
+            return True
+        except ClientError as error:
+            if error.response['Error']['Code'] == '404':
+                return False
+            self._log_error("check object existence", object_key, error)
+            raise error
+
+    async def delete_object(self, object_key: str) -> None:
+        """
+        Delete an object from S3.
+
+        :param object_key: Key name in S3.
+        """
+        try:
+            await self._call('delete_object', Bucket=self.bucket_name, Key=object_key)
+        except ClientError as error:
+            self._log_error("delete object", object_key, error)
+            raise error
+
+    async def delete_objects(self, object_keys: List[str]) -> Dict[str, Any]:
+        """
+        Delete multiple objects, sending the 1000-key batches concurrently.
+
+        :param object_keys: List of key names in S3.
+        :return: Dict with Deleted and Errors merged across batches.
+        """
+        async def delete_batch(batch: List[str]) -> Dict[str, Any]:
+            return await self._call(
+                'delete_objects',
+                Bucket=self.bucket_name,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': False}
+            )
+
+        try:
+            responses = await asyncio.gather(*(delete_batch(batch) for batch in chunked(object_keys, DELETE_BATCH_SIZE)))
+        except ClientError as error:
+            self._log_error("delete objects", None, error)
+            raise error
+
+        response = {'Deleted': [], 'Errors': []}
+        for batch_response in responses:
+            response['Deleted'].extend(batch_response.get('Deleted', []))
+            response['Errors'].extend(batch_response.get('Errors', []))
+        if response['Errors']:
+            logger.warning(f"Failed to delete {len(response['Errors'])} objects")
+        return response
+
+    async def copy_object(
+        self,
+        source_key: str,
+        destination_key: str,
+        source_bucket: Optional[str] = None,
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Copy an object within S3 (server side, up to 5 GB).
+
+        :param source_key: Source object key.
+        :param destination_key: Destination object key.
+        :param source_bucket: Source bucket (defaults to current bucket).
+        :param extra_args: Extra arguments to pass to copy_object.
+        :return: S3 path of the copied object.
+        """
+        source = {'Bucket': source_bucket or self.bucket_name, 'Key': source_key}
+        try:
+            await self._call(
+                'copy_object',
+                CopySource=source,
+                Bucket=self.bucket_name,
+                Key=destination_key,
+                **(extra_args or {})
+            )
+            return f"s3://{self.bucket_name}/{destination_key}"
+        except ClientError as error:
+            self._log_error("copy object", source_key, error)
+            raise error
+
+    async def iter_objects(
+        self,
+        prefix: Optional[str] = None,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily iterate over objects in the bucket, one page at a time.
+
+        :param prefix: Prefix to filter objects.
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :return: Async iterator of object metadata.
+        """
+        client = await self._get_client()
+        kwargs = {'Bucket': self.bucket_name, 'MaxKeys': max_keys}
+        if prefix:
+            kwargs['Prefix'] = prefix
+        page_count = 0
+        try:
+            async for page in client.get_paginator('list_objects_v2').paginate(**kwargs):
+                page_count += 1
+                for obj in page.get('Contents', []):
+                    yield obj
+                if max_pages and page_count >= max_pages:
+                    break
+        except ClientError as error:
+            self._log_error("list objects", prefix, error)
+            raise error
+
+    async def list_objects(self, prefix: Optional[str] = None, max_keys: int = 1000) -> List[str]:
+        """
+        List object keys in the bucket.
+
+        :param prefix: Prefix to filter objects.
+        :param max_keys: Maximum number of keys per request.
+        :return: List of object keys.
+        """
+        return [obj['Key'] async for obj in self.iter_objects(prefix=prefix, max_keys=max_keys)]
+
+    async def read_objects(self, object_keys: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Read many objects concurrently.
+
+        :param object_keys: Key names in S3.
+        :return: Dict mapping each key to its content.
+        """
+        keys = list(dict.fromkeys(object_keys))
+        bodies = await asyncio.gather(*(self.read_object(key) for key in keys))
+        return dict(zip(keys, bodies))
+
+    async def put_objects(
+        self,
+        objects: Dict[str, Union[str, bytes]],
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Put many objects concurrently.
+
+        :param objects: Dict mapping key names to content.
+        :param extra_args: Extra arguments applied to every put_object.
+        :return: S3 paths of the uploaded objects.
+        """
+        return list(await asyncio.gather(
+            *(self.put_object(key, body, extra_args) for key, body in objects.items())
+        ))
+
+    async def objects_exist(self, object_keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check the existence of many objects concurrently.
+
+        :param object_keys: Key names in S3.
+        :return: Dict mapping each key to whether it exists.
+        """
+        keys = list(dict.fromkeys(object_keys))
+        results = await asyncio.gather(*(self.object_exists(key) for key in keys))
+        return dict(zip(keys, results))
+
+    async def get_objects_metadata(self, object_keys: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get the metadata of many objects concurrently.
+
+        :param object_keys: Key names in S3.
+        :return: Dict mapping each key to its metadata (None if it does not exist).
+        """
+        async def head(key: str) -> Optional[Dict[str, Any]]:
+            try:
+                response = await self._call('head_object', Bucket=self.bucket_name, Key=key)
+            except ClientError as error:
+                if error.response['Error']['Code'] == '404':
+                    return None
+                self._log_error("get object metadata", key, error)
+                raise error
+            response.pop('ResponseMetadata', None)
+            return response
+
+        keys = list(dict.fromkeys(object_keys))
+        results = await asyncio.gather(*(head(key) for key in keys))
+        return dict(zip(keys, results))
+
+    async def copy_objects(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        source_bucket: Optional[str] = None,
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Copy many objects concurrently.
+
+        :param pairs: (source_key, destination_key) tuples.
+        :param source_bucket: Source bucket (defaults to current bucket).
+        :param extra_args: Extra arguments applied to every copy_object.
+        :return: S3 paths of the copied objects.
+        """
+        return list(await asyncio.gather(
+            *(self.copy_object(source, destination, source_bucket, extra_args) for source, destination in pairs)
+        ))
+
+
+class SyncS3BatchHelper:
+    """Blocking facade running AsyncS3Helper batches on a private event loop thread."""
+
+    def __init__(self, bucket_name: str, **kwargs: Any) -> None:
+        """
+        Initialize the facade.
+
+        The event loop lives in a daemon thread owned by the facade, so it can
+        be used from plain synchronous code as well as from code that already
+        runs inside another event loop.
+
+        :param bucket_name: Name of the S3 bucket.
+        :param kwargs: Extra arguments for AsyncS3Helper (region_name, max_concurrency, ...).
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='aje-s3-async', daemon=True)
+        self._thread.start()
+        self.helper = AsyncS3Helper(bucket_name, **kwargs)
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        if self._loop.is_closed():
+            raise RuntimeError("SyncS3BatchHelper is closed")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def read_objects(self, object_keys: Iterable[str]) -> Dict[str, bytes]:
+        """Read many objects concurrently (see AsyncS3Helper.read_objects)."""
+        return self._run(self.helper.read_objects(object_keys))
+
+    def put_objects(
+        self,
+        objects: Dict[str, Union[str, bytes]],
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Put many objects concurrently (see AsyncS3Helper.put_objects)."""
+        return self._run(self.helper.put_objects(objects, extra_args))
+
+    def objects_exist(self, object_keys: Iterable[str]) -> Dict[str, bool]:
+        """Check the existence of many objects concurrently (see AsyncS3Helper.objects_exist)."""
+        return self._run(self.helper.objects_exist(object_keys))
+
+    def get_objects_metadata(self, object_keys: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get the metadata of many objects concurrently (see AsyncS3Helper.get_objects_metadata)."""
+        return self._run(self.helper.get_objects_metadata(object_keys))
+
+    def copy_objects(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        source_bucket: Optional[str] = None,
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Copy many objects concurrently (see AsyncS3Helper.copy_objects)."""
+        return self._run(self.helper.copy_objects(pairs, source_bucket, extra_args))
+
+    def delete_objects(self, object_keys: List[str]) -> Dict[str, Any]:
+        """Delete multiple objects (see AsyncS3Helper.delete_objects)."""
+        return self._run(self.helper.delete_objects(object_keys))
+
+    def list_objects(self, prefix: Optional[str] = None, max_keys: int = 1000) -> List[str]:
+        """List object keys in the bucket (see AsyncS3Helper.list_objects)."""
+        return self._run(self.helper.list_objects(prefix, max_keys))
+
+    def close(self) -> None:
+        """Close the client and stop the event loop thread."""
+        if self._loop.is_closed():
+            return
+        self._run(self.helper.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncS3BatchHelper":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
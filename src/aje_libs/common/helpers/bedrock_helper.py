@@ -1,9 +1,9 @@
 # src/aje_libs/bd/helpers/bedrock_helper.py
 import json
-import boto3
 from typing import Dict, Any, List, Optional, Union
 from botocore.exceptions import ClientError
 from ...common.logger import custom_logger
+from .client_registry import get_client
 from .bedrock.model_factory import ModelFactory
 from .bedrock.models.model_enums import BedrockModel, BedrockModelCategory
 
@@ -18,7 +18,7 @@ class BedrockHelper:
         
         :param region_name: Región de AWS
         """
-        self.bedrock_client = boto3.client('bedrock-runtime', region_name=region_name)
+        self.bedrock_client = get_client('bedrock-runtime', region_name=region_name)
         self.region_name = region_name
     
     def _get_model_id(self, model: Union[str, BedrockModel]) -> str:
@@ -0,0 +1,160 @@
+# src/aje_libs/common/helpers/client_registry.py
+import threading
+from typing import Optional, Dict, Any, Hashable, Iterable, Tuple, Union
+
+import boto3
+from botocore.config import Config
+
+from ..logger import custom_logger
+
+logger = custom_logger(__name__)
+
+_lock = threading.Lock()
+_clients: Dict[Tuple[Any, ...], Any] = {}
+_generation = 0
+_last_default_session: Optional[boto3.session.Session] = None
+# boto3 resources are not thread-safe, so they are cached per thread
+_resources = threading.local()
+
+
+def default_session() -> boto3.session.Session:
+    """
+    Get boto3's default session, the one boto3.client() uses.
+
+    Registry clients are built from it, so boto3.setup_default_session()
+    keeps applying to every helper.
+
+    :return: boto3 Session.
+    """
+    global _last_default_session, _generation
+    with _lock:
+        # Creating the default session is not thread-safe
+        session = boto3._get_default_session()
+        if session is not _last_default_session:
+            if _last_default_session is not None:
+                # The default session was replaced: drop what the previous one built
+                for key in [key for key in _clients if key[0] is _last_default_session]:
+                    del _clients[key]
+                _generation += 1
+            _last_default_session = session
+        return session
+
+
+def credential_identity(session: boto3.session.Session) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Identify the credentials of a session, for caches of per-principal results.
+
+    :param session: boto3 Session.
+    :return: Tuple of profile name and access key id (None when no credentials are found).
+    """
+    credentials = session.get_credentials()
+    return session.profile_name, credentials.access_key if credentials is not None else None
+
+
+def _config_key(config: Optional[Config]) -> Tuple[Any, ...]:
+    """Values of every public Config option, so equal configs share a client"""
+    if config is None:
+        return ()
+    return tuple((name, repr(getattr(config, name, None))) for name in sorted(Config.OPTION_DEFAULTS))
+
+
+def _cache_key(
+    service_name: str,
+    region_name: Optional[str],
+    config: Optional[Config],
+    session: Optional[boto3.session.Session],
+    cache_key: Optional[Hashable],
+) -> Tuple[Any, ...]:
+    config_part = ('key', cache_key) if cache_key is not None else _config_key(config)
+    return (session, service_name, region_name, config_part)
+
+
+def get_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    config: Optional[Config] = None,
+    session: Optional[boto3.session.Session] = None,
+    cache_key: Optional[Hashable] = None,
+):
+    """
+    Get a shared boto3 client for a service, region and config.
+
+    Clients are thread-safe, so one instance (and its connection pool) is reused
+    by every helper in the process instead of being rebuilt per helper. Clients
+    are built from the given session, else from boto3's default session, and
+    keep botocore's defaults for every option the config does not set.
+
+    :param service_name: AWS service name (e.g. 's3', 'dynamodb').
+    :param region_name: AWS region (optional, defaults to boto3 default).
+    :param config: botocore Config (optional).
+    :param session: boto3 Session to build the client from (optional, defaults to
+        the one configured with boto3.setup_default_session).
+    :param cache_key: Key identifying the config in the cache, instead of its option values (optional).
+    :return: boto3 client.
+    """
+    session = session or default_session()
+    key = _cache_key(service_name, region_name, config, session, cache_key)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = session.client(service_name, region_name=region_name, config=config)
+            _clients[key] = client
+            logger.debug(f"Created shared client - Service: {service_name} | Region: {region_name}")
+    return client
+
+
+def get_resource(
+    service_name: str,
+    region_name: Optional[str] = None,
+    config: Optional[Config] = None,
+    session: Optional[boto3.session.Session] = None,
+    cache_key: Optional[Hashable] = None,
+):
+    """
+    Get a boto3 resource for a service, region and config, cached per thread.
+
+    :param service_name: AWS service name (e.g. 's3', 'dynamodb').
+    :param region_name: AWS region (optional, defaults to boto3 default).
+    :param config: botocore Config (optional).
+    :param session: boto3 Session to build the resource from (optional, defaults to
+        the one configured with boto3.setup_default_session).
+    :param cache_key: Key identifying the config in the cache, instead of its option values (optional).
+    :return: boto3 service resource.
+    """
+    session = session or default_session()
+    cache = getattr(_resources, 'cache', None)
+    if cache is None or getattr(_resources, 'generation', None) != _generation:
+        cache = _resources.cache = {}
+        _resources.generation = _generation
+
+    key = _cache_key(service_name, region_name, config, session, cache_key)
+    resource = cache.get(key)
+    if resource is None:
+        with _lock:
+            resource = session.resource(service_name, region_name=region_name, config=config)
+        cache[key] = resource
+    return resource
+
+
+def prewarm(services: Iterable[Union[str, Tuple[str, Optional[str]]]]) -> None:
+    """
+    Create clients ahead of time, e.g. at module level during Lambda init.
+
+    :param services: Service names or (service name, region) tuples.
+    """
+    for service in services:
+        service_name, region_name = (service, None) if isinstance(service, str) else service
+        get_client(service_name, region_name)
+    logger.info(f"Pre-warmed {len(_clients)} shared clients")
+
+
+def clear_clients() -> None:
+    """Drop every cached client and resource (e.g. after rotating credentials)."""
+    global _generation
+    with _lock:
+        _clients.clear()
+        _generation += 1
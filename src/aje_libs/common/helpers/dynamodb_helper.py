@@ -1,11 +1,13 @@
 import json
 import os
-import boto3
 from boto3.dynamodb.conditions import Key, Attr
 from botocore.exceptions import ClientError
 from typing import Optional, Dict, List, Any, Union
 
 from ..logger import custom_logger
+from .client_registry import credential_identity, default_session, get_client, get_resource
+from . import metadata_cache
+from .metadata_cache import DEFAULT_VALIDATION_TTL, VALIDATION_MODES
 
 logger = custom_logger(__name__)
 
@@ -18,6 +20,8 @@ class DynamoDBHelper:
         pk_name: str,
         sk_name: Optional[str] = None,
         region_name: Optional[str] = None,
+        validation: str = 'cached',
+        validation_ttl: Optional[float] = DEFAULT_VALIDATION_TTL,
     ) -> None:
         """
         Initialize the DynamoDB helper.
@@ -26,24 +30,62 @@ class DynamoDBHelper:
         :param region_name: AWS region (optional, defaults to boto3 default).
         :param pk_name: Name of the partition key.
         :param sk_name: Name of the sort key (optional).
+        :param validation: 'eager' to call describe_table on every init, 'cached' to reuse
+            the process-wide describe_table result for validation_ttl seconds, 'lazy' to
+            skip it until the description is needed.
+        :param validation_ttl: Seconds a describe_table result is reused (None for the process lifetime).
         """
+        if validation not in VALIDATION_MODES:
+            raise ValueError(f"Unsupported validation mode: {validation}")
         self.table_name = table_name
         self.pk_name = pk_name
         self.sk_name = sk_name
-        self.dynamodb_client = boto3.client("dynamodb", region_name=region_name)  # Solo para operaciones específicas
-        self.dynamodb_resource = boto3.resource("dynamodb", region_name=region_name)
+        self.region_name = region_name
+        self.validation_ttl = validation_ttl
+        self.session = default_session()
+        self.dynamodb_client = get_client("dynamodb", region_name=region_name, session=self.session)  # Solo para operaciones específicas
+        self.dynamodb_resource = get_resource("dynamodb", region_name=region_name, session=self.session)
         self.table = self.dynamodb_resource.Table(self.table_name)
-        self._validate_table()
+        if validation == 'eager':
+            metadata_cache.invalidate(self._description_cache_key)
+        if validation != 'lazy':
+            self._validate_table()
         logger.info(f"Configured helper for DynamoDB table: {table_name}")
 
+    @property
+    def _description_cache_key(self) -> tuple:
+        # Access is checked per principal: other credentials may not reach the table
+        return ('dynamodb:describe_table', credential_identity(self.session), self.region_name, self.table_name)
+
     def _validate_table(self) -> None:
         """Validate that the table exists and is accessible"""
+        self.get_table_description()
+
+    def get_table_description(self) -> Dict[str, Any]:
+        """
+        Get the describe_table output of the table, cached process-wide.
+
+        :return: Table description (KeySchema, AttributeDefinitions, GlobalSecondaryIndexes, ...).
+        """
+        def describe() -> Dict[str, Any]:
+            return self.dynamodb_client.describe_table(TableName=self.table_name)['Table']
+
         try:
-            self.dynamodb_client.describe_table(TableName=self.table_name)
+            return metadata_cache.get_or_load(self._description_cache_key, describe, self.validation_ttl)
         except ClientError as error:
             logger.error(f"Table {self.table_name} does not exist or is inaccessible")
             raise error
 
+    @property
+    def key_schema(self) -> List[Dict[str, str]]:
+        """Key schema of the table, from the cached description."""
+        return self.get_table_description()['KeySchema']
+
+    @property
+    def global_secondary_indexes(self) -> List[Dict[str, Any]]:
+        """Global secondary indexes of the table, from the cached description."""
+        return self.get_table_description().get('GlobalSecondaryIndexes', [])
+
     def get_table(self):
         """
         Get the DynamoDB table object.
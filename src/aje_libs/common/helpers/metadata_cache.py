@@ -0,0 +1,53 @@
+# src/aje_libs/common/helpers/metadata_cache.py
+import threading
+import time
+from typing import Optional, Dict, Any, Callable, Hashable, Tuple
+
+from ..logger import custom_logger
+
+logger = custom_logger(__name__)
+
+# Seconds a successful validation (head_bucket, describe_table) is reused
+DEFAULT_VALIDATION_TTL = 300.0
+
+VALIDATION_MODES = ('eager', 'cached', 'lazy')
+
+_lock = threading.Lock()
+_entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+
+def get_or_load(key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = DEFAULT_VALIDATION_TTL) -> Any:
+    """
+    Return a process-wide cached value, calling loader when missing or expired.
+
+    Only successful loads are cached; exceptions propagate and are retried on
+    the next call.
+
+    :param key: Cache key (e.g. ('dynamodb:describe_table', region, table)).
+    :param loader: Function producing the value.
+    :param ttl: Seconds the value stays valid (None to keep it for the process lifetime).
+    :return: Cached or freshly loaded value.
+    """
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(key)
+    if entry is not None and (ttl is None or now - entry[0] < ttl):
+        return entry[1]
+
+    value = loader()
+    with _lock:
+        _entries[key] = (time.monotonic(), value)
+    return value
+
+
+def invalidate(key: Optional[Hashable] = None) -> None:
+    """
+    Drop a cached value, or every value when key is None.
+
+    :param key: Cache key to drop (optional).
+    """
+    with _lock:
+        if key is None:
+            _entries.clear()
+        else:
+            _entries.pop(key, None)
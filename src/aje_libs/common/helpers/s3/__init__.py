@@ -0,0 +1,45 @@
+# src/aje_libs/common/helpers/s3/__init__.py
+from .transfer import TransferProgress, build_transfer_config
+from .parallel_listing import ParallelLister
+from .listing_index import ListingIndex
+from .filters import ObjectFilterPlan
+from .multipart_copy import multipart_copy
+from .range_reader import S3RangeReader
+from .ranged_download import RangedDownloadStream
+from .stream_writer import S3StreamWriter
+from .checksums import compute_etag, etag_matches, compute_checksums, verify_file
+from .object_cache import ObjectCache
+from .presign import PresignCache, presign_batch
+from .inventory import S3Inventory
+from .metrics import MetricsCollector, InMemoryMetrics, EMFMetrics, instrument_client
+from .codecs import CompressionPolicy, benchmark_codecs
+from .dataset import ParquetDataset
+from .archive import S3Archive
+
+__all__ = [
+    'TransferProgress',
+    'build_transfer_config',
+    'ParallelLister',
+    'ListingIndex',
+    'ObjectFilterPlan',
+    'multipart_copy',
+    'S3RangeReader',
+    'RangedDownloadStream',
+    'S3StreamWriter',
+    'compute_etag',
+    'etag_matches',
+    'compute_checksums',
+    'verify_file',
+    'ObjectCache',
+    'PresignCache',
+    'presign_batch',
+    'S3Inventory',
+    'MetricsCollector',
+    'InMemoryMetrics',
+    'EMFMetrics',
+    'instrument_client',
+    'CompressionPolicy',
+    'benchmark_codecs',
+    'ParquetDataset',
+    'S3Archive',
+]
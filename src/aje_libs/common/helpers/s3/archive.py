@@ -0,0 +1,388 @@
+# src/aje_libs/common/helpers/s3/archive.py
+import bz2
+import io
+import struct
+import tarfile
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Any, Tuple
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .codecs import open_decompressed
+from .range_reader import S3RangeReader
+from .record_reader import open_binary_stream
+from .transfer import MB
+
+logger = custom_logger(__name__)
+
+ARCHIVE_FORMATS = ('zip', 'tar')
+
+# Key suffix -> (archive format, compression of the tar stream in tarfile's names)
+_ARCHIVE_EXTENSIONS = {
+    '.zip': ('zip', None),
+    '.jar': ('zip', None),
+    '.tar': ('tar', None),
+    '.tar.gz': ('tar', 'gz'),
+    '.tgz': ('tar', 'gz'),
+    '.tar.bz2': ('tar', 'bz2'),
+    '.tbz2': ('tar', 'bz2'),
+    '.tar.xz': ('tar', 'xz'),
+    '.txz': ('tar', 'xz'),
+    '.tar.zst': ('tar', 'zstd'),
+    '.tar.lz4': ('tar', 'lz4'),
+}
+
+# Bytes requested past the central directory's view of a local header, so the
+# header and the member data usually arrive in a single Range GET
+_LOCAL_HEADER_SLACK = 1024
+
+# Range GET granularity while reading the end of a zip archive
+_DIRECTORY_BLOCK_SIZE = 256 * 1024
+
+_READ_SIZE = 1 * MB
+
+# Positions of the name and extra field lengths in an unpacked zip local file header
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+
+_DIRECTORY_CACHE_SIZE = 32
+_directory_lock = threading.Lock()
+_directories: "OrderedDict[Tuple[str, str, str], List[zipfile.ZipInfo]]" = OrderedDict()
+
+
+def detect_archive(s3_client, bucket_name: str, object_key: str) -> Tuple[str, Optional[str]]:
+    """
+    Detect the archive format from the key suffix, or from the magic bytes.
+
+    :param s3_client: boto3 S3 client.
+    :param bucket_name: Name of the S3 bucket.
+    :param object_key: Key name in S3.
+    :return: Tuple of format ('zip' or 'tar') and tar stream compression (or None).
+    """
+    key = object_key.lower()
+    for suffix, detected in sorted(_ARCHIVE_EXTENSIONS.items(), key=lambda item: -len(item[0])):
+        if key.endswith(suffix):
+            return detected
+    head = s3_client.get_object(Bucket=bucket_name, Key=object_key, Range='bytes=0-3')['Body'].read()
+    if head[:2] == b'PK':
+        return 'zip', None
+    return 'tar', '*'
+
+
+class S3Archive:
+    """Member access to a zip or tar archive in S3 without downloading all of it."""
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        object_key: str,
+        archive_format: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the archive.
+
+        Zip archives are random access: the central directory is read from the
+        end of the object and each member is fetched with a single Range GET
+        and decompressed while it streams. Tar archives have no index, so they
+        are streamed from the start and reading stops at the requested member.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket_name: Name of the S3 bucket.
+        :param object_key: Key name in S3.
+        :param archive_format: 'zip' or 'tar' (detected from the key or content if not given).
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        if archive_format is None:
+            archive_format, self.tar_compression = detect_archive(s3_client, bucket_name, object_key)
+        elif archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        else:
+            self.tar_compression = '*'
+        self.archive_format = archive_format
+        self._size: Optional[int] = None
+        self._etag: Optional[str] = None
+
+    def list_members(self) -> List[Dict[str, Any]]:
+        """
+        List the members of the archive.
+
+        :return: List of dicts with name, size, compressed_size (zip only), last_modified and is_dir.
+        """
+        if self.archive_format == 'zip':
+            return [_zip_member(info) for info in self._zip_directory()]
+        with self._open_tar() as archive:
+            return [_tar_member(info) for info in archive]
+
+    def open_member(self, name: str) -> io.BufferedIOBase:
+        """
+        Open a member as a stream of its decompressed bytes.
+
+        :param name: Member name as listed.
+        :return: Binary file-like object (close it to release the connection).
+        """
+        if self.archive_format == 'zip':
+            info = next((info for info in self._zip_directory() if info.filename == name), None)
+            if info is None:
+                raise KeyError(f"Member not found in archive: {name}")
+            return self._open_zip_member(info)
+
+        archive = self._open_tar()
+        try:
+            for info in archive:
+                if info.name == name:
+                    if not info.isfile():
+                        raise KeyError(f"Archive member is not a regular file: {name}")
+                    # Stop here: the rest of the archive is never downloaded
+                    return io.BufferedReader(_ClosingStream(archive.extractfile(info), archive), _READ_SIZE)
+            raise KeyError(f"Member not found in archive: {name}")
+        except BaseException:
+            archive.close()
+            raise
+
+    def read_member(self, name: str) -> bytes:
+        """
+        Read the whole decompressed content of a member.
+
+        :param name: Member name as listed.
+        :return: Member content.
+        """
+        with self.open_member(name) as stream:
+            return stream.read()
+
+    def _head(self) -> None:
+        if self._size is None:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=self.object_key)
+            self._size = response['ContentLength']
+            self._etag = response.get('ETag')
+
+    def _zip_directory(self) -> List[zipfile.ZipInfo]:
+        """Central directory of the zip, cached per object version"""
+        self._head()
+        cache_key = (self.bucket_name, self.object_key, self._etag)
+        with _directory_lock:
+            infos = _directories.get(cache_key)
+            if infos is not None:
+                _directories.move_to_end(cache_key)
+                return infos
+
+        reader = S3RangeReader(
+            self.s3_client,
+            self.bucket_name,
+            self.object_key,
+            size=self._size,
+            etag=self._etag,
+            block_size=_DIRECTORY_BLOCK_SIZE,
+            readahead_blocks=0,
+        )
+        with reader, zipfile.ZipFile(reader) as archive:
+            infos = archive.infolist()
+        logger.debug(
+            f"Read zip directory of s3://{self.bucket_name}/{self.object_key} - "
+            f"Members: {len(infos)} | Requests: {reader.requests} | Bytes: {reader.bytes_fetched}"
+        )
+
+        with _directory_lock:
+            _directories[cache_key] = infos
+            while len(_directories) > _DIRECTORY_CACHE_SIZE:
+                _directories.popitem(last=False)
+        return infos
+
+    def _open_zip_member(self, info: zipfile.ZipInfo) -> io.BufferedIOBase:
+        """Fetch the local header and data of a member with one Range GET and decompress it"""
+        if info.flag_bits & 0x1:
+            raise ValueError(f"Encrypted zip members are not supported: {info.filename}")
+        if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2):
+            # Other methods (e.g. LZMA) go through zipfile over ranged reads
+            reader = S3RangeReader(
+                self.s3_client, self.bucket_name, self.object_key, size=self._size, etag=self._etag
+            )
+            archive = zipfile.ZipFile(reader)
+            return io.BufferedReader(_ClosingStream(archive.open(info), archive, reader), _READ_SIZE)
+
+        start = info.header_offset
+        name_length = len(info.orig_filename.encode('utf-8'))
+        end = min(
+            start + zipfile.sizeFileHeader + name_length + len(info.extra) + _LOCAL_HEADER_SLACK + info.compress_size,
+            self._size
+        ) - 1
+        body = self._get_range(start, end)
+        try:
+            header = _read_exactly(body, zipfile.sizeFileHeader)
+            fields = struct.unpack(zipfile.structFileHeader, header)
+            if fields[0] != zipfile.stringFileHeader:
+                raise zipfile.BadZipFile(f"Bad local file header for member: {info.filename}")
+            data_start = (
+                start + zipfile.sizeFileHeader
+                + fields[_FH_FILENAME_LENGTH] + fields[_FH_EXTRA_FIELD_LENGTH]
+            )
+            if data_start + info.compress_size - 1 > end:
+                # Local extra field larger than the slack, fetch the data on its own
+                body.close()
+                body = self._get_range(data_start, data_start + info.compress_size - 1)
+            else:
+                _read_exactly(body, data_start - start - zipfile.sizeFileHeader)
+        except BaseException:
+            body.close()
+            raise
+        return io.BufferedReader(_ZipMemberStream(body, info), _READ_SIZE)
+
+    def _get_range(self, start: int, end: int):
+        kwargs = {'Bucket': self.bucket_name, 'Key': self.object_key, 'Range': f"bytes={start}-{end}"}
+        if self._etag:
+            kwargs['IfMatch'] = self._etag
+        try:
+            return self.s3_client.get_object(**kwargs)['Body']
+        except ClientError as error:
+            logger.error(
+                f"Failed to read range - Bucket: {self.bucket_name} | Key: {self.object_key} | "
+                f"Range: {start}-{end} | Error: {error.response['Error']['Code']}"
+            )
+            raise error
+
+    def _open_tar(self) -> "_StreamTarFile":
+        """Open the archive as a forward-only tar stream"""
+        body = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.object_key)['Body']
+        stream = open_binary_stream(body)
+        if self.tar_compression in ('zstd', 'lz4'):
+            archive = tarfile.open(fileobj=open_decompressed(stream, self.tar_compression), mode='r|')
+        else:
+            mode = 'r|*' if self.tar_compression in (None, '*') else f"r|{self.tar_compression}"
+            archive = tarfile.open(fileobj=stream, mode=mode)
+        return _StreamTarFile(archive, body)
+
+
+class _ZipMemberStream(io.RawIOBase):
+    """Decompresses member data from a ranged GET body, checking size and CRC at the end"""
+
+    def __init__(self, body, info: zipfile.ZipInfo) -> None:
+        super().__init__()
+        self._body = body
+        self._info = info
+        self._remaining = info.compress_size
+        self._needs_flush = info.compress_type == zipfile.ZIP_DEFLATED
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            self._decompressor = zlib.decompressobj(-15)
+        elif info.compress_type == zipfile.ZIP_BZIP2:
+            self._decompressor = bz2.BZ2Decompressor()
+        else:
+            self._decompressor = None
+        self._pending = b''
+        self._crc = 0
+        self._size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and self._remaining > 0:
+            chunk = self._body.read(min(self._remaining, _READ_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for member: {self._info.filename}")
+            self._remaining -= len(chunk)
+            self._pending = self._decompressor.decompress(chunk) if self._decompressor else chunk
+            if self._remaining == 0 and self._needs_flush:
+                self._pending += self._decompressor.flush()
+            self._crc = zlib.crc32(self._pending, self._crc)
+            self._size += len(self._pending)
+            if self._remaining == 0:
+                self._verify()
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def _verify(self) -> None:
+        if self._size != self._info.file_size or self._crc != self._info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 or size for member: {self._info.filename}")
+
+    def close(self) -> None:
+        if not self.closed:
+            self._body.close()
+        super().close()
+
+
+class _ClosingStream(io.RawIOBase):
+    """Readable wrapper that also closes the archive and readers the stream depends on"""
+
+    def __init__(self, stream, *resources) -> None:
+        super().__init__()
+        self._stream = stream
+        self._resources = resources
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.close()
+            for resource in self._resources:
+                resource.close()
+        super().close()
+
+
+class _StreamTarFile:
+    """Tar stream that also closes the response body, so stopping early drops the download"""
+
+    def __init__(self, archive: tarfile.TarFile, body) -> None:
+        self._archive = archive
+        self._body = body
+
+    def __iter__(self):
+        return iter(self._archive)
+
+    def extractfile(self, info: tarfile.TarInfo):
+        return self._archive.extractfile(info)
+
+    def close(self) -> None:
+        self._archive.close()
+        self._body.close()
+
+    def __enter__(self) -> "_StreamTarFile":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _read_exactly(body, size: int) -> bytes:
+    data = b''
+    while len(data) < size:
+        chunk = body.read(size - len(data))
+        if not chunk:
+            raise zipfile.BadZipFile("Unexpected end of archive data")
+        data += chunk
+    return data
+
+
+def _zip_member(info: zipfile.ZipInfo) -> Dict[str, Any]:
+    return {
+        'name': info.filename,
+        'size': info.file_size,
+        'compressed_size': info.compress_size,
+        'last_modified': datetime(*info.date_time),
+        'is_dir': info.is_dir(),
+    }
+
+
+def _tar_member(info: tarfile.TarInfo) -> Dict[str, Any]:
+    return {
+        'name': info.name,
+        'size': info.size,
+        'compressed_size': None,
+        'last_modified': datetime.fromtimestamp(info.mtime, tz=timezone.utc),
+        'is_dir': info.isdir(),
+    }
@@ -0,0 +1,196 @@
+# src/aje_libs/common/helpers/s3/audit.py
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from typing import Optional, Dict, List, Any, Iterable, Tuple
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .checksums import verify_file, _split_parts
+from .concurrency import bounded_map, chunked
+from .sync import iter_local_files
+
+logger = custom_logger(__name__)
+
+# 'etag' compares listed ETags (no extra requests), 'sha256'/'crc32c' compare
+# the object checksums, 'auto' uses the checksum an object was uploaded with
+# and falls back to its ETag
+AUDIT_ALGORITHMS = ('auto', 'etag', 'sha256', 'crc32c')
+
+# Listing ChecksumAlgorithm values preferred by 'auto', strongest first
+_AUTO_CHECKSUMS = (('SHA256', 'sha256'), ('CRC32C', 'crc32c'))
+
+# Files verified per task sent to the hashing pool, so 100k small files do not
+# cost 100k round trips between processes
+_BATCH_SIZE = 32
+
+
+def audit(
+    s3_helper,
+    local_dir: str,
+    prefix: str,
+    algorithm: str = 'auto',
+    max_workers: Optional[int] = None,
+    max_fetch_workers: int = 32,
+    use_processes: bool = True,
+) -> Dict[str, Any]:
+    """
+    Verify that the files of a local directory match the objects under a prefix.
+
+    Sizes are compared first. Files of equal size are hashed on a process
+    pool, each in a single read computing every digest it needs, while object
+    checksums are fetched concurrently on a thread pool.
+
+    :param s3_helper: S3Helper of the bucket.
+    :param local_dir: Local directory holding the source files.
+    :param prefix: S3 prefix (a trailing '/' is added if missing).
+    :param algorithm: 'auto', 'etag', 'sha256' or 'crc32c' (see AUDIT_ALGORITHMS).
+    :param max_workers: Hashing processes (defaults to the CPU count).
+    :param max_fetch_workers: Concurrent head_object requests fetching checksums.
+    :param use_processes: Hash on processes; threads are used when False or when
+        processes are unavailable (e.g. AWS Lambda, which has no /dev/shm).
+    :return: Dict with matched, mismatched, missing_remote, missing_local,
+        no_checksum and failed lists plus a summary.
+    """
+    if algorithm not in AUDIT_ALGORITHMS:
+        raise ValueError(f"Unsupported audit algorithm: {algorithm}")
+    if prefix and not prefix.endswith('/'):
+        prefix += '/'
+
+    remote = {
+        obj['Key'][len(prefix):]: obj
+        for obj in s3_helper.iter_objects(prefix=prefix)
+        if not obj['Key'].endswith('/')
+    }
+    local = dict(iter_local_files(local_dir)) if os.path.isdir(local_dir) else {}
+    part_sizes = (s3_helper.transfer_config.multipart_chunksize,)
+
+    result: Dict[str, Any] = {
+        'matched': [],
+        'mismatched': [],
+        'missing_remote': sorted(name for name in local if name not in remote),
+        'missing_local': sorted(name for name in remote if name not in local),
+        'no_checksum': [],
+        'failed': [],
+    }
+
+    by_etag, by_checksum = [], []
+    for name in sorted(name for name in local if name in remote):
+        obj = remote[name]
+        try:
+            local_size = os.path.getsize(local[name])
+        except OSError as error:
+            result['failed'].append({'name': name, 'error': str(error)})
+            continue
+        if local_size != obj['Size']:
+            result['mismatched'].append(
+                {'name': name, 'check': 'size', 'expected': obj['Size'], 'actual': local_size}
+            )
+            continue
+        checksum = _checksum_to_fetch(obj, algorithm)
+        if checksum:
+            by_checksum.append((name, checksum))
+        elif obj.get('ETag'):
+            by_etag.append((name, {'md5': obj['ETag']}))
+        else:
+            result['no_checksum'].append(name)
+
+    def fetch(item: Tuple[str, str]) -> Tuple[str, Optional[Dict[str, str]], Optional[str]]:
+        name, checksum = item
+        try:
+            response = s3_helper.s3_client.head_object(
+                Bucket=s3_helper.bucket_name, Key=prefix + name, ChecksumMode='ENABLED'
+            )
+        except ClientError as error:
+            return name, None, error.response['Error']['Code']
+        value = response.get(f"Checksum{checksum.upper()}")
+        return name, ({checksum: value} if value else None), None
+
+    executor = _hashing_pool(max_workers, use_processes)
+    futures: List[Tuple[Future, List[Tuple[str, Dict[str, str]]]]] = []
+
+    def submit(batch: List[Tuple[str, Dict[str, str]]]) -> None:
+        tasks = [
+            (local[name], expected, remote[name]['Size'], part_sizes, _split_parts(remote[name].get('ETag') or '')[1])
+            for name, expected in batch
+        ]
+        futures.append((executor.submit(_verify_batch, tasks), batch))
+
+    try:
+        for batch in chunked(by_etag, _BATCH_SIZE):
+            submit(batch)
+        pending = []
+        for name, expected, error in bounded_map(fetch, by_checksum, max_workers=max_fetch_workers):
+            if error:
+                result['failed'].append({'name': name, 'error': error})
+            elif expected is None:
+                result['no_checksum'].append(name)
+            else:
+                pending.append((name, expected))
+                if len(pending) == _BATCH_SIZE:
+                    submit(pending)
+                    pending = []
+        if pending:
+            submit(pending)
+
+        for future, batch in futures:
+            for (name, expected), outcome in zip(batch, future.result()):
+                if 'error' in outcome:
+                    result['failed'].append({'name': name, 'error': outcome['error']})
+                elif outcome['matched']:
+                    result['matched'].append(name)
+                else:
+                    for check, matched in outcome['results'].items():
+                        if not matched:
+                            result['mismatched'].append(
+                                {'name': name, 'check': check, 'expected': expected[check]}
+                            )
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    result['summary'] = {
+        name: len(value) for name, value in result.items() if isinstance(value, list)
+    }
+    result['summary']['ok'] = not any(
+        result[name] for name in ('mismatched', 'missing_remote', 'missing_local', 'failed')
+    )
+    log = logger.info if result['summary']['ok'] else logger.warning
+    log(f"Audit of {local_dir} against s3://{s3_helper.bucket_name}/{prefix} - {result['summary']}")
+    return result
+
+
+def _checksum_to_fetch(obj: Dict[str, Any], algorithm: str) -> Optional[str]:
+    """Checksum attribute an object is verified with, None to use its listed ETag"""
+    if algorithm in ('sha256', 'crc32c'):
+        return algorithm
+    if algorithm == 'auto':
+        uploaded_with = obj.get('ChecksumAlgorithm') or []
+        for listed, checksum in _AUTO_CHECKSUMS:
+            if listed in uploaded_with:
+                return checksum
+    return None
+
+
+_VerifyTask = Tuple[str, Dict[str, str], int, Tuple[int, ...], Optional[int]]
+
+
+def _verify_batch(tasks: Iterable[_VerifyTask]) -> List[Dict[str, Any]]:
+    """Verify a batch of files in a pool worker, capturing per-file errors"""
+    outcomes = []
+    for file_path, expected, size, part_sizes, parts in tasks:
+        try:
+            outcomes.append(verify_file(file_path, expected, size, part_sizes, parts))
+        except (OSError, ImportError) as error:
+            outcomes.append({'error': str(error)})
+    return outcomes
+
+
+def _hashing_pool(max_workers: Optional[int], use_processes: bool):
+    """Process pool for hashing, or a thread pool when processes are unavailable"""
+    max_workers = max_workers or os.cpu_count() or 1
+    if use_processes:
+        try:
+            return ProcessPoolExecutor(max_workers=max_workers)
+        except (OSError, NotImplementedError) as error:
+            logger.warning(f"Process pool unavailable, hashing on threads: {error}")
+    return ThreadPoolExecutor(max_workers=max_workers)
@@ -0,0 +1,256 @@
+# src/aje_libs/common/helpers/s3/checksums.py
+import base64
+import hashlib
+import os
+from typing import Optional, Dict, List, Any, Iterable, Tuple
+
+from .transfer import MB, DEFAULT_PART_SIZE
+
+_READ_SIZE = 1 * MB
+
+# Part sizes used by common clients (boto3/CLI default, this library's default,
+# the S3 minimum and console/SDK variants), tried when verifying multipart ETags
+COMMON_PART_SIZES = (8 * MB, DEFAULT_PART_SIZE, 5 * MB, 15 * MB, 64 * MB, 100 * MB, 128 * MB)
+
+# Algorithms compute_checksums understands: 'md5' gives ETags, the others
+# the base64 values of the ChecksumSHA256 / ChecksumCRC32C object attributes
+CHECKSUM_ALGORITHMS = ('md5', 'sha256', 'crc32c')
+
+
+def compute_etag(file_path: str, part_size: Optional[int] = None) -> str:
+    """
+    Compute the S3 ETag of a local file.
+
+    Without part_size (or for files smaller than one part) this is the plain
+    MD5, the ETag of a single PUT. Files of at least part_size bytes are
+    uploaded in parts and get the multipart form: the MD5 of the concatenated
+    part MD5s followed by '-<parts>' (including '-1' for a single part).
+
+    :param file_path: Local path to the file.
+    :param part_size: Multipart part size in bytes (optional).
+    :return: ETag string without quotes.
+    """
+    multipart = bool(part_size) and os.path.getsize(file_path) >= part_size
+    digests = compute_checksums(file_path, ('md5',), (part_size,) if multipart else ())['md5']
+    return digests[part_size] if multipart else digests[None]
+
+
+def candidate_part_sizes(size: int, parts: int, extra: Iterable[int] = ()) -> List[int]:
+    """
+    List part sizes that split size bytes into exactly the given number of parts.
+
+    :param size: Object size in bytes.
+    :param parts: Number of parts in the multipart ETag.
+    :param extra: Additional part sizes to try first.
+    :return: Candidate part sizes, most likely first.
+    """
+    candidates = []
+    for part_size in list(extra) + list(COMMON_PART_SIZES):
+        if part_size and -(-size // part_size) == parts and part_size not in candidates:
+            candidates.append(part_size)
+    # Clients that pick the part size from the object size usually round to whole MB
+    derived = -(-size // parts)
+    rounded = -(-derived // MB) * MB
+    for part_size in (rounded, derived):
+        if part_size and -(-size // part_size) == parts and part_size not in candidates:
+            candidates.append(part_size)
+    return candidates
+
+
+def etag_matches(
+    file_path: str,
+    etag: str,
+    size: Optional[int] = None,
+    part_sizes: Iterable[int] = (),
+) -> bool:
+    """
+    Check whether a local file matches an S3 ETag, including multipart ETags.
+
+    ETags of SSE-KMS or SSE-C objects are not content digests and never match.
+
+    :param file_path: Local path to the file.
+    :param etag: ETag from a listing or head_object (quotes are ignored).
+    :param size: Object size in bytes (needed for multipart ETags).
+    :param part_sizes: Part sizes to try before the common ones.
+    :return: True if the computed ETag equals the given one.
+    """
+    return verify_file(file_path, {'md5': etag}, size, part_sizes)['matched']
+
+
+def compute_checksums(
+    file_path: str,
+    algorithms: Iterable[str] = ('md5',),
+    part_sizes: Iterable[int] = (),
+) -> Dict[str, Dict[Optional[int], str]]:
+    """
+    Compute several S3 digests of a local file in a single read.
+
+    For each algorithm the full-object value is stored under None and the
+    multipart (composite) value for each part size under that part size:
+    '<md5 of part md5s>-<parts>' for md5, '<base64 digest of part digests>-<parts>'
+    for sha256 and crc32c, as S3 reports them.
+
+    :param file_path: Local path to the file.
+    :param algorithms: Algorithms to compute ('md5', 'sha256', 'crc32c').
+    :param part_sizes: Part sizes to compute multipart values for.
+    :return: Dict of algorithm -> {part size or None: value}.
+    """
+    algorithms = list(algorithms)
+    for algorithm in algorithms:
+        if algorithm not in CHECKSUM_ALGORITHMS:
+            raise ValueError(f"Unsupported checksum algorithm: {algorithm}")
+    part_sizes = sorted(set(part_size for part_size in part_sizes if part_size))
+
+    whole = {algorithm: _new_hasher(algorithm) for algorithm in algorithms}
+    parts = {
+        (algorithm, part_size): _PartDigests(algorithm, part_size)
+        for algorithm in algorithms for part_size in part_sizes
+    }
+    with open(file_path, 'rb') as handle:
+        while True:
+            chunk = handle.read(_READ_SIZE)
+            if not chunk:
+                break
+            for hasher in whole.values():
+                hasher.update(chunk)
+            for tracker in parts.values():
+                tracker.update(chunk)
+
+    results: Dict[str, Dict[Optional[int], str]] = {}
+    for algorithm, hasher in whole.items():
+        results[algorithm] = {None: _encode(algorithm, hasher.digest())}
+    for (algorithm, part_size), tracker in parts.items():
+        digests = tracker.finish()
+        combined = _new_hasher(algorithm)
+        combined.update(b''.join(digests))
+        results[algorithm][part_size] = f"{_encode(algorithm, combined.digest())}-{len(digests)}"
+    return results
+
+
+def verify_file(
+    file_path: str,
+    expected: Dict[str, str],
+    size: Optional[int] = None,
+    part_sizes: Iterable[int] = (),
+    parts: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Compare a local file against digests reported by S3, reading it once.
+
+    Multipart values are checked against every plausible part size (see
+    candidate_part_sizes). ETags of SSE-KMS or SSE-C objects are not content
+    digests and never match.
+
+    :param file_path: Local path to the file.
+    :param expected: Algorithm -> value from S3 ('md5' for the ETag, 'sha256', 'crc32c').
+    :param size: Object size in bytes (the local size is used if not given).
+    :param part_sizes: Part sizes to try before the common ones.
+    :param parts: Part count of a multipart object, so checksums reported without
+        the '-<parts>' suffix are also checked as composite values (optional).
+    :return: Dict with matched (bool) and per-algorithm results (bool).
+    """
+    if size is None:
+        size = os.path.getsize(file_path)
+    wanted_sizes: Dict[str, List[Optional[int]]] = {}
+    for algorithm, value in expected.items():
+        value, value_parts = _split_parts(value)
+        if value_parts:
+            wanted_sizes[algorithm] = candidate_part_sizes(size, value_parts, part_sizes) or [None]
+        elif parts and parts > 1 and algorithm != 'md5':
+            wanted_sizes[algorithm] = [None] + candidate_part_sizes(size, parts, part_sizes)
+        else:
+            wanted_sizes[algorithm] = [None]
+
+    computed = compute_checksums(
+        file_path,
+        list(expected),
+        {part_size for sizes in wanted_sizes.values() for part_size in sizes if part_size}
+    )
+    results = {}
+    for algorithm, value in expected.items():
+        value, _ = _split_parts(value)
+        results[algorithm] = any(
+            _split_parts(computed[algorithm][part_size])[0] == value
+            for part_size in wanted_sizes[algorithm] if part_size in computed[algorithm]
+        )
+    return {'matched': all(results.values()), 'results': results}
+
+
+def _split_parts(value: str) -> Tuple[str, Optional[int]]:
+    """Split an ETag or checksum into its digest and multipart part count"""
+    value = value.strip('"')
+    digest, separator, suffix = value.rpartition('-')
+    if separator and suffix.isdigit():
+        return digest, int(suffix)
+    return value, None
+
+
+class _PartDigests:
+    """Digests of consecutive fixed-size parts of a stream"""
+
+    def __init__(self, algorithm: str, part_size: int) -> None:
+        self.algorithm = algorithm
+        self.part_size = part_size
+        self.digests: List[bytes] = []
+        self._hasher = _new_hasher(algorithm)
+        self._filled = 0
+
+    def update(self, chunk: bytes) -> None:
+        view = memoryview(chunk)
+        while view:
+            take = min(len(view), self.part_size - self._filled)
+            self._hasher.update(view[:take])
+            self._filled += take
+            view = view[take:]
+            if self._filled == self.part_size:
+                self.digests.append(self._hasher.digest())
+                self._hasher = _new_hasher(self.algorithm)
+                self._filled = 0
+
+    def finish(self) -> List[bytes]:
+        if self._filled or not self.digests:
+            self.digests.append(self._hasher.digest())
+            self._filled = 0
+        return self.digests
+
+
+class _Crc32c:
+    """hashlib-style CRC32C with a big-endian 4-byte digest, as used by S3"""
+
+    def __init__(self) -> None:
+        self._update = _crc32c_function()
+        self._value = 0
+
+    def update(self, data) -> None:
+        self._value = self._update(bytes(data), self._value)
+
+    def digest(self) -> bytes:
+        return self._value.to_bytes(4, 'big')
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == 'md5':
+        return hashlib.md5()
+    if algorithm == 'sha256':
+        return hashlib.sha256()
+    return _Crc32c()
+
+
+def _encode(algorithm: str, digest: bytes) -> str:
+    if algorithm == 'md5':
+        return digest.hex()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def _crc32c_function():
+    """CRC32C update function (data, previous) from awscrt (boto3[crt]) or the crc32c package"""
+    try:
+        from awscrt.checksums import crc32c
+        return crc32c
+    except ImportError:
+        pass
+    try:
+        from crc32c import crc32c
+        return crc32c
+    except ImportError:
+        raise ImportError("CRC32C checksums require the 'awscrt' or 'crc32c' package")
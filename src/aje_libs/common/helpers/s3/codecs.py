@@ -0,0 +1,245 @@
+# src/aje_libs/common/helpers/s3/codecs.py
+import fnmatch
+import gzip
+import importlib
+import io
+import time
+import zlib
+from typing import Optional, Dict, List, Any, Iterable
+
+from .transfer import MB
+
+# Codec name -> Content-Encoding value written on the object
+CONTENT_ENCODINGS = {'gzip': 'gzip', 'zstd': 'zstd', 'lz4': 'lz4'}
+
+# User metadata key recording the codec an object was compressed with by this library
+CODEC_METADATA_KEY = 'aje-codec'
+
+# User metadata key recording the uncompressed size when it is known at upload time
+ORIGINAL_SIZE_METADATA_KEY = 'aje-original-size'
+
+_READ_SIZE = 1 * MB
+
+
+def make_compressor(codec: str, level: Optional[int] = None):
+    """
+    Create an incremental compressor with compress()/flush().
+
+    :param codec: 'gzip', 'zstd' or 'lz4'.
+    :param level: Compression level (codec default if not given).
+    :return: Compressor object.
+    """
+    if codec == 'gzip':
+        return zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+    if codec == 'zstd':
+        zstandard = _import_codec('zstandard', codec)
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    if codec == 'lz4':
+        lz4_frame = _import_codec('lz4.frame', codec)
+        return _LZ4Compressor(lz4_frame, 0 if level is None else level)
+    raise ValueError(f"Unsupported compression: {codec}")
+
+
+def open_decompressed(raw: io.BufferedIOBase, codec: str) -> io.BufferedIOBase:
+    """
+    Wrap a binary stream in a streaming decompressor.
+
+    :param raw: Binary stream of compressed bytes.
+    :param codec: 'gzip', 'zstd' or 'lz4'.
+    :return: Binary file-like object yielding decompressed bytes.
+    """
+    if codec == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+    if codec == 'zstd':
+        zstandard = _import_codec('zstandard', codec)
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True),
+            buffer_size=_READ_SIZE
+        )
+    if codec == 'lz4':
+        lz4_frame = _import_codec('lz4.frame', codec)
+        return lz4_frame.LZ4FrameFile(raw, mode='rb')
+    raise ValueError(f"Unsupported compression: {codec}")
+
+
+def codec_from_encoding(content_encoding: Optional[str]) -> Optional[str]:
+    """
+    Map a Content-Encoding header to a codec name.
+
+    :param content_encoding: Content-Encoding of the object (optional).
+    :return: Codec name or None if the encoding is not a supported codec.
+    """
+    if not content_encoding:
+        return None
+    encoding = content_encoding.split(',')[-1].strip().lower()
+    return encoding if encoding in CONTENT_ENCODINGS else None
+
+
+def compress_bytes(data: bytes, codec: str, level: Optional[int] = None) -> bytes:
+    compressor = make_compressor(codec, level)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompress_bytes(data: bytes, codec: str) -> bytes:
+    with open_decompressed(io.BytesIO(data), codec) as stream:
+        return stream.read()
+
+
+class CompressingReader(io.RawIOBase):
+    """Readable stream yielding the compressed form of another stream, for streaming uploads."""
+
+    def __init__(self, source, codec: str, level: Optional[int] = None) -> None:
+        super().__init__()
+        self._source = source
+        self._compressor = make_compressor(codec, level)
+        self._pending = bytearray()
+        self._finished = False
+        self.bytes_read = 0
+        self.bytes_compressed = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while len(self._pending) < len(buffer) and not self._finished:
+            chunk = self._source.read(_READ_SIZE)
+            if chunk:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                self.bytes_read += len(chunk)
+                self._pending += self._compressor.compress(chunk)
+            else:
+                self._pending += self._compressor.flush()
+                self._finished = True
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        del self._pending[:size]
+        self.bytes_compressed += size
+        return size
+
+
+class CompressionPolicy:
+    """Chooses the codec of an upload from its key prefix or content type."""
+
+    def __init__(
+        self,
+        prefixes: Optional[Dict[str, Optional[str]]] = None,
+        content_types: Optional[Dict[str, Optional[str]]] = None,
+        default: Optional[str] = None,
+        level: Optional[int] = None,
+        min_size: int = 1024,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Prefix rules are checked first (longest prefix wins), then content type
+        rules (shell patterns such as 'text/*'), then the default. A rule mapped
+        to None disables compression for what it matches.
+
+        :param prefixes: Key prefix -> codec ('gzip', 'zstd', 'lz4' or None).
+        :param content_types: Content type pattern -> codec.
+        :param default: Codec for everything else (None to leave it raw).
+        :param level: Compression level for every codec (codec default if not given).
+        :param min_size: In-memory bodies smaller than this are stored raw.
+        """
+        self.prefixes = sorted((prefixes or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.content_types = list((content_types or {}).items())
+        self.default = default
+        self.level = level
+        self.min_size = min_size
+        for codec in [c for _, c in self.prefixes] + [c for _, c in self.content_types] + [default]:
+            if codec is not None and codec not in CONTENT_ENCODINGS:
+                raise ValueError(f"Unsupported compression: {codec}")
+
+    def codec_for(self, object_key: str, content_type: Optional[str] = None) -> Optional[str]:
+        """
+        Get the codec for an object.
+
+        :param object_key: Key name in S3.
+        :param content_type: Content type of the object (optional).
+        :return: Codec name or None to store it raw.
+        """
+        for prefix, codec in self.prefixes:
+            if object_key.startswith(prefix):
+                return codec
+        if content_type:
+            base_type = content_type.split(';')[0].strip().lower()
+            for pattern, codec in self.content_types:
+                if fnmatch.fnmatch(base_type, pattern.lower()):
+                    return codec
+        return self.default
+
+
+def benchmark_codecs(
+    sample: bytes,
+    codecs: Iterable[str] = ('gzip', 'zstd', 'lz4'),
+    levels: Optional[Dict[str, Iterable[Optional[int]]]] = None,
+    repeat: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Measure compression ratio against CPU time for each codec on a sample.
+
+    Codecs whose package is not installed are reported with an 'error' entry
+    instead of failing the whole benchmark.
+
+    :param sample: Representative payload.
+    :param codecs: Codecs to measure.
+    :param levels: Codec -> levels to measure (default level only if not given).
+    :param repeat: Runs per measurement; the fastest is kept.
+    :return: One dict per codec and level with ratio, compressed size, times and MB/s.
+    """
+    results = []
+    size = max(len(sample), 1)
+    for codec in codecs:
+        for level in (levels or {}).get(codec, [None]):
+            try:
+                compress_time = min(_timed(lambda: compress_bytes(sample, codec, level)) for _ in range(repeat))
+                compressed = compress_bytes(sample, codec, level)
+                decompress_time = min(_timed(lambda: decompress_bytes(compressed, codec)) for _ in range(repeat))
+            except ImportError as error:
+                results.append({'codec': codec, 'level': level, 'error': str(error)})
+                continue
+            results.append({
+                'codec': codec,
+                'level': level,
+                'ratio': round(size / max(len(compressed), 1), 3),
+                'compressed_bytes': len(compressed),
+                'compress_seconds': compress_time,
+                'decompress_seconds': decompress_time,
+                'compress_mb_s': round(size / MB / max(compress_time, 1e-9), 2),
+                'decompress_mb_s': round(size / MB / max(decompress_time, 1e-9), 2),
+            })
+    return results
+
+
+class _LZ4Compressor:
+    """compress()/flush() adapter over lz4.frame's incremental API"""
+
+    def __init__(self, lz4_frame, level: int) -> None:
+        self._compressor = lz4_frame.LZ4FrameCompressor(compression_level=level)
+        self._started = False
+
+    def compress(self, data: bytes) -> bytes:
+        header = b''
+        if not self._started:
+            header = self._compressor.begin()
+            self._started = True
+        return header + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        header = b'' if self._started else self._compressor.begin()
+        self._started = True
+        return header + self._compressor.flush()
+
+
+def _timed(func) -> float:
+    started_at = time.perf_counter()
+    func()
+    return time.perf_counter() - started_at
+
+
+def _import_codec(module: str, codec: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(f"{codec} compression requires the '{module.split('.')[0]}' package")
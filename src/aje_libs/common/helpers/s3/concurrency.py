@@ -0,0 +1,114 @@
+# src/aje_libs/common/helpers/s3/concurrency.py
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# S3 error codes worth retrying with backoff
+RETRYABLE_ERROR_CODES = {
+    'SlowDown',
+    'InternalError',
+    'ServiceUnavailable',
+    'RequestTimeout',
+    'RequestTimeTooSkewed',
+    'Throttling',
+    'ThrottlingException',
+    '500',
+    '503',
+}
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of at most size items without materializing it.
+
+    :param items: Iterable to split.
+    :param size: Maximum chunk size.
+    :return: Iterator of chunks.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 8,
+    max_pending: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Run func over items on a thread pool, keeping a bounded number of tasks queued.
+
+    Results are yielded in completion order. Items are pulled lazily, so the
+    input can be a generator over millions of entries.
+
+    :param func: Function applied to each item.
+    :param items: Iterable of items.
+    :param max_workers: Number of worker threads.
+    :param max_pending: Maximum submitted but unfinished tasks (defaults to 2 * max_workers).
+    :return: Iterator of results.
+    """
+    max_pending = max_pending or max_workers * 2
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        try:
+            for item in iterator:
+                pending.add(executor.submit(func, item))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def put_until_stopped(target: queue.Queue, item: Any, stop: threading.Event) -> None:
+    """
+    Put an item in a bounded queue, giving up once the consumer has stopped.
+
+    Producer threads use this so they never block forever on a full queue
+    whose consumer has gone away.
+
+    :param target: Bounded queue shared with the consumer.
+    :param item: Item to put.
+    :param stop: Event set by the consumer when it stops reading.
+    """
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def backoff_delay(attempt: int, base: float = 0.2, cap: float = 10.0) -> float:
+    """
+    Full-jitter exponential backoff delay for a retry attempt.
+
+    :param attempt: Retry attempt number, starting at 1.
+    :param base: Base delay in seconds.
+    :param cap: Maximum delay in seconds.
+    :return: Delay in seconds.
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def sleep_backoff(attempt: int) -> None:
+    """Sleep for the backoff delay of the given retry attempt."""
+    time.sleep(backoff_delay(attempt))
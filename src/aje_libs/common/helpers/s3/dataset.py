@@ -0,0 +1,604 @@
+# src/aje_libs/common/helpers/s3/dataset.py
+import importlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Dict, List, Any, Iterable, Iterator, Tuple, Union
+from urllib.parse import quote, unquote
+
+from ...logger import custom_logger
+from .range_reader import S3RangeReader
+from .stream_writer import S3StreamWriter
+from .transfer import DEFAULT_PART_SIZE
+
+logger = custom_logger(__name__)
+
+# Directory value of rows whose partition column is null (Hive/Spark convention)
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+DEFAULT_DATASET_BLOCK_SIZE = 256 * 1024
+
+PARQUET_CONTENT_TYPE = 'application/vnd.apache.parquet'
+
+# Schema-only Parquet file written next to the data (Hive/Spark convention),
+# keeping the types of the partition columns that the keys only hold as text
+COMMON_METADATA_FILE = '_common_metadata'
+
+_OPERATORS = ('=', '==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+# (column, operator, value) predicates ANDed together, or a list of such
+# conjunctions ORed together (the filters format of pyarrow.parquet)
+Filters = Union[List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]]]
+
+
+class ParquetDataset:
+    """Hive-partitioned Parquet dataset under an S3 prefix, written with multipart uploads
+    and read with partition pruning, footer statistics and Range GETs."""
+
+    def __init__(self, s3_client, bucket_name: str, prefix: str) -> None:
+        """
+        Initialize the dataset.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket_name: Name of the S3 bucket.
+        :param prefix: Prefix the dataset lives under (e.g. 'sales/').
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.prefix = prefix if not prefix or prefix.endswith('/') else f"{prefix}/"
+        self.stats: Dict[str, int] = {}
+
+    def write(
+        self,
+        data,
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = 'snappy',
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Write data as one Parquet file per partition.
+
+        Input chunks are split by partition and buffered until a full row group
+        is available. Each partition streams into its own multipart upload, and
+        row groups of different partitions are encoded and uploaded in parallel.
+        Every partition holds up to one row group plus a few parts in memory.
+        With partition columns, the full schema is stored in _common_metadata
+        so reads give the partition columns back their original types.
+
+        :param data: pandas DataFrame, pyarrow Table or RecordBatch, or an iterable of them.
+        :param partition_cols: Columns encoded in the key as col=value/ (optional).
+        :param row_group_size: Rows per row group.
+        :param compression: Parquet compression codec ('snappy', 'zstd', 'gzip', 'none', ...).
+        :param part_size: Size in bytes of each uploaded part.
+        :param max_workers: Row groups encoded and uploaded concurrently.
+        :return: Dict with the written keys, rows, partitions and bytes uploaded.
+        """
+        partition_cols = list(partition_cols or [])
+        write_id = uuid.uuid4().hex[:12]
+        writers: Dict[Tuple[Any, ...], _PartitionWriter] = {}
+        schema = None
+        partition_fields = None
+        rows = 0
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for chunk in _iter_tables(data):
+                missing = [column for column in partition_cols if column not in chunk.column_names]
+                if missing:
+                    raise ValueError(f"Partition columns not found in data: {missing}")
+                rows += chunk.num_rows
+                if partition_fields is None:
+                    partition_fields = [chunk.schema.field(column) for column in partition_cols]
+                for values, table in _split_partitions(chunk, partition_cols):
+                    table = table.drop_columns(partition_cols)
+                    if schema is None:
+                        schema = table.schema
+                    elif table.schema != schema:
+                        table = table.cast(schema)
+
+                    writer = writers.get(values)
+                    if writer is None:
+                        file_name = f"part-{write_id}-{len(writers):05d}.parquet"
+                        key = f"{self.prefix}{_partition_path(partition_cols, values)}{file_name}"
+                        writer = _PartitionWriter(
+                            self.s3_client, self.bucket_name, key, schema, compression, part_size
+                        )
+                        writers[values] = writer
+                    writer.add(table, row_group_size, executor)
+
+            closing = [executor.submit(writer.close, previous=writer.last) for writer in writers.values()]
+            for future in closing:
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for writer in writers.values():
+                writer.abort()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        if partition_cols and schema is not None:
+            self._write_common_metadata(schema, partition_fields)
+        keys = [writer.key for writer in writers.values()]
+        uploaded = sum(writer.stream.bytes_uploaded for writer in writers.values())
+        logger.info(
+            f"Dataset written: s3://{self.bucket_name}/{self.prefix} | Rows: {rows} | "
+            f"Files: {len(keys)} | Bytes: {uploaded}"
+        )
+        return {'keys': keys, 'rows': rows, 'partitions': len(keys), 'bytes': uploaded}
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        objects: Optional[Iterable[Dict[str, Any]]] = None,
+        max_workers: int = 8,
+        block_size: int = DEFAULT_DATASET_BLOCK_SIZE,
+        partition_schema: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Read the dataset into a pyarrow Table.
+
+        Files whose partition values cannot satisfy the filters are never
+        opened; in the remaining files only the footer and the column chunks of
+        row groups whose min/max statistics can satisfy them are fetched, with
+        Range GETs. The filters are then applied exactly to the rows read.
+
+        Partition column types come from partition_schema, then from the
+        _common_metadata file written with the dataset, and are otherwise
+        inferred from the keys (int64 when every value is an integer).
+
+        :param columns: Columns to return, partition columns included (all if not given).
+        :param filters: Predicates in the pyarrow.parquet format, e.g.
+            [('year', '=', 2024), ('amount', '>', 100)] or a list of such lists to OR them.
+        :param objects: Listed objects of the prefix (listed with list_objects_v2 if not given).
+        :param max_workers: Files read concurrently.
+        :param block_size: Granularity in bytes of the Range GETs.
+        :param partition_schema: Column -> pyarrow type of partition columns (optional).
+        :return: pyarrow Table.
+        """
+        pa = _import_pyarrow()
+        conjunctions = _normalize_filters(filters)
+        if objects is None:
+            objects = self._list_objects()
+
+        files = []
+        metadata_obj = None
+        for obj in objects:
+            if obj['Key'] == self.prefix + COMMON_METADATA_FILE:
+                metadata_obj = obj
+                continue
+            partition = self._parse_partition(obj['Key'])
+            if partition is not None and obj.get('Size', 1) > 0:
+                files.append((obj, partition))
+        partition_types = _infer_partition_types([partition for _, partition in files])
+        stored_types = self._stored_partition_types(metadata_obj) if partition_types and not partition_schema else {}
+        for column, column_type in list(stored_types.items()) + list((partition_schema or {}).items()):
+            if column in partition_types:
+                partition_types[column] = column_type
+        _check_partition_filters(conjunctions, partition_types)
+        files = [(obj, _typed_partition(partition, partition_types)) for obj, partition in files]
+
+        selected = [
+            (obj, partition) for obj, partition in files
+            if _may_match(conjunctions, lambda column: (column in partition, partition.get(column)))
+        ]
+        self.stats = {
+            'files': len(files),
+            'files_pruned': len(files) - len(selected),
+            'row_groups': 0,
+            'row_groups_skipped': 0,
+            'rows_read': 0,
+            'requests': 0,
+            'bytes_fetched': 0,
+        }
+        if not selected:
+            logger.info(f"No dataset files match the filters under s3://{self.bucket_name}/{self.prefix}")
+            if not files:
+                return pa.table({})
+            selected = files[:1]
+            conjunctions = [[_NEVER]]
+
+        def read_file(item: Tuple[Dict[str, Any], Dict[str, Any]]):
+            obj, partition = item
+            return self._read_file(obj, partition, partition_types, columns, conjunctions, block_size)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(read_file, selected))
+
+        tables = []
+        for table, file_stats in results:
+            tables.append(table)
+            for name, value in file_stats.items():
+                self.stats[name] += value
+        table = pa.concat_tables(tables, promote_options='default')
+        if filters:
+            pq = _import_pyarrow('parquet')
+            table = table.filter(pq.filters_to_expression(filters))
+        if columns is not None:
+            table = table.select(columns)
+        self.stats['rows_matched'] = table.num_rows
+        logger.info(f"Dataset read: s3://{self.bucket_name}/{self.prefix} | Stats: {self.stats}")
+        return table
+
+    def _list_objects(self) -> Iterator[Dict[str, Any]]:
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.prefix):
+            yield from page.get('Contents', [])
+
+    def _write_common_metadata(self, schema, partition_fields: List[Any]) -> None:
+        """Store the dataset schema, partition columns included, in _common_metadata"""
+        pa = _import_pyarrow()
+        pq = _import_pyarrow('parquet')
+        sink = pa.BufferOutputStream()
+        pq.write_metadata(pa.schema(list(schema) + list(partition_fields)), sink)
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=self.prefix + COMMON_METADATA_FILE,
+            Body=sink.getvalue().to_pybytes(),
+            ContentType=PARQUET_CONTENT_TYPE,
+        )
+
+    def _stored_partition_types(self, obj: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Column types recorded in the _common_metadata file of the dataset, if any"""
+        if obj is None:
+            return {}
+        pa = _import_pyarrow()
+        pq = _import_pyarrow('parquet')
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=obj['Key'])
+        schema = pq.read_schema(pa.BufferReader(response['Body'].read()))
+        return {
+            field.name: field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+            for field in schema
+        }
+
+    def _parse_partition(self, key: str) -> Optional[Dict[str, Optional[str]]]:
+        """Partition values of a data file key, None for markers, metadata and hidden files"""
+        relative = key[len(self.prefix):]
+        if not relative or relative.endswith('/'):
+            return None
+        parts = relative.split('/')
+        if any(part.startswith(('_', '.')) for part in parts):
+            return None
+        partition = {}
+        for part in parts[:-1]:
+            column, separator, value = part.partition('=')
+            if separator:
+                value = unquote(value)
+                partition[column] = None if value == NULL_PARTITION else value
+        return partition
+
+    def _read_file(
+        self,
+        obj: Dict[str, Any],
+        partition: Dict[str, Any],
+        partition_types: Dict[str, Any],
+        columns: Optional[List[str]],
+        conjunctions: List[List[Tuple[str, str, Any]]],
+        block_size: int,
+    ):
+        """Read the row groups of one file that can match, adding its partition columns"""
+        pa = _import_pyarrow()
+        pq = _import_pyarrow('parquet')
+        reader = S3RangeReader(
+            self.s3_client,
+            self.bucket_name,
+            obj['Key'],
+            size=obj.get('Size'),
+            etag=obj.get('ETag'),
+            block_size=block_size,
+            readahead_blocks=0,
+        )
+        with reader:
+            parquet_file = pq.ParquetFile(reader)
+            metadata = parquet_file.metadata
+            schema = parquet_file.schema_arrow
+            file_columns = None
+            if columns is not None:
+                wanted = set(columns) | {predicate[0] for conjunction in conjunctions for predicate in conjunction}
+                file_columns = [name for name in schema.names if name in wanted and name not in partition_types]
+
+            row_groups = [
+                index for index in range(metadata.num_row_groups)
+                if _may_match(conjunctions, _StatisticsLookup(metadata.row_group(index), partition))
+            ]
+            if row_groups:
+                table = parquet_file.read_row_groups(row_groups, columns=file_columns)
+            else:
+                table = schema.empty_table()
+                if file_columns is not None:
+                    table = table.select(file_columns)
+
+        for column, column_type in partition_types.items():
+            if column not in table.column_names:
+                table = table.append_column(
+                    column, pa.array([partition.get(column)] * table.num_rows, type=column_type)
+                )
+        file_stats = {
+            'row_groups': metadata.num_row_groups,
+            'row_groups_skipped': metadata.num_row_groups - len(row_groups),
+            'rows_read': table.num_rows,
+            'requests': reader.requests,
+            'bytes_fetched': reader.bytes_fetched,
+        }
+        return table, file_stats
+
+
+class _PartitionWriter:
+    """Parquet writer of one partition, streaming into a multipart upload"""
+
+    def __init__(self, s3_client, bucket_name: str, key: str, schema, compression: str, part_size: int) -> None:
+        pq = _import_pyarrow('parquet')
+        self.key = key
+        self.stream = S3StreamWriter(
+            s3_client,
+            bucket_name,
+            key,
+            part_size=part_size,
+            extra_args={'ContentType': PARQUET_CONTENT_TYPE},
+        )
+        self.writer = pq.ParquetWriter(self.stream, schema, compression=compression)
+        self.pending: List[Any] = []
+        self.pending_rows = 0
+        # Row groups of a partition are written in order and one at a time: the
+        # producer waits for the previous write before submitting the next, so
+        # at most one row group per partition is queued on the pool
+        self.last: Optional[Future] = None
+
+    def add(self, table, row_group_size: int, executor: ThreadPoolExecutor) -> None:
+        self.pending.append(table)
+        self.pending_rows += table.num_rows
+        if self.pending_rows >= row_group_size:
+            if self.last is not None:
+                self.last.result()
+            self.last = executor.submit(self._write, self._take(), row_group_size)
+
+    def _take(self):
+        pa = _import_pyarrow()
+        table = pa.concat_tables(self.pending)
+        self.pending = []
+        self.pending_rows = 0
+        return table
+
+    def _write(self, table, row_group_size: int) -> None:
+        self.writer.write_table(table, row_group_size=row_group_size)
+
+    def close(self, previous: Optional[Future] = None) -> None:
+        if previous is not None:
+            previous.result()
+        if self.pending:
+            table = self._take()
+            self.writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        self.writer.close()
+        self.stream.close()
+
+    def abort(self) -> None:
+        self.stream.abort()
+        self.stream.close()
+
+
+class _StatisticsLookup:
+    """Column lookup for _may_match over partition values and row group min/max statistics"""
+
+    def __init__(self, row_group, partition: Dict[str, Any]) -> None:
+        self.partition = partition
+        self.statistics = {}
+        for position in range(row_group.num_columns):
+            column = row_group.column(position)
+            stats = column.statistics
+            if stats is not None and stats.has_min_max:
+                self.statistics[column.path_in_schema] = (stats.min, stats.max, stats.null_count)
+
+    def __call__(self, column: str):
+        if column in self.partition:
+            return True, self.partition[column]
+        return False, self.statistics.get(column)
+
+
+# Predicate that no row satisfies, used to read only the schema of a file
+_NEVER = ('', 'in', ())
+
+
+def _may_match(conjunctions: List[List[Tuple[str, str, Any]]], lookup) -> bool:
+    """
+    Decide whether a file or row group can hold rows satisfying the filters.
+
+    lookup(column) returns (True, value) for a partition column, (False,
+    (min, max, null_count)) for a column with statistics and (False, None)
+    when nothing is known about the column.
+    """
+    if not conjunctions:
+        return True
+    for conjunction in conjunctions:
+        if all(_predicate_may_match(predicate, lookup) for predicate in conjunction):
+            return True
+    return False
+
+
+def _predicate_may_match(predicate: Tuple[str, str, Any], lookup) -> bool:
+    if predicate is _NEVER:
+        return False
+    column, operator, value = predicate
+    exact, known = lookup(column)
+    try:
+        if exact:
+            if known is None:
+                return False
+            return _compare(known, operator, value)
+        if known is None:
+            return True
+        low, high, _ = known
+        if operator in ('=', '=='):
+            return low <= value <= high
+        if operator == 'in':
+            return any(low <= item <= high for item in value)
+        if operator == '!=':
+            return not (low == high == value)
+        if operator == 'not in':
+            return not (low == high and low in value)
+        if operator == '<':
+            return low < value
+        if operator == '<=':
+            return low <= value
+        if operator == '>':
+            return high > value
+        return high >= value
+    except TypeError:
+        # Statistics of a different type than the filter value prove nothing
+        return True
+
+
+def _compare(known: Any, operator: str, value: Any) -> bool:
+    if operator in ('=', '=='):
+        return known == value
+    if operator == '!=':
+        return known != value
+    if operator == 'in':
+        return known in value
+    if operator == 'not in':
+        return known not in value
+    if operator == '<':
+        return known < value
+    if operator == '<=':
+        return known <= value
+    if operator == '>':
+        return known > value
+    return known >= value
+
+
+def _normalize_filters(filters: Optional[Filters]) -> List[List[Tuple[str, str, Any]]]:
+    """Turn filters into a list of conjunctions (OR of ANDs)"""
+    if not filters:
+        return []
+    conjunctions = [filters] if isinstance(filters[0], tuple) else filters
+    for conjunction in conjunctions:
+        for column, operator, value in conjunction:
+            if operator not in _OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {operator}")
+            if operator in ('in', 'not in') and not isinstance(value, (list, tuple, set, frozenset)):
+                raise ValueError(f"Filter operator '{operator}' requires a collection: {column}")
+    return [list(conjunction) for conjunction in conjunctions]
+
+
+def _infer_partition_types(partitions: List[Dict[str, Optional[str]]]) -> Dict[str, Any]:
+    """Partition columns are int64 when every value is an integer, string otherwise"""
+    pa = _import_pyarrow()
+    values: Dict[str, List[str]] = {}
+    for partition in partitions:
+        for column, value in partition.items():
+            values.setdefault(column, [])
+            if value is not None:
+                values[column].append(value)
+    types = {}
+    for column, column_values in values.items():
+        is_integer = bool(column_values) and all(_is_integer(value) for value in column_values)
+        types[column] = pa.int64() if is_integer else pa.string()
+    return types
+
+
+def _typed_partition(partition: Dict[str, Optional[str]], partition_types: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the text values of a partition key to the types of their columns"""
+    pa = _import_pyarrow()
+    pc = _import_pyarrow('compute')
+    typed = {}
+    for column, value in partition.items():
+        column_type = partition_types[column]
+        if value is None or pa.types.is_string(column_type):
+            typed[column] = value
+        elif column_type == pa.int64() and _is_integer(value):
+            typed[column] = int(value)
+        else:
+            try:
+                typed[column] = pc.cast(pa.array([value]), column_type)[0].as_py()
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                raise ValueError(f"Partition value {value!r} of column '{column}' is not a valid {column_type}")
+    return typed
+
+
+def _check_partition_filters(
+    conjunctions: List[List[Tuple[str, str, Any]]],
+    partition_types: Dict[str, Any],
+) -> None:
+    """Reject filter values on partition columns that do not fit the column type"""
+    pa = _import_pyarrow()
+    for conjunction in conjunctions:
+        for column, operator, value in conjunction:
+            if column not in partition_types:
+                continue
+            values = value if operator in ('in', 'not in') else [value]
+            for item in values:
+                if item is None:
+                    continue
+                try:
+                    pa.scalar(item, type=partition_types[column])
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    raise ValueError(
+                        f"Filter value {item!r} does not match the type {partition_types[column]} of "
+                        f"partition column '{column}'; pass partition_schema to read it with another type"
+                    )
+
+
+def _is_integer(value: str) -> bool:
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _partition_path(partition_cols: List[str], values: Tuple[Any, ...]) -> str:
+    path = ''
+    for column, value in zip(partition_cols, values):
+        encoded = NULL_PARTITION if value is None else quote(str(value), safe='')
+        path += f"{column}={encoded}/"
+    return path
+
+
+def _split_partitions(table, partition_cols: List[str]) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+    """Split a table into zero-copy slices with one combination of partition values each"""
+    if not partition_cols:
+        yield (), table
+        return
+    if table.num_rows == 0:
+        return
+    pa = _import_pyarrow()
+    pc = _import_pyarrow('compute')
+    table = table.sort_by([(column, 'ascending') for column in partition_cols])
+    rows = table.num_rows
+    changed = pa.array([False] * (rows - 1), type=pa.bool_())
+    for column in partition_cols:
+        current, previous = table[column].slice(1), table[column].slice(0, rows - 1)
+        changed = pc.or_(changed, pc.fill_null(pc.not_equal(current, previous), False))
+        changed = pc.or_(changed, pc.not_equal(pc.is_null(current), pc.is_null(previous)))
+    starts = [0] + [index + 1 for index in pc.indices_nonzero(changed).to_pylist()]
+    for start, end in zip(starts, starts[1:] + [rows]):
+        values = tuple(table[column][start].as_py() for column in partition_cols)
+        yield values, table.slice(start, end - start)
+
+
+def _iter_tables(data) -> Iterator[Any]:
+    """Normalize a DataFrame, Table, RecordBatch or an iterable of them into pyarrow Tables"""
+    pa = _import_pyarrow()
+    if isinstance(data, pa.Table):
+        yield data
+        return
+    if isinstance(data, pa.RecordBatch):
+        yield pa.Table.from_batches([data])
+        return
+    if hasattr(data, 'to_records') and hasattr(data, 'columns'):
+        yield pa.Table.from_pandas(data, preserve_index=False)
+        return
+    for chunk in data:
+        yield from _iter_tables(chunk)
+
+
+def _import_pyarrow(module: Optional[str] = None):
+    try:
+        import pyarrow
+        if module is None:
+            return pyarrow
+        return importlib.import_module(f"pyarrow.{module}")
+    except ImportError:
+        raise ImportError("Parquet datasets require the 'pyarrow' package")
@@ -0,0 +1,95 @@
+# src/aje_libs/common/helpers/s3/dedup.py
+import hashlib
+import io
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Tuple, Union, BinaryIO
+
+from .transfer import MB
+
+# User metadata key holding the SHA-256 of the content (x-amz-meta-content-sha256)
+DIGEST_METADATA_KEY = 'content-sha256'
+# User metadata key of pointer objects, holding the key of the content blob
+POINTER_METADATA_KEY = 'dedup-target'
+
+DEFAULT_DEDUP_PREFIX = '_dedup/sha256/'
+
+_READ_SIZE = 1 * MB
+# Non-seekable streams are spooled to memory up to this size, then to disk
+_SPOOL_MAX_SIZE = 8 * MB
+
+
+def blob_key(digest: str, prefix: str = DEFAULT_DEDUP_PREFIX) -> str:
+    """
+    Key of the content-addressed blob holding the content with a digest.
+
+    :param digest: Hex SHA-256 of the content.
+    :param prefix: Prefix of the blob store.
+    :return: Blob key (fanned out by the first two hex digits).
+    """
+    return f"{prefix}{digest[:2]}/{digest}"
+
+
+def hash_body(body: Union[str, bytes, bytearray, BinaryIO], encoding: str = 'utf-8') -> Tuple[str, int, BinaryIO]:
+    """
+    Hash a body in one streaming pass and return a stream positioned to upload it.
+
+    Seekable file objects are rewound to where they started; other streams are
+    spooled (in memory up to 8 MB, then to a temporary file) while hashing so
+    they can still be uploaded afterwards.
+
+    :param body: Content as str, bytes or binary file object.
+    :param encoding: Encoding of str bodies.
+    :return: Tuple of (hex SHA-256, size in bytes, binary stream with the content).
+    """
+    if isinstance(body, str):
+        body = body.encode(encoding)
+    if isinstance(body, (bytes, bytearray)):
+        return hashlib.sha256(body).hexdigest(), len(body), io.BytesIO(body)
+
+    digest = hashlib.sha256()
+    size = 0
+    seekable = hasattr(body, 'seekable') and body.seekable()
+    if seekable:
+        start = body.tell()
+        for chunk in iter(lambda: body.read(_READ_SIZE), b''):
+            digest.update(chunk)
+            size += len(chunk)
+        body.seek(start)
+        return digest.hexdigest(), size, body
+
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    for chunk in iter(lambda: body.read(_READ_SIZE), b''):
+        digest.update(chunk)
+        spool.write(chunk)
+        size += len(chunk)
+    spool.seek(0)
+    return digest.hexdigest(), size, spool
+
+
+class DigestIndex:
+    """Bounded, thread-safe set of blob digests known to exist, to skip existence checks."""
+
+    def __init__(self, max_entries: int = 100000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._digests: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+
+    def __contains__(self, item: Tuple[str, str]) -> bool:
+        with self._lock:
+            if item in self._digests:
+                self._digests.move_to_end(item)
+                return True
+            return False
+
+    def add(self, bucket: str, digest: str) -> None:
+        with self._lock:
+            self._digests[(bucket, digest)] = None
+            self._digests.move_to_end((bucket, digest))
+            while len(self._digests) > self.max_entries:
+                self._digests.popitem(last=False)
+
+    def discard(self, bucket: str, digest: str) -> None:
+        with self._lock:
+            self._digests.pop((bucket, digest), None)
@@ -0,0 +1,101 @@
+# src/aje_libs/common/helpers/s3/filters.py
+import re
+from datetime import datetime
+from typing import Optional, Dict, List, Any
+
+from ...logger import custom_logger
+
+logger = custom_logger(__name__)
+
+
+class ObjectFilterPlan:
+    """Compiled form of the listing filter dict, evaluated per object or per listing page."""
+
+    def __init__(self, filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Compile the filter criteria once: dates are parsed, the key pattern is
+        compiled and the extension is normalized to a lowercase suffix.
+
+        :param filters: Dict with filter criteria ('extension', 'min_size', 'max_size',
+            'date_range' with 'start'/'end' ISO dates, 'key_pattern' regex).
+        """
+        filters = filters or {}
+        self.filters = filters
+
+        extension = filters.get('extension')
+        self.suffix = f".{extension.lower()}" if extension else None
+        self.min_size = filters.get('min_size')
+        self.max_size = filters.get('max_size')
+
+        date_range = filters.get('date_range') or {}
+        self.start_date = _parse_date(date_range.get('start'))
+        self.end_date = _parse_date(date_range.get('end'))
+
+        pattern = filters.get('key_pattern')
+        self.key_regex = re.compile(pattern) if pattern else None
+
+        self.has_size = self.min_size is not None or self.max_size is not None
+        self.has_date = bool(self.start_date or self.end_date)
+        self.has_key = bool(self.suffix or self.key_regex)
+        self.is_empty = not (self.has_size or self.has_date or self.has_key)
+
+    def matches(self, obj: Dict[str, Any]) -> bool:
+        """
+        Check a single object against the plan, cheapest criteria first.
+
+        :param obj: Object metadata.
+        :return: True if object passes all filters.
+        """
+        if self.has_size:
+            size = obj.get('Size', 0)
+            if self.min_size is not None and size < self.min_size:
+                return False
+            if self.max_size is not None and size > self.max_size:
+                return False
+
+        if self.has_date:
+            last_modified = obj.get('LastModified')
+            if last_modified:
+                last_date = last_modified.date()
+                if self.start_date and last_date < self.start_date:
+                    return False
+                if self.end_date and last_date > self.end_date:
+                    return False
+
+        if self.has_key:
+            return self.key_matches(obj.get('Key', ''))
+
+        return True
+
+    def key_matches(self, key: str) -> bool:
+        """
+        Check a key against the extension and key pattern criteria only.
+
+        Sources that evaluate size and date in their own form (e.g. inventory
+        scans) use this for the remaining criteria.
+
+        :param key: Object key.
+        :return: True if the key passes the key criteria.
+        """
+        if self.suffix and not key.lower().endswith(self.suffix):
+            return False
+        if self.key_regex and not self.key_regex.search(key):
+            return False
+        return True
+
+    def filter_batch(self, objects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Filter a batch of objects (e.g. one listing page).
+
+        :param objects: List of object metadata.
+        :return: Objects passing all filters, in their original order.
+        """
+        if self.is_empty:
+            return objects
+        matches = self.matches
+        return [obj for obj in objects if matches(obj)]
+
+
+def _parse_date(value: Optional[str]):
+    """Parse an ISO date or datetime string into a date"""
+    return datetime.fromisoformat(value).date() if value else None
@@ -0,0 +1,509 @@
+# src/aje_libs/common/helpers/s3/inventory.py
+import csv
+import io
+import json
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, Iterator, Tuple
+from urllib.parse import unquote_plus
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .concurrency import put_until_stopped
+from .filters import ObjectFilterPlan
+from .range_reader import S3RangeReader
+from .record_reader import open_binary_stream
+
+logger = custom_logger(__name__)
+
+_DONE = object()
+
+# Batch size of objects handed from the scan workers to the consumer
+_BATCH_SIZE = 5000
+
+# Range GET granularity of ORC/Parquet data files read from S3
+_COLUMNAR_BLOCK_SIZE = 1024 * 1024
+
+# fileSchema names of CSV inventories and column names of ORC/Parquet inventories
+_CSV_COLUMNS = {
+    'key': 'Key',
+    'size': 'Size',
+    'last_modified': 'LastModifiedDate',
+    'etag': 'ETag',
+    'storage_class': 'StorageClass',
+    'is_latest': 'IsLatest',
+    'is_delete_marker': 'IsDeleteMarker',
+}
+_COLUMNAR_COLUMNS = {
+    'key': 'key',
+    'size': 'size',
+    'last_modified': 'last_modified_date',
+    'etag': 'e_tag',
+    'storage_class': 'storage_class',
+    'is_latest': 'is_latest',
+    'is_delete_marker': 'is_delete_marker',
+}
+
+
+class S3Inventory:
+    """Listing source backed by an S3 Inventory report (CSV, ORC or Parquet)."""
+
+    def __init__(
+        self,
+        s3_client,
+        manifest: str,
+        max_workers: int = 8,
+        queue_batches: int = 16,
+        local_root: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the inventory source.
+
+        The manifest is either an S3 URI (s3://bucket/.../manifest.json) or a
+        local path to a report copied with the same layout. Local data files are
+        resolved against local_root, the directory standing for the destination
+        bucket; if not given, it is found by walking up from the manifest.
+
+        :param s3_client: boto3 S3 client (used for S3 manifests).
+        :param manifest: S3 URI or local path of manifest.json.
+        :param max_workers: Number of data files scanned concurrently.
+        :param queue_batches: Batches of objects buffered ahead of the consumer.
+        :param local_root: Local directory matching the destination bucket root (optional).
+        """
+        self.s3_client = s3_client
+        self.max_workers = max_workers
+        self.queue_batches = queue_batches
+        self.is_local = not manifest.startswith('s3://')
+        self.manifest_location = manifest
+
+        if self.is_local:
+            with open(manifest, 'rb') as handle:
+                self.manifest = json.load(handle)
+        else:
+            bucket, key = _split_uri(manifest)
+            self.manifest = json.loads(s3_client.get_object(Bucket=bucket, Key=key)['Body'].read())
+
+        self.source_bucket = self.manifest.get('sourceBucket')
+        self.destination_bucket = self.manifest['destinationBucket'].split(':::')[-1]
+        self.file_format = self.manifest['fileFormat'].lower()
+        if self.file_format not in ('csv', 'orc', 'parquet'):
+            raise ValueError(f"Unsupported inventory format: {self.manifest['fileFormat']}")
+        self.files = [entry['key'] for entry in self.manifest['files']]
+        self.file_sizes = {entry['key']: entry.get('size') for entry in self.manifest['files']}
+        self.csv_schema = [name.strip() for name in self.manifest.get('fileSchema', '').split(',')]
+        self.local_root = local_root
+        if self.is_local and local_root is None and self.files:
+            self.local_root = _find_local_root(manifest, self.files[0])
+        self._stats_lock = threading.Lock()
+        self.stats = {}
+
+    @classmethod
+    def latest(cls, s3_client, location: str, **kwargs: Any) -> "S3Inventory":
+        """
+        Open the most recent report of an inventory configuration.
+
+        :param s3_client: boto3 S3 client.
+        :param location: S3 URI or local directory of the configuration
+            (<destination prefix>/<source bucket>/<configuration id>/).
+        :param kwargs: Extra arguments for the constructor.
+        :return: S3Inventory over the newest manifest.json.
+        """
+        if location.startswith('s3://'):
+            bucket, prefix = _split_uri(location)
+            prefix = prefix.rstrip('/') + '/'
+            paginator = s3_client.get_paginator('list_objects_v2')
+            folders = sorted(
+                common['Prefix']
+                for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/')
+                for common in page.get('CommonPrefixes', [])
+            )
+            # Report folders are named after their timestamp, so they sort chronologically
+            for folder in reversed(folders):
+                key = f"{folder}manifest.json"
+                try:
+                    s3_client.head_object(Bucket=bucket, Key=key)
+                except ClientError:
+                    continue
+                return cls(s3_client, f"s3://{bucket}/{key}", **kwargs)
+        else:
+            for name in sorted(os.listdir(location), reverse=True):
+                path = os.path.join(location, name, 'manifest.json')
+                if os.path.exists(path):
+                    return cls(s3_client, path, **kwargs)
+        raise FileNotFoundError(f"No inventory manifest found under {location}")
+
+    def iter_objects(
+        self,
+        prefix: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        stats: Optional[Dict[str, int]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the current objects of the report that match the prefix and filters.
+
+        Data files are scanned concurrently. The prefix, size and date criteria
+        are evaluated inside the scan: on raw CSV fields before any row is
+        materialized, and for Parquet also against row group statistics so
+        non-matching row groups are never decoded. ORC/Parquet files in S3 are
+        read with Range GETs, fetching only footers and the needed columns of
+        the row groups read. Delete markers and non-current versions are
+        skipped. Objects come out in file completion order, not key order.
+
+        :param prefix: Prefix to filter objects.
+        :param filters: Dict with filter criteria (see ObjectFilterPlan).
+        :param stats: Dict filled with the counters of this scan (optional; the
+            stats attribute only holds those of the latest scan started).
+        :return: Iterator of object metadata shaped like list_objects_v2 entries.
+        """
+        plan = ObjectFilterPlan(filters)
+        bounds = _Bounds(prefix or '', plan)
+        stats = stats if stats is not None else {}
+        stats.update({
+            'files': 0, 'rows_scanned': 0, 'rows_matched': 0, 'row_groups_skipped': 0,
+            'requests': 0, 'bytes_fetched': 0,
+        })
+        self.stats = stats
+        logger.info(
+            f"Scanning inventory {self.manifest_location} - Format: {self.file_format} | "
+            f"Files: {len(self.files)} | Prefix: {prefix}"
+        )
+
+        stop = threading.Event()
+        results: queue.Queue = queue.Queue(maxsize=self.queue_batches)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for file_key in self.files:
+                executor.submit(self._scan_file, file_key, plan, bounds, results, stop, stats)
+
+            pending = len(self.files)
+            while pending:
+                item = results.get()
+                if item is _DONE:
+                    pending -= 1
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+                yield from item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _scan_file(
+        self,
+        file_key: str,
+        plan: ObjectFilterPlan,
+        bounds: "_Bounds",
+        results: queue.Queue,
+        stop: threading.Event,
+        stats: Dict[str, int],
+    ) -> None:
+        """Scan one data file and push its matching objects in batches"""
+        counters = {'rows_scanned': 0, 'rows_matched': 0, 'row_groups_skipped': 0, 'requests': 0, 'bytes_fetched': 0}
+        try:
+            scan = {
+                'csv': self._scan_csv,
+                'orc': self._scan_orc,
+                'parquet': self._scan_parquet,
+            }[self.file_format]
+            for batch in scan(file_key, plan, bounds, counters):
+                if stop.is_set():
+                    break
+                counters['rows_matched'] += len(batch)
+                if batch:
+                    put_until_stopped(results, batch, stop)
+        except ClientError as error:
+            logger.error(
+                f"Failed to read inventory file - Bucket: {self.destination_bucket} | Key: {file_key} | "
+                f"Error: {error.response['Error']['Code']}"
+            )
+            put_until_stopped(results, error, stop)
+        except Exception as error:
+            put_until_stopped(results, error, stop)
+
+        with self._stats_lock:
+            stats['files'] += 1
+            for name, value in counters.items():
+                stats[name] += value
+        put_until_stopped(results, _DONE, stop)
+
+    def _open(self, file_key: str):
+        """Open a data file as a binary stream"""
+        if self.is_local:
+            return open(os.path.join(self.local_root, file_key), 'rb')
+        return self.s3_client.get_object(Bucket=self.destination_bucket, Key=file_key)['Body']
+
+    @contextmanager
+    def _open_random_access(self, file_key: str, counters: Dict[str, int]):
+        """
+        Open an ORC/Parquet data file for random access. Remote files are read
+        with Range GETs, so footers and the selected columns of the row groups
+        or stripes actually read are the only bytes downloaded.
+        """
+        if self.is_local:
+            with open(os.path.join(self.local_root, file_key), 'rb') as handle:
+                yield handle
+            return
+        reader = S3RangeReader(
+            self.s3_client,
+            self.destination_bucket,
+            file_key,
+            size=self.file_sizes.get(file_key),
+            # Report files are written once and never replaced, so no If-Match (or HEAD) is needed
+            etag='',
+            block_size=_COLUMNAR_BLOCK_SIZE,
+            readahead_blocks=0,
+        )
+        try:
+            with reader:
+                yield reader
+        finally:
+            counters['requests'] += reader.requests
+            counters['bytes_fetched'] += reader.bytes_fetched
+
+    def _scan_csv(
+        self,
+        file_key: str,
+        plan: ObjectFilterPlan,
+        bounds: "_Bounds",
+        counters: Dict[str, int],
+    ) -> Iterator[List[Dict[str, Any]]]:
+        index = {name: position for position, name in enumerate(self.csv_schema)}
+        columns = {field: index.get(name) for field, name in _CSV_COLUMNS.items()}
+        key_col, size_col, date_col = columns['key'], columns['size'], columns['last_modified']
+        if key_col is None:
+            raise ValueError(f"Inventory schema has no Key column: {self.csv_schema}")
+
+        compression = 'gzip' if file_key.endswith('.gz') else None
+        with open_binary_stream(self._open(file_key), compression) as stream:
+            reader = csv.reader(io.TextIOWrapper(stream, encoding='utf-8', newline=''))
+            batch = []
+            for row in reader:
+                counters['rows_scanned'] += 1
+                if not bounds.check_size(row[size_col] if size_col is not None else None):
+                    continue
+                if not bounds.check_date(row[date_col] if date_col is not None else None):
+                    continue
+                if not _is_current(row, columns):
+                    continue
+                key = unquote_plus(row[key_col])
+                if not key.startswith(bounds.prefix) or (plan.has_key and not plan.key_matches(key)):
+                    continue
+                batch.append(_object_from_csv(row, key, columns))
+                if len(batch) >= _BATCH_SIZE:
+                    yield batch
+                    batch = []
+            yield batch
+
+    def _scan_parquet(
+        self,
+        file_key: str,
+        plan: ObjectFilterPlan,
+        bounds: "_Bounds",
+        counters: Dict[str, int],
+    ) -> Iterator[List[Dict[str, Any]]]:
+        pq = _import_pyarrow('parquet')
+        with self._open_random_access(file_key, counters) as source:
+            parquet_file = pq.ParquetFile(source)
+            schema_names = parquet_file.schema_arrow.names
+            columns = [name for name in _COLUMNAR_COLUMNS.values() if name in schema_names]
+            metadata = parquet_file.metadata
+            for row_group in range(metadata.num_row_groups):
+                if not bounds.row_group_may_match(metadata.row_group(row_group), schema_names):
+                    counters['row_groups_skipped'] += 1
+                    continue
+                table = parquet_file.read_row_group(row_group, columns=columns)
+                counters['rows_scanned'] += table.num_rows
+                yield from _filter_table(table, plan, bounds)
+
+    def _scan_orc(
+        self,
+        file_key: str,
+        plan: ObjectFilterPlan,
+        bounds: "_Bounds",
+        counters: Dict[str, int],
+    ) -> Iterator[List[Dict[str, Any]]]:
+        pa = _import_pyarrow()
+        orc = _import_pyarrow('orc')
+        with self._open_random_access(file_key, counters) as source:
+            orc_file = orc.ORCFile(source)
+            schema_names = orc_file.schema.names
+            columns = [name for name in _COLUMNAR_COLUMNS.values() if name in schema_names]
+            for stripe in range(orc_file.nstripes):
+                table = pa.Table.from_batches([orc_file.read_stripe(stripe, columns=columns)])
+                counters['rows_scanned'] += table.num_rows
+                yield from _filter_table(table, plan, bounds)
+
+
+class _Bounds:
+    """Prefix, size and date predicates in the raw forms found in inventory files"""
+
+    def __init__(self, prefix: str, plan: ObjectFilterPlan) -> None:
+        self.prefix = prefix
+        self.min_size = plan.min_size
+        self.max_size = plan.max_size
+        # Inventory dates are UTC ISO-8601 strings, so day bounds compare lexicographically
+        self.start = plan.start_date.isoformat() if plan.start_date else None
+        self.end = (plan.end_date + timedelta(days=1)).isoformat() if plan.end_date else None
+        self.start_at = (
+            datetime.combine(plan.start_date, datetime.min.time(), timezone.utc) if plan.start_date else None
+        )
+        self.end_before = (
+            datetime.combine(plan.end_date + timedelta(days=1), datetime.min.time(), timezone.utc)
+            if plan.end_date else None
+        )
+
+    def check_size(self, value: Optional[str]) -> bool:
+        if (self.min_size is None and self.max_size is None) or not value:
+            return True
+        size = int(value)
+        if self.min_size is not None and size < self.min_size:
+            return False
+        return self.max_size is None or size <= self.max_size
+
+    def check_date(self, value: Optional[str]) -> bool:
+        if not value:
+            return True
+        if self.start and value < self.start:
+            return False
+        return not (self.end and value >= self.end)
+
+    def row_group_may_match(self, row_group, schema_names: List[str]) -> bool:
+        """Decide from column statistics whether a Parquet row group can hold matches"""
+        for position in range(row_group.num_columns):
+            column = row_group.column(position)
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                continue
+            name = column.path_in_schema
+            if name == 'key' and self.prefix:
+                if stats.max < self.prefix or (stats.min > self.prefix and not stats.min.startswith(self.prefix)):
+                    return False
+            elif name == 'size':
+                if self.min_size is not None and stats.max < self.min_size:
+                    return False
+                if self.max_size is not None and stats.min > self.max_size:
+                    return False
+            elif name == 'last_modified_date':
+                low, high = _as_utc(stats.min), _as_utc(stats.max)
+                if self.start_at and high is not None and high < self.start_at:
+                    return False
+                if self.end_before and low is not None and low >= self.end_before:
+                    return False
+        return True
+
+
+def _filter_table(table, plan: ObjectFilterPlan, bounds: _Bounds) -> Iterator[List[Dict[str, Any]]]:
+    """Filter an ORC/Parquet table with Arrow kernels and convert the survivors"""
+    pa = _import_pyarrow()
+    pc = _import_pyarrow('compute')
+    names = table.column_names
+    mask = pa.array([True] * table.num_rows)
+
+    if bounds.prefix:
+        mask = pc.and_(mask, pc.starts_with(table['key'], bounds.prefix))
+    if 'size' in names:
+        if bounds.min_size is not None:
+            mask = pc.and_(mask, pc.fill_null(pc.greater_equal(table['size'], bounds.min_size), True))
+        if bounds.max_size is not None:
+            mask = pc.and_(mask, pc.fill_null(pc.less_equal(table['size'], bounds.max_size), True))
+    if 'last_modified_date' in names and (bounds.start_at or bounds.end_before):
+        dates = table['last_modified_date']
+        if dates.type.tz is None:
+            dates = pc.assume_timezone(dates, 'UTC')
+        if bounds.start_at:
+            mask = pc.and_(mask, pc.fill_null(pc.greater_equal(dates, bounds.start_at), True))
+        if bounds.end_before:
+            mask = pc.and_(mask, pc.fill_null(pc.less(dates, bounds.end_before), True))
+    if plan.suffix:
+        mask = pc.and_(mask, pc.ends_with(pc.utf8_lower(table['key']), plan.suffix))
+    if 'is_delete_marker' in names:
+        mask = pc.and_(mask, pc.invert(pc.fill_null(table['is_delete_marker'], False)))
+    if 'is_latest' in names:
+        mask = pc.and_(mask, pc.fill_null(table['is_latest'], True))
+
+    table = table.filter(mask)
+    if 'last_modified_date' in names and table.schema.field('last_modified_date').type.unit == 'ns':
+        # Nanosecond timestamps (ORC) would convert to pandas Timestamps instead of datetimes
+        position = names.index('last_modified_date')
+        table = table.set_column(
+            position, 'last_modified_date', pc.cast(table['last_modified_date'], pa.timestamp('us', tz='UTC'))
+        )
+    for start in range(0, table.num_rows, _BATCH_SIZE):
+        batch = []
+        for row in table.slice(start, _BATCH_SIZE).to_pylist():
+            if plan.key_regex and not plan.key_regex.search(row['key']):
+                continue
+            batch.append(_object_from_columns(row))
+        yield batch
+
+
+def _object_from_csv(row: List[str], key: str, columns: Dict[str, Optional[int]]) -> Dict[str, Any]:
+    obj = {'Key': key}
+    if columns['size'] is not None and row[columns['size']]:
+        obj['Size'] = int(row[columns['size']])
+    if columns['last_modified'] is not None and row[columns['last_modified']]:
+        obj['LastModified'] = datetime.fromisoformat(row[columns['last_modified']].replace('Z', '+00:00'))
+    if columns['etag'] is not None and row[columns['etag']]:
+        obj['ETag'] = f'"{row[columns["etag"]]}"'
+    if columns['storage_class'] is not None and row[columns['storage_class']]:
+        obj['StorageClass'] = row[columns['storage_class']]
+    return obj
+
+
+def _object_from_columns(row: Dict[str, Any]) -> Dict[str, Any]:
+    obj = {'Key': row['key']}
+    if row.get('size') is not None:
+        obj['Size'] = row['size']
+    if row.get('last_modified_date') is not None:
+        obj['LastModified'] = _as_utc(row['last_modified_date'])
+    if row.get('e_tag'):
+        obj['ETag'] = f'"{row["e_tag"]}"'
+    if row.get('storage_class'):
+        obj['StorageClass'] = row['storage_class']
+    return obj
+
+
+def _is_current(row: List[str], columns: Dict[str, Optional[int]]) -> bool:
+    """Skip delete markers and non-current versions of versioned inventories"""
+    if columns['is_delete_marker'] is not None and row[columns['is_delete_marker']] == 'true':
+        return False
+    return columns['is_latest'] is None or row[columns['is_latest']] != 'false'
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or not isinstance(value, datetime):
+        return value
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _split_uri(uri: str) -> Tuple[str, str]:
+    bucket, _, key = uri[len('s3://'):].partition('/')
+    return bucket, key
+
+
+def _find_local_root(manifest_path: str, file_key: str) -> str:
+    """Walk up from the manifest to the directory that the data file keys are relative to"""
+    directory = os.path.dirname(os.path.abspath(manifest_path))
+    while True:
+        if os.path.exists(os.path.join(directory, file_key)):
+            return directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            raise FileNotFoundError(f"Cannot locate inventory data file {file_key} near {manifest_path}")
+        directory = parent
+
+
+def _import_pyarrow(module: Optional[str] = None):
+    try:
+        import pyarrow
+        if module is None:
+            return pyarrow
+        import importlib
+        return importlib.import_module(f"pyarrow.{module}")
+    except ImportError:
+        raise ImportError("Reading ORC/Parquet inventories requires the 'pyarrow' package")
@@ -0,0 +1,249 @@
+# src/aje_libs/common/helpers/s3/listing_index.py
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Dict, List, Any, Iterator, Iterable
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+
+logger = custom_logger(__name__)
+
+DEFAULT_INDEX_PATH = "/tmp/aje_s3_listing_index.sqlite3"
+
+# Upper bound appended to a prefix to express "every key starting with prefix"
+# as a range; SQLite compares TEXT as UTF-8 bytes, same as S3 key ordering
+_PREFIX_END = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    storage_class TEXT,
+    PRIMARY KEY (bucket, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scans (
+    bucket TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    last_key TEXT,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (bucket, prefix)
+);
+"""
+
+
+class ListingIndex:
+    """Local SQLite index of S3 listings, refreshed incrementally with StartAfter."""
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_INDEX_PATH,
+        refresh_interval: Optional[float] = 60.0,
+    ) -> None:
+        """
+        Initialize the listing index.
+
+        :param db_path: Path of the SQLite database file (':memory:' for a process-local index).
+        :param refresh_interval: Seconds an indexed prefix is trusted before an incremental
+            refresh (None to never refresh automatically).
+        """
+        self.db_path = db_path
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+        logger.info(f"Configured S3 listing index: {db_path}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _covering_scan(self, bucket: str, prefix: str) -> Optional[tuple]:
+        """Return the indexed scan whose prefix contains the requested prefix"""
+        rows = self._conn.execute(
+            "SELECT prefix, last_key, refreshed_at FROM scans WHERE bucket = ?",
+            (bucket,)
+        ).fetchall()
+        covering = [row for row in rows if prefix.startswith(row[0])]
+        return max(covering, key=lambda row: len(row[0])) if covering else None
+
+    def refresh(
+        self,
+        s3_client,
+        bucket: str,
+        prefix: str = '',
+        full: bool = False,
+        max_keys: int = 1000,
+    ) -> int:
+        """
+        Refresh the index for a prefix.
+
+        Incremental refreshes only list keys after the last indexed key, which is
+        what append-only layouts (timestamped or sequential keys) need. Use
+        full=True to pick up deletions and rewrites of existing keys.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket: Name of the S3 bucket.
+        :param prefix: Prefix to index.
+        :param full: Re-list the whole prefix and drop keys no longer present.
+        :param max_keys: Maximum number of keys per request.
+        :return: Number of objects written to the index.
+        """
+        with self._lock:
+            scan = self._covering_scan(bucket, prefix)
+        if scan and not full:
+            prefix = scan[0]
+        start_after = scan[1] if scan and not full else None
+
+        logger.info(
+            f"Refreshing listing index - Bucket: {bucket} | Prefix: {prefix} | "
+            f"Mode: {'full' if full or not scan else 'incremental'}"
+        )
+        kwargs = {'Bucket': bucket, 'MaxKeys': max_keys}
+        if prefix:
+            kwargs['Prefix'] = prefix
+        if start_after:
+            kwargs['StartAfter'] = start_after
+
+        written = 0
+        last_key = start_after
+        try:
+            paginator = s3_client.get_paginator('list_objects_v2')
+            with self._lock, self._conn:
+                if full or not scan:
+                    self._conn.execute(
+                        "DELETE FROM objects WHERE bucket = ? AND key >= ? AND key < ?",
+                        (bucket, prefix, prefix + _PREFIX_END)
+                    )
+                for page in paginator.paginate(**kwargs):
+                    objects = page.get('Contents', [])
+                    if not objects:
+                        continue
+                    self._upsert(bucket, objects)
+                    written += len(objects)
+                    last_key = max(last_key or '', objects[-1]['Key'])
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO scans (bucket, prefix, last_key, refreshed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (bucket, prefix, last_key, time.time())
+                )
+        except ClientError as error:
+            logger.error(
+                f"Failed to refresh listing index - Bucket: {bucket} | Prefix: {prefix} | "
+                f"Error: {error.response['Error']['Code']}"
+            )
+            raise error
+
+        logger.info(f"Indexed {written} objects for s3://{bucket}/{prefix}")
+        return written
+
+    def _upsert(self, bucket: str, objects: Iterable[Dict[str, Any]]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO objects "
+            "(bucket, key, size, etag, last_modified, storage_class) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    bucket,
+                    obj['Key'],
+                    obj.get('Size', 0),
+                    obj.get('ETag'),
+                    obj['LastModified'].isoformat() if obj.get('LastModified') else None,
+                    obj.get('StorageClass'),
+                )
+                for obj in objects
+            ]
+        )
+
+    def ensure_fresh(self, s3_client, bucket: str, prefix: str = '') -> None:
+        """
+        Refresh the prefix if it was never indexed or its refresh interval expired.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket: Name of the S3 bucket.
+        :param prefix: Prefix to index.
+        """
+        with self._lock:
+            scan = self._covering_scan(bucket, prefix)
+        if scan is None:
+            self.refresh(s3_client, bucket, prefix)
+        elif self.refresh_interval is not None and time.time() - scan[2] > self.refresh_interval:
+            self.refresh(s3_client, bucket, prefix)
+
+    def count(self, bucket: str, prefix: str = '') -> int:
+        """
+        Count indexed objects under a prefix.
+
+        :param bucket: Name of the S3 bucket.
+        :param prefix: Prefix to count.
+        :return: Number of indexed objects.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM objects WHERE bucket = ? AND key >= ? AND key < ?",
+                (bucket, prefix, prefix + _PREFIX_END)
+            ).fetchone()
+        return row[0]
+
+    def query(
+        self,
+        bucket: str,
+        prefix: str = '',
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Query indexed objects in key order.
+
+        :param bucket: Name of the S3 bucket.
+        :param prefix: Prefix to filter objects.
+        :param min_size: Minimum size in bytes.
+        :param max_size: Maximum size in bytes.
+        :param start_date: Start date in ISO format (e.g., "2023-01-01").
+        :param end_date: End date in ISO format (e.g., "2023-12-31").
+        :return: Iterator of object metadata shaped like list_objects_v2 entries.
+        """
+        clauses = ["bucket = ?", "key >= ?", "key < ?"]
+        params: List[Any] = [bucket, prefix, prefix + _PREFIX_END]
+        if min_size is not None:
+            clauses.append("size >= ?")
+            params.append(min_size)
+        if max_size is not None:
+            clauses.append("size <= ?")
+            params.append(max_size)
+        # LastModified is stored in UTC ISO format, so its first 10 characters
+        # are the date compared by the listing filters
+        if start_date:
+            clauses.append("substr(last_modified, 1, 10) >= ?")
+            params.append(datetime.fromisoformat(start_date).date().isoformat())
+        if end_date:
+            clauses.append("substr(last_modified, 1, 10) <= ?")
+            params.append(datetime.fromisoformat(end_date).date().isoformat())
+
+        sql = (
+            "SELECT key, size, etag, last_modified, storage_class FROM objects "
+            f"WHERE {' AND '.join(clauses)} ORDER BY key"
+        )
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for key, size, etag, last_modified, storage_class in rows:
+                obj = {'Key': key, 'Size': size, 'ETag': etag}
+                if last_modified:
+                    obj['LastModified'] = datetime.fromisoformat(last_modified)
+                if storage_class:
+                    obj['StorageClass'] = storage_class
+                yield obj
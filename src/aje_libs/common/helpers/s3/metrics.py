@@ -0,0 +1,375 @@
+# src/aje_libs/common/helpers/s3/metrics.py
+import atexit
+import bisect
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Optional, Dict, List, Any, Callable, Tuple
+
+from ...logger import custom_logger
+
+logger = custom_logger(__name__)
+
+# Upper bounds in milliseconds of the latency histogram buckets (the last one is open)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+THROTTLE_ERROR_CODES = {
+    'SlowDown',
+    'Throttling',
+    'ThrottlingException',
+    'RequestLimitExceeded',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    '503',
+}
+
+_CONTEXT_KEY = 'aje_metrics'
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, sum, min and max."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.sums = [0.0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value_ms: float) -> None:
+        index = bisect.bisect_left(LATENCY_BUCKETS_MS, value_ms)
+        self.counts[index] += 1
+        self.sums[index] += value_ms
+        self.count += 1
+        self.total += value_ms
+        self.min = value_ms if self.min is None else min(self.min, value_ms)
+        self.max = value_ms if self.max is None else max(self.max, value_ms)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Estimate a percentile as the upper bound of the bucket it falls in.
+
+        :param percent: Percentile between 0 and 100.
+        :return: Estimated latency in milliseconds (None without samples).
+        """
+        if not self.count:
+            return None
+        rank = self.count * percent / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+    def values_and_counts(self) -> Tuple[List[float], List[int]]:
+        """Mean latency and sample count of each non-empty bucket"""
+        values, counts = [], []
+        for total, count in zip(self.sums, self.counts):
+            if count:
+                values.append(round(total / count, 3))
+                counts.append(count)
+        return values, counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+        }
+
+
+class OperationStats:
+    """Aggregated metrics of one (bucket, operation) pair."""
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttles = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'throttles': self.throttles,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'latency_ms': self.latency.to_dict(),
+        }
+
+
+class MetricsCollector:
+    """Thread-safe aggregation of per-operation metrics; subclasses decide where they go."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], OperationStats] = {}
+
+    def record(
+        self,
+        bucket: str,
+        operation: str,
+        latency_ms: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        retries: int = 0,
+        throttles: int = 0,
+        error_code: Optional[str] = None,
+    ) -> None:
+        """
+        Record one completed operation (an API call or a whole managed transfer).
+
+        :param bucket: Name of the S3 bucket.
+        :param operation: Operation name (e.g. 'GetObject', 'upload_file').
+        :param latency_ms: Wall time in milliseconds, including retries.
+        :param bytes_in: Bytes received.
+        :param bytes_out: Bytes sent.
+        :param retries: Retry attempts made.
+        :param throttles: Attempts rejected with a throttling error.
+        :param error_code: Error code if the operation failed (optional).
+        """
+        with self._lock:
+            stats = self._stats.get((bucket, operation))
+            if stats is None:
+                stats = self._stats[(bucket, operation)] = OperationStats()
+            stats.latency.add(latency_ms)
+            stats.requests += 1
+            stats.errors += 1 if error_code else 0
+            stats.retries += retries
+            stats.throttles += throttles
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the aggregated metrics.
+
+        :return: Dict keyed by 'bucket:operation' with counters and latency percentiles.
+        """
+        with self._lock:
+            return {f"{bucket}:{operation}": stats.to_dict() for (bucket, operation), stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Drop every aggregated metric."""
+        with self._lock:
+            self._stats = {}
+
+    def _drain(self) -> Dict[Tuple[str, str], OperationStats]:
+        with self._lock:
+            stats, self._stats = self._stats, {}
+        return stats
+
+    def flush(self) -> None:
+        """Send the aggregated metrics to the backend (no-op for in-memory collectors)."""
+
+
+class InMemoryMetrics(MetricsCollector):
+    """Collector that keeps aggregates and the most recent raw records, for tests and debugging."""
+
+    def __init__(self, max_records: int = 10000) -> None:
+        super().__init__()
+        self.records: deque = deque(maxlen=max_records)
+
+    def record(self, bucket: str, operation: str, latency_ms: float, **kwargs: Any) -> None:
+        super().record(bucket, operation, latency_ms, **kwargs)
+        self.records.append({'bucket': bucket, 'operation': operation, 'latency_ms': latency_ms, **kwargs})
+
+    def reset(self) -> None:
+        super().reset()
+        self.records.clear()
+
+
+class EMFMetrics(MetricsCollector):
+    """Collector that writes CloudWatch Embedded Metric Format records to stdout."""
+
+    def __init__(
+        self,
+        namespace: str = 'AjeLibs/S3',
+        dimensions: Optional[Dict[str, str]] = None,
+        flush_interval: Optional[float] = 60.0,
+        writer: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        Initialize the emitter.
+
+        Metrics are aggregated per bucket and operation and written as one EMF
+        line per pair on flush; latencies are sent as value/count arrays so
+        CloudWatch keeps the distribution and percentiles. In Lambda the log
+        line is all that is needed, no PutMetricData calls are made.
+
+        :param namespace: CloudWatch namespace.
+        :param dimensions: Extra dimensions added to every metric (e.g. {'Service': 'ingest'}).
+        :param flush_interval: Seconds between automatic flushes on record (None to only flush
+            explicitly and at interpreter exit).
+        :param writer: Function receiving each EMF JSON line (defaults to stdout).
+        """
+        super().__init__()
+        self.namespace = namespace
+        self.dimensions = dict(dimensions or {})
+        self.flush_interval = flush_interval
+        self.writer = writer or _write_stdout
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
+    def record(self, bucket: str, operation: str, latency_ms: float, **kwargs: Any) -> None:
+        super().record(bucket, operation, latency_ms, **kwargs)
+        if self.flush_interval is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write one EMF record per bucket and operation and reset the aggregates."""
+        self._last_flush = time.monotonic()
+        timestamp = int(time.time() * 1000)
+        dimension_names = list(self.dimensions) + ['Bucket', 'Operation']
+        for (bucket, operation), stats in self._drain().items():
+            values, counts = stats.latency.values_and_counts()
+            record = {
+                '_aws': {
+                    'Timestamp': timestamp,
+                    'CloudWatchMetrics': [{
+                        'Namespace': self.namespace,
+                        'Dimensions': [dimension_names],
+                        'Metrics': [
+                            {'Name': 'Latency', 'Unit': 'Milliseconds'},
+                            {'Name': 'Requests', 'Unit': 'Count'},
+                            {'Name': 'Errors', 'Unit': 'Count'},
+                            {'Name': 'Retries', 'Unit': 'Count'},
+                            {'Name': 'Throttles', 'Unit': 'Count'},
+                            {'Name': 'BytesIn', 'Unit': 'Bytes'},
+                            {'Name': 'BytesOut', 'Unit': 'Bytes'},
+                        ],
+                    }],
+                },
+                **self.dimensions,
+                'Bucket': bucket,
+                'Operation': operation,
+                'Latency': {'Values': values, 'Counts': counts},
+                'Requests': stats.requests,
+                'Errors': stats.errors,
+                'Retries': stats.retries,
+                'Throttles': stats.throttles,
+                'BytesIn': stats.bytes_in,
+                'BytesOut': stats.bytes_out,
+            }
+            self.writer(json.dumps(record))
+
+
+def instrument_client(
+    s3_client,
+    collector: MetricsCollector,
+    bucket: Optional[str] = None,
+) -> Callable[[], None]:
+    """
+    Record every API call of a client into a collector through botocore events.
+
+    Calls are timed from parameter validation to the parsed response, so the
+    latency includes retries and backoff. Managed transfers (upload_file,
+    download_file, ...) are covered through the calls they make. Handlers see
+    every call made with the client, so instrument a client of your own, not
+    one shared with code that should not be recorded (S3Helper creates a
+    dedicated client when given metrics).
+
+    :param s3_client: boto3 S3 client.
+    :param collector: Collector receiving the records.
+    :param bucket: Only record calls on this bucket (None for every bucket).
+    :return: Function unregistering the handlers (and releasing the collector).
+    """
+    events = s3_client.meta.events
+    unique_id = f"aje-metrics-{uuid.uuid4().hex}"
+
+    def on_start(params: Dict[str, Any], model, context: Dict[str, Any], **kwargs: Any) -> None:
+        target = params.get('Bucket')
+        if bucket is not None and target != bucket:
+            return
+        context.setdefault(_CONTEXT_KEY, {})[unique_id] = {
+            'bucket': target or '',
+            'operation': model.name,
+            'started_at': time.perf_counter(),
+            'throttles': 0,
+            'bytes_out': _body_size(params.get('Body')),
+        }
+
+    def on_retry_check(request_dict: Dict[str, Any], response=None, **kwargs: Any) -> None:
+        state = request_dict.get('context', {}).get(_CONTEXT_KEY, {}).get(unique_id)
+        if state is not None and response is not None and _error_code(response[1]) in THROTTLE_ERROR_CODES:
+            state['throttles'] += 1
+
+    def on_done(context: Dict[str, Any], parsed=None, exception=None, **kwargs: Any) -> None:
+        state = context.get(_CONTEXT_KEY, {}).pop(unique_id, None)
+        if state is None:
+            return
+        latency_ms = (time.perf_counter() - state['started_at']) * 1000
+        parsed = parsed or {}
+        error_code = _error_code(parsed) or (type(exception).__name__ if exception else None)
+        bytes_in = (parsed.get('ContentLength') or 0) if not error_code and 'Body' in parsed else 0
+        collector.record(
+            state['bucket'],
+            state['operation'],
+            latency_ms,
+            bytes_in=bytes_in,
+            bytes_out=state['bytes_out'],
+            retries=parsed.get('ResponseMetadata', {}).get('RetryAttempts', 0),
+            throttles=state['throttles'],
+            error_code=error_code,
+        )
+
+    handlers = [
+        ('before-parameter-build.s3', on_start, f"{unique_id}-start"),
+        ('needs-retry.s3', on_retry_check, f"{unique_id}-retry"),
+        ('after-call.s3', on_done, f"{unique_id}-done"),
+        ('after-call-error.s3', on_done, f"{unique_id}-error"),
+    ]
+    for event_name, handler, handler_id in handlers:
+        events.register(event_name, handler, unique_id=handler_id)
+
+    def unregister() -> None:
+        for event_name, handler, handler_id in handlers:
+            events.unregister(event_name, handler, unique_id=handler_id)
+
+    return unregister
+
+
+def _error_code(parsed: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not parsed:
+        return None
+    return parsed.get('Error', {}).get('Code')
+
+
+def _body_size(body: Any) -> int:
+    """Size in bytes of a request body, without consuming streams"""
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    try:
+        return len(body)
+    except TypeError:
+        pass
+    try:
+        position = body.tell()
+        body.seek(0, 2)
+        size = body.tell() - position
+        body.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def _write_stdout(line: str) -> None:
+    sys.stdout.write(line + '\n')
+    sys.stdout.flush()
@@ -0,0 +1,167 @@
+# src/aje_libs/common/helpers/s3/multipart_copy.py
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any
+from urllib.parse import urlencode
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .transfer import MB, part_size_for
+
+logger = custom_logger(__name__)
+
+# Objects above this size are copied with concurrent UploadPartCopy requests
+COPY_MULTIPART_THRESHOLD = 256 * MB
+DEFAULT_COPY_PART_SIZE = 128 * MB
+# Largest source a single copy_object request accepts
+MAX_SINGLE_COPY_SIZE = 5 * 1024 * MB
+
+# Attributes that a multipart copy does not carry over by itself
+_COPIED_HEADERS = (
+    'ContentType',
+    'CacheControl',
+    'ContentDisposition',
+    'ContentEncoding',
+    'ContentLanguage',
+    'Expires',
+    'Metadata',
+)
+
+
+def copy_create_args(
+    source_head: Dict[str, Any],
+    extra_args: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the object attributes for a copy destination.
+
+    Source headers and metadata are kept unless extra_args uses
+    MetadataDirective='REPLACE'; Tagging is only kept with
+    TaggingDirective='REPLACE' (source tags are copied by multipart_copy
+    otherwise). Other extra args (encryption, storage class) are passed through.
+
+    :param source_head: head_object response of the source object.
+    :param extra_args: Extra arguments given for the copy.
+    :return: Arguments for create_multipart_upload.
+    """
+    extra_args = dict(extra_args or {})
+    directive = extra_args.pop('MetadataDirective', 'COPY')
+    if extra_args.pop('TaggingDirective', 'COPY') != 'REPLACE':
+        extra_args.pop('Tagging', None)
+
+    create_args = {}
+    if directive != 'REPLACE':
+        create_args = {name: source_head[name] for name in _COPIED_HEADERS if source_head.get(name)}
+    create_args.update(extra_args)
+    return create_args
+
+
+def multipart_copy(
+    s3_client,
+    source_bucket: str,
+    source_key: str,
+    destination_bucket: str,
+    destination_key: str,
+    source_head: Optional[Dict[str, Any]] = None,
+    extra_args: Optional[Dict[str, Any]] = None,
+    part_size: int = DEFAULT_COPY_PART_SIZE,
+    max_workers: int = 8,
+) -> Dict[str, Any]:
+    """
+    Copy an object server side with concurrent UploadPartCopy byte ranges.
+
+    Works for objects of any size (single copy_object is limited to 5 GB); the
+    multipart upload is aborted if any part fails. Like copy_object, source
+    tags are copied unless extra_args uses TaggingDirective='REPLACE'.
+
+    :param s3_client: boto3 S3 client.
+    :param source_bucket: Source bucket.
+    :param source_key: Source object key.
+    :param destination_bucket: Destination bucket.
+    :param destination_key: Destination object key.
+    :param source_head: head_object response of the source (fetched if not given).
+    :param extra_args: Extra arguments for the destination object.
+    :param part_size: Preferred part size in bytes.
+    :param max_workers: Number of parts copied concurrently.
+    :return: complete_multipart_upload response.
+    """
+    if source_head is None:
+        source_head = s3_client.head_object(Bucket=source_bucket, Key=source_key)
+
+    size = source_head['ContentLength']
+    part_size = part_size_for(size, part_size)
+    copy_source = {'Bucket': source_bucket, 'Key': source_key}
+    if source_head.get('VersionId'):
+        copy_source['VersionId'] = source_head['VersionId']
+
+    create_args = copy_create_args(source_head, extra_args)
+    if (extra_args or {}).get('TaggingDirective', 'COPY') != 'REPLACE':
+        tagging = _source_tagging(s3_client, source_bucket, source_key, source_head.get('VersionId'))
+        if tagging:
+            create_args['Tagging'] = tagging
+
+    upload = s3_client.create_multipart_upload(
+        Bucket=destination_bucket,
+        Key=destination_key,
+        **create_args
+    )
+    upload_id = upload['UploadId']
+
+    ranges = [
+        (number, start, min(start + part_size, size) - 1)
+        for number, start in enumerate(range(0, max(size, 1), part_size), start=1)
+    ]
+    logger.info(
+        f"Multipart copy of {size} bytes in {len(ranges)} parts - "
+        f"Source: {source_bucket}/{source_key} | Destination: {destination_bucket}/{destination_key}"
+    )
+
+    def copy_part(part) -> Dict[str, Any]:
+        number, start, end = part
+        response = s3_client.upload_part_copy(
+            Bucket=destination_bucket,
+            Key=destination_key,
+            UploadId=upload_id,
+            PartNumber=number,
+            CopySource=copy_source,
+            CopySourceRange=f"bytes={start}-{end}",
+        )
+        return {'PartNumber': number, 'ETag': response['CopyPartResult']['ETag']}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parts: List[Dict[str, Any]] = list(executor.map(copy_part, ranges))
+        return s3_client.complete_multipart_upload(
+            Bucket=destination_bucket,
+            Key=destination_key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': parts},
+        )
+    except Exception as error:
+        logger.error(
+            f"Multipart copy failed, aborting upload {upload_id} - "
+            f"Destination: {destination_bucket}/{destination_key}"
+        )
+        try:
+            s3_client.abort_multipart_upload(
+                Bucket=destination_bucket, Key=destination_key, UploadId=upload_id
+            )
+        except ClientError:
+            logger.warning(f"Failed to abort multipart upload {upload_id}")
+        raise error
+
+
+def _source_tagging(s3_client, bucket: str, key: str, version_id: Optional[str]) -> Optional[str]:
+    """Tags of the source object as a Tagging header, None if it has none or they cannot be read"""
+    kwargs = {'Bucket': bucket, 'Key': key}
+    if version_id:
+        kwargs['VersionId'] = version_id
+    try:
+        tag_set = s3_client.get_object_tagging(**kwargs)['TagSet']
+    except ClientError as error:
+        logger.warning(
+            f"Could not read source tags, the copy will have none - Source: {bucket}/{key} | "
+            f"Error: {error.response['Error']['Code']}"
+        )
+        return None
+    return urlencode([(tag['Key'], tag['Value']) for tag in tag_set]) or None
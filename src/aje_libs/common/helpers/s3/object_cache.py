@@ -0,0 +1,318 @@
+# src/aje_libs/common/helpers/s3/object_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, BinaryIO
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .transfer import MB
+
+logger = custom_logger(__name__)
+
+DEFAULT_CACHE_DIR = "/tmp/aje_s3_cache"
+
+_NOT_MODIFIED_CODES = ('304', 'NotModified')
+
+
+class ObjectCache:
+    """Read-through cache of S3 objects with a memory tier and a size-bounded LRU disk tier."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = 512 * MB,
+        memory_max_bytes: int = 32 * MB,
+        memory_max_object_size: int = 1 * MB,
+        revalidate_after: Optional[float] = 60.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Entries are keyed by bucket and key and remember the ETag they were
+        fetched with. Within revalidate_after seconds of the last check an entry
+        is served without any request; after that it is revalidated with a
+        conditional If-None-Match GET, which only transfers the body if it changed.
+
+        :param cache_dir: Directory for cached files (Lambda: somewhere under /tmp).
+        :param max_bytes: Maximum total size of the disk tier.
+        :param memory_max_bytes: Maximum total size of the memory tier.
+        :param memory_max_object_size: Objects up to this size are also kept in memory.
+        :param revalidate_after: Seconds an entry is trusted without revalidation
+            (0 to always revalidate, None to never revalidate).
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_max_bytes = memory_max_bytes
+        self.memory_max_object_size = memory_max_object_size
+        self.revalidate_after = revalidate_after
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._memory: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._disk_bytes = 0
+        self._memory_bytes = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Rebuild the index from entries left on disk by previous processes"""
+        found = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.meta'):
+                continue
+            meta_path = os.path.join(self.cache_dir, name)
+            try:
+                with open(meta_path) as handle:
+                    meta = json.load(handle)
+                data_path = meta_path[:-len('.meta')]
+                found.append((os.path.getatime(data_path), meta, data_path))
+            except (OSError, ValueError):
+                continue
+
+        for _, meta, data_path in sorted(found, key=lambda item: item[0]):
+            entry = {
+                'etag': meta['etag'], 'encoding': meta.get('encoding'), 'size': meta['size'],
+                'path': data_path, 'validated_at': 0.0
+            }
+            self._entries[(meta['bucket'], meta['key'])] = entry
+            self._disk_bytes += meta['size']
+        self._evict()
+
+    def _paths(self, bucket: str, key: str) -> Tuple[str, str]:
+        digest = hashlib.sha256(f"{bucket}/{key}".encode('utf-8')).hexdigest()
+        data_path = os.path.join(self.cache_dir, digest)
+        return data_path, data_path + '.meta'
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        if self.revalidate_after is None:
+            return True
+        return time.time() - entry['validated_at'] < self.revalidate_after
+
+    def get_bytes(self, s3_client, bucket: str, key: str) -> bytes:
+        """
+        Get the object content, from memory, disk or S3.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket: Name of the S3 bucket.
+        :param key: Key name in S3.
+        :return: Object content.
+        """
+        return self.read(s3_client, bucket, key)[0]
+
+    def read(self, s3_client, bucket: str, key: str) -> Tuple[bytes, Optional[str]]:
+        """
+        Get the object content and the Content-Encoding it was stored with.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket: Name of the S3 bucket.
+        :param key: Key name in S3.
+        :return: Tuple of object content and Content-Encoding (None if absent).
+        """
+        cache_key = (bucket, key)
+        with self._lock:
+            data = self._memory.get(cache_key)
+            entry = self._entries.get(cache_key)
+            if data is not None and entry and self._is_fresh(entry):
+                self._touch(cache_key)
+                self.hits += 1
+                return data, entry['encoding']
+
+        handle, encoding = self.open(s3_client, bucket, key)
+        with handle:
+            data = handle.read()
+        self._remember(cache_key, data)
+        return data, encoding
+
+    def get_path(self, s3_client, bucket: str, key: str) -> str:
+        """
+        Get a local path holding the current object content.
+
+        The file can be evicted by later calls on the cache; use open() to read
+        it while other threads use the same cache.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket: Name of the S3 bucket.
+        :param key: Key name in S3.
+        :return: Path of the cached file (do not modify it).
+        """
+        handle, _ = self.open(s3_client, bucket, key)
+        handle.close()
+        return handle.name
+
+    def open(self, s3_client, bucket: str, key: str) -> Tuple[BinaryIO, Optional[str]]:
+        """
+        Open the cached copy of an object, fetching or revalidating it first.
+
+        The file is opened while the cache is locked, so the handle stays
+        readable even if a concurrent call evicts or replaces the entry.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket: Name of the S3 bucket.
+        :param key: Key name in S3.
+        :return: Tuple of binary file handle (closed by the caller) and Content-Encoding.
+        """
+        cache_key = (bucket, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry and not os.path.exists(entry['path']):
+                entry = None
+            if entry and self._is_fresh(entry):
+                self._touch(cache_key)
+                self.hits += 1
+                return open(entry['path'], 'rb'), entry['encoding']
+
+        kwargs = {'Bucket': bucket, 'Key': key}
+        if entry:
+            kwargs['IfNoneMatch'] = entry['etag']
+        try:
+            response = s3_client.get_object(**kwargs)
+        except ClientError as error:
+            if entry and error.response['Error']['Code'] in _NOT_MODIFIED_CODES:
+                with self._lock:
+                    if self._entries.get(cache_key) is entry:
+                        entry['validated_at'] = time.time()
+                        self._touch(cache_key)
+                        self.revalidations += 1
+                        return open(entry['path'], 'rb'), entry['encoding']
+                # Evicted or replaced while revalidating
+                return self.open(s3_client, bucket, key)
+            raise error
+
+        with self._lock:
+            self.misses += 1
+        return self._store(cache_key, response)
+
+    def content_encoding(self, bucket: str, key: str) -> Optional[str]:
+        """
+        Get the Content-Encoding the cached copy of an object was stored with.
+
+        :param bucket: Name of the S3 bucket.
+        :param key: Key name in S3.
+        :return: Content-Encoding or None if absent or not cached.
+        """
+        with self._lock:
+            entry = self._entries.get((bucket, key))
+            return entry.get('encoding') if entry else None
+
+    def _store(self, cache_key: Tuple[str, str], response: Dict[str, Any]) -> Tuple[BinaryIO, Optional[str]]:
+        """Write a get_object response body to disk atomically, index it and open it"""
+        bucket, key = cache_key
+        data_path, meta_path = self._paths(bucket, key)
+        handle, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.part')
+        size = 0
+        small = bytearray()
+        try:
+            with os.fdopen(handle, 'wb') as output:
+                for chunk in response['Body'].iter_chunks(chunk_size=1 * MB):
+                    output.write(chunk)
+                    size += len(chunk)
+                    if size <= self.memory_max_object_size:
+                        small += chunk
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        etag = response.get('ETag')
+        encoding = response.get('ContentEncoding')
+        with self._lock:
+            # Moved into place under the lock, so evicting the previous entry
+            # of this key in another thread cannot delete the new file
+            os.replace(temp_path, data_path)
+            with open(meta_path, 'w') as meta:
+                json.dump({'bucket': bucket, 'key': key, 'etag': etag, 'encoding': encoding, 'size': size}, meta)
+            previous = self._entries.pop(cache_key, None)
+            if previous:
+                self._disk_bytes -= previous['size']
+            self._forget_memory(cache_key)
+            self._entries[cache_key] = {
+                'etag': etag, 'encoding': encoding, 'size': size, 'path': data_path, 'validated_at': time.time()
+            }
+            self._disk_bytes += size
+            self._evict(keep=cache_key)
+            stored = open(data_path, 'rb')
+        if size <= self.memory_max_object_size:
+            self._remember(cache_key, bytes(small))
+        return stored, encoding
+
+    def _remember(self, cache_key: Tuple[str, str], data: bytes) -> None:
+        """Keep a small object in the memory tier"""
+        if len(data) > self.memory_max_object_size:
+            return
+        with self._lock:
+            if cache_key not in self._entries:
+                return
+            self._forget_memory(cache_key)
+            self._memory[cache_key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.memory_max_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _forget_memory(self, cache_key: Tuple[str, str]) -> None:
+        data = self._memory.pop(cache_key, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+
+    def _touch(self, cache_key: Tuple[str, str]) -> None:
+        self._entries.move_to_end(cache_key)
+        if cache_key in self._memory:
+            self._memory.move_to_end(cache_key)
+
+    def _evict(self, keep: Optional[Tuple[str, str]] = None) -> None:
+        """Remove least recently used entries until the disk tier fits max_bytes"""
+        while self._disk_bytes > self.max_bytes and self._entries:
+            cache_key, entry = next(iter(self._entries.items()))
+            if cache_key == keep:
+                break
+            self._entries.pop(cache_key)
+            self._forget_memory(cache_key)
+            self._disk_bytes -= entry['size']
+            for path in (entry['path'], entry['path'] + '.meta'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            logger.debug(f"Evicted cached object: s3://{cache_key[0]}/{cache_key[1]}")
+
+    def invalidate(self, bucket: str, key: str) -> None:
+        """
+        Drop an object from both tiers.
+
+        :param bucket: Name of the S3 bucket.
+        :param key: Key name in S3.
+        """
+        with self._lock:
+            entry = self._entries.pop((bucket, key), None)
+            self._forget_memory((bucket, key))
+            if entry:
+                self._disk_bytes -= entry['size']
+                for path in (entry['path'], entry['path'] + '.meta'):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        :return: Dict with hits, revalidations, misses and tier sizes.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'revalidations': self.revalidations,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'disk_bytes': self._disk_bytes,
+                'memory_bytes': self._memory_bytes,
+            }
@@ -0,0 +1,267 @@
+# src/aje_libs/common/helpers/s3/parallel_listing.py
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Iterator, Tuple
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .concurrency import put_until_stopped
+
+logger = custom_logger(__name__)
+
+# Characters used to split a prefix into lexicographic ranges when no
+# explicit boundaries are given (ordered by code point, as S3 sorts keys)
+DEFAULT_SHARD_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+_DONE = object()
+
+
+class ParallelLister:
+    """Lists a bucket prefix on a thread pool by splitting the keyspace into shards."""
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        max_workers: int = 16,
+        queue_pages: int = 4,
+    ) -> None:
+        """
+        Initialize the parallel lister.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket_name: Name of the S3 bucket.
+        :param max_workers: Number of shards listed concurrently.
+        :param queue_pages: Pages buffered per shard ahead of the consumer.
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.max_workers = max_workers
+        self.queue_pages = queue_pages
+
+    def iter_objects(
+        self,
+        prefix: Optional[str] = None,
+        strategy: str = 'delimiter',
+        delimiter: str = '/',
+        depth: int = 1,
+        boundaries: Optional[List[str]] = None,
+        shards: int = 16,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every object under the prefix in key order, listing shards concurrently.
+
+        :param prefix: Prefix to list.
+        :param strategy: 'delimiter' to shard by common prefixes, 'range' to shard by StartAfter ranges.
+        :param delimiter: Delimiter used to discover prefixes ('delimiter' strategy).
+        :param depth: Number of delimiter levels expanded into shards ('delimiter' strategy).
+        :param boundaries: Explicit split keys ('range' strategy, defaults to an alphanumeric split).
+        :param shards: Number of shards when boundaries are generated ('range' strategy).
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages retrieved (None for all). When set, the
+            prefix is listed serially so the result is always its first max_pages pages.
+        :return: Iterator of object metadata ordered by key.
+        """
+        prefix = prefix or ''
+        if strategy not in ('delimiter', 'range'):
+            raise ValueError(f"Unsupported listing strategy: {strategy}")
+        if max_pages:
+            # Concurrent shards would race for a shared page budget and return a
+            # different subset of keys on every run
+            logger.info(f"Listing s3://{self.bucket_name}/{prefix} serially - Max pages: {max_pages}")
+            yield from self._iter_shard(('range', prefix, None, None), max_keys, max_pages)
+            return
+
+        if strategy == 'delimiter':
+            plan = self._plan_delimiter_shards(prefix, delimiter, depth, max_keys)
+        else:
+            plan = self._plan_range_shards(prefix, boundaries or _default_boundaries(prefix, shards))
+
+        logger.info(
+            f"Listing s3://{self.bucket_name}/{prefix} in parallel - "
+            f"Strategy: {strategy} | Shards: {len(plan)}"
+        )
+        yield from self._run(plan, max_keys)
+
+    def iter_prefixes(self, prefixes: List[str], max_keys: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every object under each of the given prefixes, listing them concurrently.
+
+        Objects come out prefix by prefix, in the order the prefixes are given.
+        Pages are streamed through bounded queues, so at most max_workers *
+        queue_pages pages are held in memory however large a prefix is.
+
+        :param prefixes: Prefixes to list (they should not overlap).
+        :param max_keys: Maximum number of keys per request.
+        :return: Iterator of object metadata.
+        """
+        plan = [('range', prefix, None, None) for prefix in prefixes]
+        yield from self._run(plan, max_keys)
+
+    def _plan_range_shards(self, prefix: str, boundaries: List[str]) -> List[Tuple]:
+        """
+        Build shards covering (boundary[i - 1], boundary[i]] ranges of the prefix.
+
+        Each shard starts after the previous boundary and stops once a key passes
+        its own, so together they cover the keyspace exactly once.
+        """
+        boundaries = sorted({b for b in boundaries if b.startswith(prefix) and b > prefix})
+        plan = []
+        lower = None
+        for upper in boundaries + [None]:
+            plan.append(('range', prefix, lower, upper))
+            lower = upper
+        return plan
+
+    def _plan_delimiter_shards(
+        self,
+        prefix: str,
+        delimiter: str,
+        depth: int,
+        max_keys: int,
+    ) -> List[Tuple]:
+        """
+        Expand delimiter prefixes level by level and build one shard per prefix.
+
+        Objects found above the final level are kept as in-memory shards so that
+        the merged stream stays in key order.
+        """
+        entries: List[Tuple[str, Tuple]] = []
+        level = [prefix]
+        for current_depth in range(depth):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(
+                    lambda p: self._list_level(p, delimiter, max_keys), level
+                ))
+            level = []
+            for objects, prefixes in results:
+                for obj in objects:
+                    entries.append((obj['Key'], ('objects', [obj])))
+                level.extend(prefixes)
+            if not level:
+                break
+
+        for sub_prefix in level:
+            entries.append((sub_prefix, ('range', sub_prefix, None, None)))
+
+        # Prefix shards and loose objects never overlap, so sorting by their
+        # first key orders the concatenated stream
+        entries.sort(key=lambda entry: entry[0])
+        plan: List[Tuple] = []
+        for _, shard in entries:
+            if shard[0] == 'objects' and plan and plan[-1][0] == 'objects':
+                plan[-1][1].extend(shard[1])
+            else:
+                plan.append(shard)
+        return plan
+
+    def _list_level(
+        self,
+        prefix: str,
+        delimiter: str,
+        max_keys: int,
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """List one delimiter level returning its objects and sub-prefixes"""
+        objects, prefixes = [], []
+        kwargs = {'Bucket': self.bucket_name, 'Delimiter': delimiter, 'MaxKeys': max_keys}
+        if prefix:
+            kwargs['Prefix'] = prefix
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(**kwargs):
+            objects.extend(page.get('Contents', []))
+            prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        return objects, prefixes
+
+    def _run(self, plan: List[Tuple], max_keys: int) -> Iterator[Dict[str, Any]]:
+        """Run range shards on the pool and concatenate them in plan order"""
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=self.queue_pages) for _ in plan]
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            # Shards are submitted in key order, so the shard the consumer is
+            # waiting for always holds a worker and bounded queues cannot deadlock
+            for shard, shard_queue in zip(plan, queues):
+                if shard[0] == 'range':
+                    executor.submit(
+                        self._list_shard, shard, max_keys, shard_queue, stop
+                    )
+
+            for shard, shard_queue in zip(plan, queues):
+                if shard[0] == 'objects':
+                    yield from shard[1]
+                    continue
+                while True:
+                    item = shard_queue.get()
+                    if item is _DONE:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield from item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list_shard(
+        self,
+        shard: Tuple,
+        max_keys: int,
+        shard_queue: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """List a single shard and push its pages to the shard queue"""
+        try:
+            for objects in self._iter_shard_pages(shard, max_keys):
+                if stop.is_set():
+                    break
+                put_until_stopped(shard_queue, objects, stop)
+        except Exception as error:
+            put_until_stopped(shard_queue, error, stop)
+        put_until_stopped(shard_queue, _DONE, stop)
+
+    def _iter_shard(
+        self,
+        shard: Tuple,
+        max_keys: int,
+        max_pages: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """List a single shard in the calling thread, stopping after max_pages"""
+        for page_count, objects in enumerate(self._iter_shard_pages(shard, max_keys), 1):
+            yield from objects
+            if page_count >= max_pages:
+                logger.info(f"Reached maximum page limit of {max_pages}")
+                break
+
+    def _iter_shard_pages(self, shard: Tuple, max_keys: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the object pages of a shard, stopping at its upper boundary"""
+        _, prefix, lower, upper = shard
+        kwargs = {'Bucket': self.bucket_name, 'MaxKeys': max_keys}
+        if prefix:
+            kwargs['Prefix'] = prefix
+        if lower:
+            kwargs['StartAfter'] = lower
+
+        try:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(**kwargs):
+                objects = page.get('Contents', [])
+                if upper is not None and objects and objects[-1]['Key'] > upper:
+                    yield [obj for obj in objects if obj['Key'] <= upper]
+                    return
+                yield objects
+        except ClientError as error:
+            logger.error(
+                f"Failed to list shard - Bucket: {self.bucket_name} | Prefix: {prefix} | "
+                f"StartAfter: {lower} | Error: {error.response['Error']['Code']}"
+            )
+            raise error
+
+
+def _default_boundaries(prefix: str, shards: int) -> List[str]:
+    """Split the prefix keyspace into evenly spaced alphanumeric ranges"""
+    shards = max(1, min(shards, len(DEFAULT_SHARD_ALPHABET)))
+    step = len(DEFAULT_SHARD_ALPHABET) / shards
+    return [prefix + DEFAULT_SHARD_ALPHABET[int(i * step)] for i in range(1, shards)]
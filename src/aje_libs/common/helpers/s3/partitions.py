@@ -0,0 +1,101 @@
+# src/aje_libs/common/helpers/s3/partitions.py
+import calendar
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, List, Union
+
+# Named key layouts of date-partitioned prefixes ({year}, {month}, {day} placeholders)
+PARTITION_LAYOUTS = {
+    'hive': 'year={year:04d}/month={month:02d}/day={day:02d}/',
+    'hive_unpadded': 'year={year}/month={month}/day={day}/',
+    'path': '{year:04d}/{month:02d}/{day:02d}/',
+}
+
+
+class PartitionTemplate:
+    """Date partition layout that can render day, month and year sub-prefixes."""
+
+    def __init__(self, layout: str = 'hive') -> None:
+        """
+        Initialize the template.
+
+        :param layout: 'hive' (year=YYYY/month=MM/day=DD/), 'hive_unpadded'
+            (year=YYYY/month=M/day=D/), 'path' (YYYY/MM/DD/) or a custom format
+            string with {year}, {month} and {day} placeholders.
+        """
+        self.template = PARTITION_LAYOUTS.get(layout, layout)
+        for field in ('{year', '{month', '{day'):
+            if field not in self.template:
+                raise ValueError(f"Partition layout is missing a {field}}} placeholder: {layout}")
+
+        year_at = self.template.index('{year')
+        month_at = self.template.index('{month')
+        day_at = self.template.index('{day')
+        # Whole months (years) collapse into one prefix when the day (month)
+        # field is the last varying part of the key
+        self.month_template = _cut_before(self.template, day_at, month_at) if year_at < month_at < day_at else None
+        self.year_template = _cut_before(self.template, month_at, year_at) if self.month_template else None
+
+    def day_prefix(self, day: date) -> str:
+        return self.template.format(year=day.year, month=day.month, day=day.day)
+
+    def month_prefix(self, day: date) -> str:
+        return self.month_template.format(year=day.year, month=day.month)
+
+    def year_prefix(self, day: date) -> str:
+        return self.year_template.format(year=day.year)
+
+
+def partition_prefixes(
+    prefix: str,
+    start_date: Union[str, date],
+    end_date: Optional[Union[str, date]] = None,
+    layout: str = 'hive',
+) -> List[str]:
+    """
+    Expand a date range into the sub-prefixes of a date-partitioned layout.
+
+    Whole years and months inside the range collapse into a single year or
+    month prefix, so long ranges stay a handful of listings while a one-day
+    range lists exactly one day.
+
+    :param prefix: Prefix the partitions live under (e.g. 'sales/').
+    :param start_date: First day in ISO format (inclusive).
+    :param end_date: Last day in ISO format (inclusive, defaults to today in UTC).
+    :param layout: Partition layout (see PartitionTemplate).
+    :return: Sub-prefixes in chronological order.
+    """
+    template = PartitionTemplate(layout)
+    start = _to_date(start_date)
+    end = _to_date(end_date) if end_date else datetime.now(timezone.utc).date()
+    if prefix and not prefix.endswith('/'):
+        prefix = f"{prefix}/"
+
+    prefixes = []
+    current = start
+    while current <= end:
+        year_end = date(current.year, 12, 31)
+        month_end = date(current.year, current.month, calendar.monthrange(current.year, current.month)[1])
+        if template.year_template and current.month == 1 and current.day == 1 and year_end <= end:
+            prefixes.append(prefix + template.year_prefix(current))
+            current = year_end + timedelta(days=1)
+        elif template.month_template and current.day == 1 and month_end <= end:
+            prefixes.append(prefix + template.month_prefix(current))
+            current = month_end + timedelta(days=1)
+        else:
+            prefixes.append(prefix + template.day_prefix(current))
+            current += timedelta(days=1)
+    return prefixes
+
+
+def _cut_before(template: str, field_at: int, previous_at: int) -> str:
+    """Template up to a field, ending at a '/' when one follows the previous field"""
+    slash = template.rfind('/', previous_at, field_at)
+    return template[:slash + 1] if slash != -1 else template[:field_at]
+
+
+def _to_date(value: Union[str, date]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.fromisoformat(value).date()
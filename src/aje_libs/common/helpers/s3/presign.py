@@ -0,0 +1,242 @@
+# src/aje_libs/common/helpers/s3/presign.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Iterable, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+from botocore.auth import HmacV1QueryAuth, S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.utils import percent_encode
+
+from ...logger import custom_logger
+
+logger = custom_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+
+# Placeholder key used to resolve the endpoint, addressing style and signing region once per batch
+_TEMPLATE_KEY = '__aje_presign_template__'
+
+# Tries of the parity check, for when the two signatures straddle a second boundary
+_PARITY_ATTEMPTS = 3
+
+# HTTP verb of the operations that can be signed without going through the client
+_FAST_PATH_METHODS = {
+    'get_object': 'GET',
+    'put_object': 'PUT',
+    'head_object': 'HEAD',
+    'delete_object': 'DELETE',
+}
+
+
+class PresignCache:
+    """Thread-safe LRU cache of presigned URLs that are still comfortably valid."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, min_remaining: float = 0.5) -> None:
+        """
+        Initialize the cache.
+
+        Entries are keyed by method, bucket, key and requested expiration. A URL is
+        reused while at least min_remaining of its lifetime is left, so callers
+        always receive a URL valid for at least that fraction of what they asked for.
+        A URL is also only reused while the same access key signs new URLs: once
+        temporary credentials rotate, URLs signed with the old ones are dropped.
+
+        :param max_entries: Maximum number of cached URLs.
+        :param min_remaining: Fraction (0-1) of the requested expiration a cached URL must still have.
+        """
+        self.max_entries = max_entries
+        self.min_remaining = min_remaining
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, str, int], Tuple[str, float, Optional[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        http_method: str,
+        bucket: str,
+        key: str,
+        expiration: int,
+        access_key: Optional[str] = None,
+    ) -> Optional[str]:
+        cache_key = (http_method, bucket, key, expiration)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if (
+                entry is not None
+                and entry[1] - time.time() >= expiration * self.min_remaining
+                and entry[2] == access_key
+            ):
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[cache_key]
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        http_method: str,
+        bucket: str,
+        key: str,
+        expiration: int,
+        url: str,
+        expires_at: float,
+        access_key: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._entries[(http_method, bucket, key, expiration)] = (url, expires_at, access_key)
+            self._entries.move_to_end((http_method, bucket, key, expiration))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached URL (e.g. after rotating credentials)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        :return: Dict with hits, misses and cached entries.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries)}
+
+
+class _BatchSigner:
+    """Query-string signer for many keys of one bucket, checked against a client-generated URL"""
+
+    def __init__(self, s3_client, frozen, bucket: str, http_method: str, expiration: int) -> None:
+        self.available = False
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.http_method = http_method
+        self.expiration = expiration
+        verb = _FAST_PATH_METHODS.get(http_method)
+        if verb is None or frozen is None:
+            return
+
+        template = self._client_url()
+        parts = urlsplit(template)
+        query = parse_qs(parts.query)
+        if not parts.path.endswith(_TEMPLATE_KEY):
+            # Unexpected URL layout, let the client sign every key
+            return
+
+        self.verb = verb
+        self.base_url = f"{parts.scheme}://{parts.netloc}{parts.path[:-len(_TEMPLATE_KEY)]}"
+        self.auth_prefix = None
+        scope = query.get('X-Amz-Credential', [''])[0].split('/')
+        if len(scope) == 5:
+            self.auth = S3SigV4QueryAuth(frozen, scope[3], scope[2], expires=expiration)
+            self.timestamp_param = 'X-Amz-Date'
+        elif 'AWSAccessKeyId' in query:
+            self.auth = HmacV1QueryAuth(frozen, expires=expiration)
+            self.timestamp_param = 'Expires'
+            if not parts.path.startswith(f"/{bucket}/"):
+                # Virtual-hosted URLs still sign the bucket as part of the resource
+                self.auth_prefix = f"/{bucket}{parts.path[:-len(_TEMPLATE_KEY)]}"
+        else:
+            return
+
+        self.available = self._matches_client()
+        if not self.available:
+            logger.warning(f"Local presigning does not match the client for bucket {bucket}, signing per key")
+
+    def _client_url(self) -> str:
+        return self.s3_client.generate_presigned_url(
+            self.http_method, Params={'Bucket': self.bucket, 'Key': _TEMPLATE_KEY}, ExpiresIn=self.expiration
+        )
+
+    def _matches_client(self) -> bool:
+        """Sign the template key both ways and require the same URL, up to parameter order"""
+        for _ in range(_PARITY_ATTEMPTS):
+            local_url = _normalize_url(self.sign(_TEMPLATE_KEY))
+            client_url = _normalize_url(self._client_url())
+            if local_url == client_url:
+                return True
+            if local_url[3].get(self.timestamp_param) == client_url[3].get(self.timestamp_param):
+                # Same signing time and still different: the client signs another way
+                return False
+        return False
+
+    def sign(self, key: str) -> str:
+        encoded_key = percent_encode(key, safe='/~')
+        request = AWSRequest(method=self.verb, url=self.base_url + encoded_key)
+        if self.auth_prefix is not None:
+            request.auth_path = self.auth_prefix + encoded_key
+        self.auth.add_auth(request)
+        return request.prepare().url
+
+
+def _normalize_url(url: str) -> Tuple[str, str, str, Dict[str, List[str]]]:
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc, parts.path, parse_qs(parts.query)
+
+
+def presign_batch(
+    s3_client,
+    bucket: str,
+    keys: Iterable[str],
+    expiration: int = 3600,
+    http_method: str = 'get_object',
+    cache: Optional[PresignCache] = None,
+    credentials=None,
+) -> Dict[str, str]:
+    """
+    Generate presigned URLs for many keys of a bucket.
+
+    With credentials, the endpoint, addressing style and signing region are
+    resolved once per batch and each key is then signed locally, skipping the
+    per-call event and endpoint resolution of generate_presigned_url. Before
+    it is used, the local signer must produce the URL the client generates for
+    a sample key (query parameters in any order); otherwise, and for methods or
+    signature versions it does not handle, every key goes through
+    generate_presigned_url.
+
+    :param s3_client: boto3 S3 client.
+    :param bucket: Name of the S3 bucket.
+    :param keys: Keys to sign.
+    :param expiration: Expiration time in seconds.
+    :param http_method: Client method (get_object, put_object, head_object or delete_object
+        use the local signer, other methods are signed by the client).
+    :param cache: Cache of still-valid URLs (optional).
+    :param credentials: Credentials the client signs with, from session.get_credentials()
+        (optional, every key is signed by the client if not given).
+    :return: Dict mapping each key to its presigned URL.
+    """
+    # One credentials snapshot for the whole batch instead of one per URL
+    frozen = credentials.get_frozen_credentials() if credentials is not None else None
+    access_key = frozen.access_key if frozen is not None else None
+
+    urls: Dict[str, str] = {}
+    pending: List[str] = []
+    for key in dict.fromkeys(keys):
+        url = cache.get(http_method, bucket, key, expiration, access_key) if cache else None
+        if url is not None:
+            urls[key] = url
+        else:
+            pending.append(key)
+    if not pending:
+        return urls
+
+    signer = _BatchSigner(s3_client, frozen, bucket, http_method, expiration)
+    for key in pending:
+        expires_at = time.time() + expiration
+        if signer.available:
+            url = signer.sign(key)
+        else:
+            url = s3_client.generate_presigned_url(
+                http_method, Params={'Bucket': bucket, 'Key': key}, ExpiresIn=expiration
+            )
+        urls[key] = url
+        if cache:
+            cache.put(http_method, bucket, key, expiration, url, expires_at, access_key)
+
+    logger.debug(f"Presigned {len(pending)} URLs ({len(urls) - len(pending)} from cache) for bucket {bucket}")
+    return urls
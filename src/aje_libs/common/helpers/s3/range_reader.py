@@ -0,0 +1,202 @@
+# src/aje_libs/common/helpers/s3/range_reader.py
+import io
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Tuple
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .transfer import MB
+
+logger = custom_logger(__name__)
+
+DEFAULT_BLOCK_SIZE = 1 * MB
+DEFAULT_CACHE_BLOCKS = 32
+DEFAULT_READAHEAD_BLOCKS = 4
+
+
+class S3RangeReader(io.RawIOBase):
+    """Seekable, read-only file object over an S3 object backed by HTTP Range GETs."""
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        object_key: str,
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_blocks: int = DEFAULT_CACHE_BLOCKS,
+        readahead_blocks: int = DEFAULT_READAHEAD_BLOCKS,
+    ) -> None:
+        """
+        Initialize the reader.
+
+        Reads are served from a block cache. Missing adjacent blocks are fetched
+        with a single Range GET, and sequential access extends the request with
+        readahead blocks.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket_name: Name of the S3 bucket.
+        :param object_key: Key name in S3.
+        :param size: Object size in bytes (fetched with head_object if not given).
+        :param etag: Object ETag; ranges are requested with If-Match so a concurrent
+            overwrite fails instead of mixing versions (fetched with head_object if not given).
+        :param block_size: Size in bytes of each cached block.
+        :param cache_blocks: Maximum number of blocks kept in memory.
+        :param readahead_blocks: Extra blocks fetched when reads are sequential.
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        if size is None or etag is None:
+            head = s3_client.head_object(Bucket=bucket_name, Key=object_key)
+            size = head['ContentLength'] if size is None else size
+            etag = head.get('ETag') if etag is None else etag
+        self.size = size
+        self.etag = etag
+        self.block_size = block_size
+        self.cache_blocks = max(cache_blocks, 1)
+        self.readahead_blocks = readahead_blocks
+        self._position = 0
+        self._last_block = None
+        self._blocks: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if size is None or size < 0:
+            size = self.size - self._position
+        end = min(self._position + size, self.size)
+        if end <= self._position:
+            return b""
+        data = self.read_range(self._position, end)
+        self._position = end
+        return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read_range(self, start: int, end: int) -> bytes:
+        """
+        Read bytes [start, end) without moving the file position.
+
+        :param start: First byte offset.
+        :param end: Offset after the last byte.
+        :return: Requested bytes.
+        """
+        first_block = start // self.block_size
+        last_block = (end - 1) // self.block_size
+        with self._lock:
+            self._ensure_blocks(first_block, last_block)
+            blocks = [self._blocks[index] for index in range(first_block, last_block + 1)]
+            for index in range(first_block, last_block + 1):
+                self._blocks.move_to_end(index)
+            # Evict only after collecting, a single read may span more blocks than the cache holds
+            while len(self._blocks) > self.cache_blocks:
+                self._blocks.popitem(last=False)
+            self._last_block = last_block
+
+        data = b"".join(blocks)
+        offset = start - first_block * self.block_size
+        return data[offset:offset + end - start]
+
+    def _ensure_blocks(self, first_block: int, last_block: int) -> None:
+        """Fetch the missing blocks of a read, coalescing adjacent ones"""
+        missing = [i for i in range(first_block, last_block + 1) if i not in self._blocks]
+        if not missing:
+            return
+
+        # Sequential access extends the last request with readahead blocks
+        total_blocks = (self.size + self.block_size - 1) // self.block_size
+        if self._last_block is not None and first_block <= self._last_block + 1:
+            stop = min(last_block + self.readahead_blocks, total_blocks - 1)
+            missing.extend(
+                i for i in range(last_block + 1, stop + 1) if i not in self._blocks
+            )
+
+        for run_start, run_end in _contiguous_runs(missing):
+            self._fetch(run_start, run_end)
+
+    def _fetch(self, first_block: int, last_block: int) -> None:
+        start = first_block * self.block_size
+        end = min((last_block + 1) * self.block_size, self.size) - 1
+        kwargs = {
+            'Bucket': self.bucket_name,
+            'Key': self.object_key,
+            'Range': f"bytes={start}-{end}",
+        }
+        if self.etag:
+            kwargs['IfMatch'] = self.etag
+        try:
+            data = self.s3_client.get_object(**kwargs)['Body'].read()
+        except ClientError as error:
+            logger.error(
+                f"Failed to read range - Bucket: {self.bucket_name} | Key: {self.object_key} | "
+                f"Range: {start}-{end} | Error: {error.response['Error']['Code']}"
+            )
+            raise error
+
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        for index in range(first_block, last_block + 1):
+            offset = (index - first_block) * self.block_size
+            self._blocks[index] = data[offset:offset + self.block_size]
+            self._blocks.move_to_end(index)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get request statistics of the reader.
+
+        :return: Dict with requests issued, bytes fetched and object size.
+        """
+        return {
+            'requests': self.requests,
+            'bytes_fetched': self.bytes_fetched,
+            'size': self.size,
+            'cached_blocks': len(self._blocks),
+        }
+
+
+def _contiguous_runs(indexes: List[int]) -> List[Tuple[int, int]]:
+    """Group block indexes into (first, last) runs of consecutive blocks"""
+    runs = []
+    for index in sorted(set(indexes)):
+        if runs and index == runs[-1][1] + 1:
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    return [(first, last) for first, last in runs]
@@ -0,0 +1,139 @@
+# src/aje_libs/common/helpers/s3/ranged_download.py
+import io
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Deque
+
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+
+logger = custom_logger(__name__)
+
+
+class RangedDownloadStream(io.RawIOBase):
+    """Readable stream over an S3 object fetched as parallel Range GETs of TransferConfig parts."""
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        object_key: str,
+        transfer_config: TransferConfig,
+        extra_args: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """
+        Initialize the stream and issue the GET of the first part.
+
+        The first response carries the object headers (Content-Encoding, ETag,
+        total size), so callers can decide how to decode the stream without a
+        HEAD request. Following parts are fetched on a thread pool with If-Match
+        while earlier ones are read; at most twice max_concurrency parts are
+        buffered.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket_name: Name of the S3 bucket.
+        :param object_key: Key name in S3.
+        :param transfer_config: Part size and concurrency of the download.
+        :param extra_args: Extra get_object arguments (VersionId, SSECustomerKey, ...).
+        :param callback: Progress callback receiving stored bytes as they are read.
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        self.extra_args = dict(extra_args or {})
+        self.callback = callback
+        self.part_size = transfer_config.multipart_chunksize
+        max_workers = transfer_config.max_concurrency if transfer_config.use_threads else 1
+        self._max_buffered = max(1, min(transfer_config.max_in_memory_download_chunks, max_workers * 2))
+        self._max_workers = max_workers
+
+        self.etag = None
+        self.response = self._first_part()
+        self.etag = self.response.get('ETag')
+        self.content_encoding = self.response.get('ContentEncoding')
+        self.size = _total_size(self.response)
+        self._current = self.response['Body']
+        self._next_offset = self.response['ContentLength']
+        self._pending: Deque[Future] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._schedule()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        while True:
+            data = self._current.read(len(buffer))
+            if data:
+                buffer[:len(data)] = data
+                if self.callback:
+                    self.callback(len(data))
+                return len(data)
+            if not self._pending:
+                return 0
+            self._current = io.BytesIO(self._pending.popleft().result())
+            self._schedule()
+
+    def close(self) -> None:
+        if not self.closed:
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._current.close()
+        super().close()
+
+    def _first_part(self) -> Dict[str, Any]:
+        try:
+            return self._get(f"bytes=0-{self.part_size - 1}")
+        except ClientError as error:
+            # Empty objects cannot satisfy any range
+            if error.response['Error']['Code'] != 'InvalidRange':
+                raise error
+            return self._get(None)
+
+    def _schedule(self) -> None:
+        """Submit part GETs until the buffer window is full"""
+        while self._next_offset < self.size and len(self._pending) < self._max_buffered:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            start = self._next_offset
+            end = min(start + self.part_size, self.size) - 1
+            self._pending.append(self._executor.submit(self._read_part, start, end))
+            self._next_offset = end + 1
+
+    def _read_part(self, start: int, end: int) -> bytes:
+        return self._get(f"bytes={start}-{end}")['Body'].read()
+
+    def _get(self, byte_range: Optional[str]) -> Dict[str, Any]:
+        kwargs = dict(self.extra_args, Bucket=self.bucket_name, Key=self.object_key)
+        if byte_range:
+            kwargs['Range'] = byte_range
+        if self.etag:
+            kwargs['IfMatch'] = self.etag
+        try:
+            return self.s3_client.get_object(**kwargs)
+        except ClientError as error:
+            if error.response['Error']['Code'] != 'InvalidRange':
+                logger.error(
+                    f"Failed to download range - Bucket: {self.bucket_name} | Key: {self.object_key} | "
+                    f"Range: {byte_range} | Error: {error.response['Error']['Code']}"
+                )
+            raise error
+
+
+def _total_size(response: Dict[str, Any]) -> int:
+    """Object size from the Content-Range of a ranged GET ('bytes 0-99/1234')"""
+    content_range = response.get('ContentRange')
+    if content_range and '/' in content_range:
+        total = content_range.rsplit('/', 1)[1]
+        if total != '*':
+            return int(total)
+    return response['ContentLength']
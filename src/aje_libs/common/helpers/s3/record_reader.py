@@ -0,0 +1,195 @@
+# src/aje_libs/common/helpers/s3/record_reader.py
+import csv
+import io
+import json
+from typing import Optional, Dict, List, Any, Iterator, Tuple, Union
+
+from ...logger import custom_logger
+from .codecs import open_decompressed, codec_from_encoding
+
+logger = custom_logger(__name__)
+
+_STREAM_BUFFER_SIZE = 1024 * 1024
+
+_COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.zst': 'zstd',
+    '.zstd': 'zstd',
+    '.lz4': 'lz4',
+}
+
+_FORMAT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.tsv': 'csv',
+    '.tab': 'csv',
+    '.txt': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.json': 'json',
+}
+
+# Delimiters of the csv-format extensions that are not comma separated
+_DELIMITER_EXTENSIONS = {
+    '.tsv': '\t',
+    '.tab': '\t',
+}
+
+# Bytes peeked at a time while looking for the first character of a JSON document
+_SNIFF_SIZE = 64 * 1024
+
+
+class _BodyStream(io.RawIOBase):
+    """Raw stream adapter over a botocore StreamingBody (or any object with read(n))"""
+
+    def __init__(self, body) -> None:
+        super().__init__()
+        self._body = body
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._body.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if hasattr(self._body, 'close'):
+            self._body.close()
+        super().close()
+
+
+def infer_compression(object_key: str, content_encoding: Optional[str] = None) -> Optional[str]:
+    """
+    Infer the compression codec from the Content-Encoding or the key extension.
+
+    :param object_key: Key name in S3.
+    :param content_encoding: Content-Encoding header of the object (optional).
+    :return: 'gzip', 'zstd', 'lz4' or None.
+    """
+    codec = codec_from_encoding(content_encoding)
+    if codec:
+        return codec
+    for extension, codec in _COMPRESSION_EXTENSIONS.items():
+        if object_key.lower().endswith(extension):
+            return codec
+    return None
+
+
+def infer_format(object_key: str) -> str:
+    """
+    Infer the record format from the key extension, ignoring compression suffixes.
+
+    :param object_key: Key name in S3.
+    :return: 'csv', 'json' or 'jsonl'.
+    """
+    key = _strip_compression(object_key.lower())
+    for extension, record_format in _FORMAT_EXTENSIONS.items():
+        if key.endswith(extension):
+            return record_format
+    raise ValueError(f"Cannot infer record format from key: {object_key}")
+
+
+def infer_delimiter(object_key: str) -> Optional[str]:
+    """
+    Infer the field delimiter of a delimited text object from its key extension.
+
+    :param object_key: Key name in S3.
+    :return: Delimiter for tab-separated extensions ('.tsv', '.tab'), None for the comma default.
+    """
+    key = _strip_compression(object_key.lower())
+    for extension, delimiter in _DELIMITER_EXTENSIONS.items():
+        if key.endswith(extension):
+            return delimiter
+    return None
+
+
+def _strip_compression(key: str) -> str:
+    for extension in _COMPRESSION_EXTENSIONS:
+        if key.endswith(extension):
+            return key[:-len(extension)]
+    return key
+
+
+def open_binary_stream(body, compression: Optional[str] = None) -> io.BufferedIOBase:
+    """
+    Wrap a response body in a buffered, decompressing binary stream.
+
+    :param body: StreamingBody or file-like object with read(n).
+    :param compression: 'gzip', 'zstd', 'lz4' or None.
+    :return: Binary file-like object yielding decompressed bytes.
+    """
+    raw = io.BufferedReader(_BodyStream(body), buffer_size=_STREAM_BUFFER_SIZE)
+    if compression is None:
+        return raw
+    return open_decompressed(raw, compression)
+
+
+def detect_json_layout(stream: io.BufferedIOBase) -> Tuple[io.BufferedIOBase, str]:
+    """
+    Tell a JSON array document from JSON lines by its first non-whitespace byte.
+
+    Leading whitespace is consumed; nothing else is.
+
+    :param stream: Binary file-like object positioned at the start of the document.
+    :return: Tuple of the stream to keep reading from and 'json' ('[') or 'jsonl'.
+    """
+    if not hasattr(stream, 'peek'):
+        stream = io.BufferedReader(stream, buffer_size=_STREAM_BUFFER_SIZE)
+    while True:
+        head = stream.peek(_SNIFF_SIZE)
+        if not head:
+            return stream, 'jsonl'
+        content = head.lstrip()
+        if content:
+            stream.read(len(head) - len(content))
+            return stream, 'json' if content[:1] == b'[' else 'jsonl'
+        stream.read(len(head))
+
+
+def iter_records(
+    stream: io.BufferedIOBase,
+    record_format: str,
+    batch_size: Optional[int] = None,
+    encoding: str = 'utf-8',
+    **csv_options: Any,
+) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Parse records from a binary stream one line at a time.
+
+    With 'json' the layout is detected from the first byte: JSON lines are
+    streamed, while a JSON array has to be parsed whole before its elements
+    are yielded.
+
+    :param stream: Binary file-like object.
+    :param record_format: 'csv' (rows as dicts keyed by header), 'json' (array or lines) or 'jsonl'.
+    :param batch_size: Yield lists of this many records instead of single records (optional).
+    :param encoding: Text encoding of the stream.
+    :param csv_options: Extra keyword arguments for csv.DictReader (e.g. delimiter).
+    :return: Iterator of records or record batches.
+    """
+    if record_format == 'json':
+        stream, record_format = detect_json_layout(stream)
+    text = io.TextIOWrapper(stream, encoding=encoding, newline='')
+    if record_format == 'json':
+        records = iter(json.load(text))
+    elif record_format == 'csv':
+        records = csv.DictReader(text, **csv_options)
+    elif record_format == 'jsonl':
+        records = (json.loads(line) for line in text if line.strip())
+    else:
+        raise ValueError(f"Unsupported record format: {record_format}")
+
+    if not batch_size:
+        yield from records
+        return
+
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
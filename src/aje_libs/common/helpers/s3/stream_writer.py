@@ -0,0 +1,226 @@
+# src/aje_libs/common/helpers/s3/stream_writer.py
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Dict, List, Any, Union
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .codecs import CONTENT_ENCODINGS, make_compressor
+from .transfer import DEFAULT_PART_SIZE, MIN_PART_SIZE
+
+logger = custom_logger(__name__)
+
+# Part size doubles every this many parts so long streams stay under the
+# 10000-part limit of a multipart upload
+_PART_SIZE_GROWTH_EVERY = 1000
+
+
+class S3StreamWriter(io.IOBase):
+    """Writable file object that streams into an S3 multipart upload."""
+
+    def __init__(
+        self,
+        s3_client,
+        bucket_name: str,
+        object_key: str,
+        mode: str = 'wb',
+        encoding: str = 'utf-8',
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = 4,
+        extra_args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Data is buffered into parts that are uploaded on a thread pool while the
+        producer keeps writing. At most max_workers + 1 parts are held in memory;
+        writes block when uploads fall behind. Closing completes the upload;
+        leaving a with block on an exception, or dropping the writer without
+        closing it, aborts it.
+
+        :param s3_client: boto3 S3 client.
+        :param bucket_name: Name of the S3 bucket.
+        :param object_key: Key name in S3.
+        :param mode: 'wb' for bytes or 'w' for text.
+        :param encoding: Text encoding in 'w' mode.
+        :param compression: 'gzip', 'zstd' or 'lz4' to compress the stream (optional).
+        :param compression_level: Compression level (codec default if not given).
+        :param part_size: Size in bytes of each uploaded part (minimum 5 MB).
+        :param max_workers: Number of parts uploaded concurrently.
+        :param extra_args: Extra arguments for the object (ContentType, Metadata, ...).
+        """
+        super().__init__()
+        if mode not in ('w', 'wb'):
+            raise ValueError(f"Unsupported mode: {mode}")
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.object_key = object_key
+        self.text_mode = mode == 'w'
+        self.encoding = encoding
+        self.part_size = part_size
+        self.extra_args = dict(extra_args or {})
+        self.compression = compression
+        self._compressor = make_compressor(compression, compression_level) if compression else None
+        if compression:
+            self.extra_args.setdefault('ContentEncoding', CONTENT_ENCODINGS[compression])
+
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._part_number = 0
+        self._futures: List[Future] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers + 1)
+        self._stats_lock = threading.Lock()
+        self._aborted = False
+        self.bytes_written = 0
+        self.bytes_uploaded = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Union[str, bytes, bytearray, memoryview]) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if isinstance(data, str):
+            if not self.text_mode:
+                raise TypeError("write() argument must be bytes in binary mode")
+            raw = data.encode(self.encoding)
+        else:
+            raw = bytes(data)
+
+        self.bytes_written += len(raw)
+        self._buffer += self._compressor.compress(raw) if self._compressor else raw
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[:self.part_size])
+            del self._buffer[:self.part_size]
+            self._submit_part(part)
+        return len(data)
+
+    def _submit_part(self, data: bytes) -> None:
+        """Upload a part on the pool, blocking while too many parts are in flight"""
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=self.object_key, **self.extra_args
+            )
+            self._upload_id = response['UploadId']
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            logger.info(f"Started multipart stream upload: s3://{self.bucket_name}/{self.object_key}")
+
+        # Surface failures from earlier parts before buffering more data
+        for future in self._futures:
+            if future.done() and future.exception():
+                raise future.exception()
+
+        self._part_number += 1
+        if self._part_number % _PART_SIZE_GROWTH_EVERY == 0:
+            self.part_size *= 2
+
+        self._slots.acquire()
+        future = self._executor.submit(self._upload_part, self._part_number, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number: int, data: bytes) -> Dict[str, Any]:
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.object_key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        with self._stats_lock:
+            self.bytes_uploaded += len(data)
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    def close(self) -> None:
+        """Flush the remaining data and complete the upload."""
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                self._complete()
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+            super().close()
+
+    def _complete(self) -> None:
+        if self._compressor:
+            self._buffer += self._compressor.flush()
+
+        if self._upload_id is None:
+            # Small streams never reached a full part, a single PUT is enough
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=self.object_key,
+                Body=bytes(self._buffer),
+                **self.extra_args
+            )
+            self.bytes_uploaded = len(self._buffer)
+            logger.info(f"Stream written with a single PUT: s3://{self.bucket_name}/{self.object_key}")
+            return
+
+        if self._buffer:
+            self._submit_part(bytes(self._buffer))
+        self._buffer = bytearray()
+        parts = [future.result() for future in self._futures]
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.object_key,
+            UploadId=self._upload_id,
+            MultipartUpload={'Parts': parts},
+        )
+        logger.info(
+            f"Multipart stream upload completed: s3://{self.bucket_name}/{self.object_key} | "
+            f"Parts: {len(parts)} | Bytes: {self.bytes_uploaded}"
+        )
+
+    def abort(self) -> None:
+        """Abort the upload, discarding every part uploaded so far."""
+        if self._aborted:
+            return
+        self._aborted = True
+        self._buffer = bytearray()
+        for future in self._futures:
+            future.cancel()
+        if self._upload_id is None:
+            return
+        logger.warning(f"Aborting multipart stream upload: s3://{self.bucket_name}/{self.object_key}")
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=self.object_key, UploadId=self._upload_id
+            )
+        except ClientError as error:
+            logger.error(
+                f"Failed to abort multipart upload {self._upload_id} - "
+                f"Error: {error.response['Error']['Code']}"
+            )
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        self.close()
+
+    def __del__(self) -> None:
+        # IOBase.__del__ would close() and publish whatever was written so far;
+        # a writer dropped without an explicit close is discarded instead
+        if self.closed or not hasattr(self, '_aborted'):
+            return
+        if not self._aborted:
+            logger.warning(
+                f"Stream writer for s3://{self.bucket_name}/{self.object_key} was not closed, "
+                f"discarding {self.bytes_written} written bytes"
+            )
+            self.abort()
+        self.close()
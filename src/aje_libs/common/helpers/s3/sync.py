@@ -0,0 +1,212 @@
+# src/aje_libs/common/helpers/s3/sync.py
+import os
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+from botocore.exceptions import ClientError
+
+from ...logger import custom_logger
+from .checksums import etag_matches
+from .codecs import CODEC_METADATA_KEY, ORIGINAL_SIZE_METADATA_KEY
+from .concurrency import bounded_map
+
+logger = custom_logger(__name__)
+
+SYNC_DIRECTIONS = ('upload', 'download')
+
+
+def iter_local_files(local_dir: str) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory yielding (relative posix path, absolute path) for each file.
+
+    :param local_dir: Root directory.
+    :return: Iterator of path pairs.
+    """
+    for root, _, files in os.walk(local_dir):
+        for name in files:
+            absolute = os.path.join(root, name)
+            relative = os.path.relpath(absolute, local_dir).replace(os.sep, '/')
+            yield relative, absolute
+
+
+def needs_transfer(
+    local_path: str,
+    local_stat: Optional[os.stat_result],
+    remote: Optional[Dict[str, Any]],
+    direction: str,
+    check_etag: bool = True,
+    part_sizes: Tuple[int, ...] = (),
+) -> bool:
+    """
+    Decide whether a file differs between the local side and S3.
+
+    Missing files and size differences always transfer. When sizes match, a
+    newer source side triggers a transfer unless check_etag confirms that the
+    content is identical (the local MD5 or multipart ETag equals the listed one).
+
+    :param local_path: Local path to the file.
+    :param local_stat: os.stat of the local file, or None if missing.
+    :param remote: Listing entry of the object, or None if missing.
+    :param direction: 'upload' or 'download'.
+    :param check_etag: Compare content digests before transferring on mtime differences.
+    :param part_sizes: Part sizes to try first when verifying multipart ETags.
+    :return: True if the file must be transferred.
+    """
+    if local_stat is None or remote is None:
+        return True
+    if local_stat.st_size != remote['Size']:
+        return True
+
+    local_mtime = datetime.fromtimestamp(local_stat.st_mtime, tz=timezone.utc)
+    remote_mtime = remote['LastModified']
+    if direction == 'upload':
+        if not remote.get('ETag'):
+            # LastModified has second precision; with no ETag to confirm changes a
+            # file uploaded within the second it was written would always look newer
+            local_mtime = local_mtime.replace(microsecond=0)
+        source_newer = local_mtime > remote_mtime
+    else:
+        # Downloads copy LastModified to the local mtime, so equality means in sync
+        source_newer = remote_mtime.timestamp() > local_stat.st_mtime + 1
+    if not source_newer:
+        return False
+    if not check_etag or not remote.get('ETag'):
+        return True
+    return not etag_matches(local_path, remote['ETag'], remote['Size'], part_sizes)
+
+
+def sync(
+    s3_helper,
+    local_dir: str,
+    prefix: str,
+    direction: str = 'upload',
+    delete: bool = False,
+    check_etag: bool = True,
+    max_workers: int = 8,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Mirror a local directory and an S3 prefix in one direction, transferring only changes.
+
+    :param s3_helper: S3Helper of the bucket.
+    :param local_dir: Local directory.
+    :param prefix: S3 prefix (a trailing '/' is added if missing).
+    :param direction: 'upload' (local to S3) or 'download' (S3 to local).
+    :param delete: Delete files on the destination that do not exist on the source.
+    :param check_etag: Confirm content changes with ETags when only mtimes differ.
+    :param max_workers: Number of files transferred concurrently.
+    :param dry_run: Only compute the plan, without transferring or deleting.
+    :return: Dict with transferred, skipped, deleted and failed lists.
+    """
+    if direction not in SYNC_DIRECTIONS:
+        raise ValueError(f"Unsupported sync direction: {direction}")
+    if prefix and not prefix.endswith('/'):
+        prefix += '/'
+
+    remote = {
+        obj['Key'][len(prefix):]: obj
+        for obj in s3_helper.iter_objects(prefix=prefix)
+        if not obj['Key'].endswith('/')
+    }
+    local = dict(iter_local_files(local_dir)) if os.path.isdir(local_dir) else {}
+    part_sizes = (s3_helper.transfer_config.multipart_chunksize,)
+
+    if direction == 'upload':
+        candidates = list(local)
+        extraneous = [name for name in remote if name not in local]
+    else:
+        candidates = list(remote)
+        extraneous = [name for name in local if name not in remote]
+
+    def plan(name: str) -> Tuple[str, bool]:
+        local_path = local.get(name) or os.path.join(local_dir, *name.split('/'))
+        local_stat = os.stat(local_path) if name in local else None
+        remote_obj = remote.get(name)
+        if (
+            s3_helper.compression is not None
+            and remote_obj is not None
+            and local_stat is not None
+            and local_stat.st_size != remote_obj['Size']
+        ):
+            remote_obj = _uncompressed_entry(s3_helper, prefix + name, remote_obj)
+        changed = needs_transfer(
+            local_path, local_stat, remote_obj, direction, check_etag, part_sizes
+        )
+        return name, changed
+
+    result = {'transferred': [], 'skipped': [], 'deleted': [], 'failed': []}
+    changed_names = []
+    for name, changed in bounded_map(plan, candidates, max_workers=max_workers):
+        (changed_names if changed else result['skipped']).append(name)
+
+    logger.info(
+        f"Sync plan ({direction}) for {local_dir} <-> s3://{s3_helper.bucket_name}/{prefix} - "
+        f"Changed: {len(changed_names)} | Unchanged: {len(result['skipped'])} | "
+        f"Extraneous: {len(extraneous)}"
+    )
+    if dry_run:
+        result['transferred'] = changed_names
+        result['deleted'] = extraneous if delete else []
+        return result
+
+    def transfer(name: str) -> Tuple[str, Optional[str]]:
+        key = prefix + name
+        local_path = os.path.join(local_dir, *name.split('/'))
+        try:
+            if direction == 'upload':
+                s3_helper.upload_file(local_path, key)
+            else:
+                os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
+                s3_helper.download_file(key, local_path)
+                mtime = remote[name]['LastModified'].timestamp()
+                os.utime(local_path, (mtime, mtime))
+            return name, None
+        except (ClientError, OSError) as error:
+            return name, str(error)
+
+    for name, error in bounded_map(transfer, changed_names, max_workers=max_workers):
+        if error:
+            result['failed'].append({'name': name, 'error': error})
+        else:
+            result['transferred'].append(name)
+
+    if delete and extraneous:
+        if direction == 'upload':
+            summary = s3_helper.bulk_delete(prefix + name for name in extraneous)
+            failed_keys = {error['Key'] for error in summary['errors']}
+            result['deleted'] = [name for name in extraneous if prefix + name not in failed_keys]
+        else:
+            for name in extraneous:
+                os.remove(local[name])
+                result['deleted'].append(name)
+
+    logger.info(
+        f"Sync finished - Transferred: {len(result['transferred'])} | "
+        f"Deleted: {len(result['deleted'])} | Failed: {len(result['failed'])}"
+    )
+    return result
+
+
+def _uncompressed_entry(s3_helper, key: str, obj: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Listing entry of an object compressed by this library, sized as its uncompressed content.
+
+    Listings report the stored (compressed) size, so the original size recorded
+    in the object metadata is fetched instead. The ETag is dropped because it
+    describes the compressed bytes and cannot be compared with the local file.
+
+    :param s3_helper: S3Helper of the bucket.
+    :param key: Key name in S3.
+    :param obj: Listing entry of the object.
+    :return: Entry to compare with the local file (obj itself if not compressed).
+    """
+    try:
+        response = s3_helper.s3_client.head_object(Bucket=s3_helper.bucket_name, Key=key)
+    except ClientError as error:
+        logger.warning(f"Failed to read metadata of {key}: {error.response['Error']['Code']}")
+        return obj
+    metadata = response.get('Metadata') or {}
+    original_size = metadata.get(ORIGINAL_SIZE_METADATA_KEY)
+    if not metadata.get(CODEC_METADATA_KEY) or original_size is None:
+        return obj
+    return dict(obj, Size=int(original_size), ETag=None)
@@ -0,0 +1,147 @@
+# src/aje_libs/common/helpers/s3/transfer.py
+import threading
+import time
+from typing import Optional, Dict, Any, Callable
+
+from boto3.s3.transfer import TransferConfig
+
+from ...logger import custom_logger
+
+logger = custom_logger(__name__)
+
+MB = 1024 * 1024
+
+DEFAULT_PART_SIZE = 16 * MB
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_MAX_IN_FLIGHT_BYTES = 256 * MB
+
+# S3 limits for multipart uploads
+MIN_PART_SIZE = 5 * MB
+MAX_PARTS = 10000
+
+
+def build_transfer_config(
+    part_size: int = DEFAULT_PART_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    max_in_flight_bytes: int = DEFAULT_MAX_IN_FLIGHT_BYTES,
+    multipart_threshold: Optional[int] = None,
+    max_bandwidth: Optional[int] = None,
+    use_threads: bool = True,
+) -> TransferConfig:
+    """
+    Build a boto3 TransferConfig for parallel multipart transfers.
+
+    :param part_size: Size in bytes of each multipart part (minimum 5 MB).
+    :param max_workers: Number of concurrent part transfers.
+    :param max_in_flight_bytes: Upper bound of part bytes buffered in memory at once.
+    :param multipart_threshold: Size from which multipart is used (defaults to part_size).
+    :param max_bandwidth: Optional bandwidth limit in bytes per second.
+    :param use_threads: Whether to transfer parts on a thread pool.
+    :return: TransferConfig instance.
+    """
+    if part_size < MIN_PART_SIZE:
+        raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    config = TransferConfig(
+        multipart_threshold=multipart_threshold or part_size,
+        multipart_chunksize=part_size,
+        max_concurrency=max_workers,
+        max_bandwidth=max_bandwidth,
+        use_threads=use_threads,
+    )
+
+    # Bound the number of parts held in memory so that concurrency does not
+    # translate into unbounded buffering on small Lambda containers
+    in_memory_parts = max(1, max_in_flight_bytes // part_size)
+    config.max_in_memory_upload_chunks = in_memory_parts
+    config.max_in_memory_download_chunks = in_memory_parts
+    return config
+
+
+def part_size_for(total_size: int, part_size: int = DEFAULT_PART_SIZE) -> int:
+    """
+    Return a part size that keeps a transfer within the S3 part count limit.
+
+    :param total_size: Total size in bytes of the object.
+    :param part_size: Preferred part size in bytes.
+    :return: Part size in bytes.
+    """
+    part_size = max(part_size, MIN_PART_SIZE)
+    while total_size > part_size * MAX_PARTS:
+        part_size *= 2
+    return part_size
+
+
+class TransferProgress:
+    """Thread-safe transfer callback that tracks transferred bytes and throughput."""
+
+    def __init__(
+        self,
+        total_bytes: Optional[int] = None,
+        on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+        report_interval: float = 5.0,
+        label: str = "",
+    ) -> None:
+        """
+        Initialize the progress tracker.
+
+        :param total_bytes: Expected size of the transfer (optional).
+        :param on_update: Function receiving a progress snapshot dict.
+        :param report_interval: Minimum seconds between reports.
+        :param label: Name used when logging progress.
+        """
+        self.total_bytes = total_bytes
+        self.on_update = on_update
+        self.report_interval = report_interval
+        self.label = label
+        self._transferred = 0
+        self._started_at = time.monotonic()
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_amount: int) -> None:
+        with self._lock:
+            self._transferred += bytes_amount
+            now = time.monotonic()
+            finished = self.total_bytes is not None and self._transferred >= self.total_bytes
+            if not finished and now - self._last_report < self.report_interval:
+                return
+            self._last_report = now
+            snapshot = self._snapshot(now)
+
+        if self.on_update:
+            self.on_update(snapshot)
+        else:
+            logger.debug(
+                f"Transfer progress {self.label}: {snapshot['transferred_bytes']} bytes | "
+                f"{snapshot['throughput_mbps']:.2f} MB/s"
+            )
+
+    @property
+    def transferred_bytes(self) -> int:
+        return self._transferred
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current progress of the transfer.
+
+        :return: Dict with transferred bytes, percentage, elapsed time and throughput.
+        """
+        with self._lock:
+            return self._snapshot(time.monotonic())
+
+    def _snapshot(self, now: float) -> Dict[str, Any]:
+        elapsed = max(now - self._started_at, 1e-6)
+        percent = None
+        if self.total_bytes:
+            percent = min(100.0, self._transferred * 100.0 / self.total_bytes)
+        return {
+            'label': self.label,
+            'transferred_bytes': self._transferred,
+            'total_bytes': self.total_bytes,
+            'percent': percent,
+            'elapsed_seconds': elapsed,
+            'throughput_mbps': self._transferred / elapsed / MB,
+        }
@@ -1,17 +1,59 @@
 # src/aje_libs/common/helpers/s3_helper.py
 
 import json
-import boto3
+import os
+import shutil
+import time
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional, Dict, List, Any, Union, Tuple
+from typing import Optional, Dict, List, Any, Union, Tuple, Callable, Iterator, Iterable
 import io
 import mimetypes
 from pathlib import Path
 
 from ..logger import custom_logger
+from .client_registry import credential_identity, default_session, get_client, get_resource
+from . import metadata_cache
+from .metadata_cache import DEFAULT_VALIDATION_TTL, VALIDATION_MODES
+from .s3.transfer import build_transfer_config, MB, DEFAULT_PART_SIZE, MIN_PART_SIZE
+from .s3.parallel_listing import ParallelLister
+from .s3.listing_index import ListingIndex
+from .s3.filters import ObjectFilterPlan
+from .s3.concurrency import chunked, bounded_map, sleep_backoff, RETRYABLE_ERROR_CODES
+from .s3.multipart_copy import multipart_copy, copy_create_args, COPY_MULTIPART_THRESHOLD, MAX_SINGLE_COPY_SIZE
+from .s3.range_reader import S3RangeReader, DEFAULT_BLOCK_SIZE
+from .s3.ranged_download import RangedDownloadStream
+from .s3 import record_reader
+from .s3.stream_writer import S3StreamWriter
+from .s3 import sync as prefix_sync
+from .s3 import audit as prefix_audit
+from .s3.object_cache import ObjectCache
+from .s3.presign import PresignCache, presign_batch
+from .s3 import dedup
+from .s3.inventory import S3Inventory
+from .s3.partitions import partition_prefixes
+from .s3.metrics import MetricsCollector, instrument_client
+from .s3 import codecs
+from .s3.codecs import CompressionPolicy, CompressingReader
+from .s3.dataset import ParquetDataset, Filters, DEFAULT_ROW_GROUP_SIZE
+from .s3.archive import S3Archive
 
 logger = custom_logger(__name__)
 
+# Maximum number of keys accepted by a single delete_objects request
+DELETE_BATCH_SIZE = 1000
+
+
+def _body_size(body: Union[str, bytes, io.IOBase]) -> Optional[int]:
+    """Size of an in-memory put_object body, None for streams"""
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return None
+
+
 class S3Helper:
     """Custom helper for S3 to simplify file operations."""
 
@@ -19,33 +61,144 @@ class S3Helper:
         self,
         bucket_name: str,
         region_name: Optional[str] = None,
+        transfer_config: Optional[TransferConfig] = None,
+        listing_index: Optional[ListingIndex] = None,
+        object_cache: Optional[ObjectCache] = None,
+        presign_cache: Optional[PresignCache] = None,
+        inventory: Optional[S3Inventory] = None,
+        metrics: Optional[MetricsCollector] = None,
+        compression: Optional[CompressionPolicy] = None,
+        validation: str = 'cached',
+        validation_ttl: Optional[float] = DEFAULT_VALIDATION_TTL,
+        client_config: Optional[Config] = None,
     ) -> None:
         """
         Initialize the S3 helper.
 
         :param bucket_name: Name of the S3 bucket.
         :param region_name: AWS region (optional, defaults to boto3 default).
+        :param transfer_config: Multipart transfer settings (optional, see build_transfer_config).
+        :param listing_index: Local listing index queried by the filter methods (optional).
+        :param object_cache: Read-through cache used by read_object and download_file (optional).
+        :param presign_cache: Cache of still-valid URLs used by get_presigned_urls
+            (optional, a per-helper cache is created by default).
+        :param inventory: S3 Inventory report usable as a listing source by the filter methods (optional).
+        :param metrics: Collector receiving latency, bytes, retries and throttles of every S3 call
+            this helper makes on its bucket, plus totals of managed file transfers (optional, e.g.
+            EMFMetrics). The helper then uses a client of its own instead of the shared one.
+        :param compression: Codec policy for transparent compression (optional). Uploads matching
+            it are stored compressed with Content-Encoding set, and objects whose Content-Encoding
+            is a supported codec are decompressed by get_object, read_object and downloads.
+        :param validation: 'eager' to call head_bucket on every init, 'cached' to reuse a
+            successful process-wide check for validation_ttl seconds, 'lazy' to skip it
+            (errors then surface on the first operation).
+        :param validation_ttl: Seconds a successful bucket check is reused (None for the process lifetime).
+        :param client_config: botocore Config of the S3 client (optional, botocore defaults if not
+            given), e.g. Config(max_pool_connections=50) for transfers above 10 concurrent requests.
         """
+        if validation not in VALIDATION_MODES:
+            raise ValueError(f"Unsupported validation mode: {validation}")
         self.bucket_name = bucket_name
-        self.s3_client = boto3.client("s3", region_name=region_name)
-        self.s3_resource = boto3.resource("s3", region_name=region_name)
+        self.region_name = region_name
+        self.validation_ttl = validation_ttl
+        self.transfer_config = transfer_config or build_transfer_config()
+        self.listing_index = listing_index
+        self.object_cache = object_cache
+        self.presign_cache = presign_cache or PresignCache()
+        self._dedup_index = dedup.DigestIndex()
+        self.inventory = inventory
+        self.compression = compression
+        self.session = default_session()
+        if metrics is not None:
+            # Metrics handlers see every call of a client, so an instrumented helper
+            # gets a client of its own instead of the shared registry one
+            self.s3_client = self.session.client("s3", region_name=region_name, config=client_config)
+        else:
+            self.s3_client = get_client("s3", region_name=region_name, config=client_config, session=self.session)
+        self.s3_resource = get_resource("s3", region_name=region_name, config=client_config, session=self.session)
         self.bucket = self.s3_resource.Bucket(bucket_name)
-        self._validate_bucket()
+        self.metrics = metrics
+        if metrics is not None:
+            instrument_client(self.s3_client, metrics, bucket=bucket_name)
+        if validation == 'eager':
+            metadata_cache.invalidate(self._validation_cache_key)
+        if validation != 'lazy':
+            self._validate_bucket()
         logger.info(f"Configured helper for S3 bucket: {bucket_name}")
 
+    @property
+    def _validation_cache_key(self) -> tuple:
+        # Access is checked per principal: other credentials may not reach the bucket
+        return ('s3:head_bucket', credential_identity(self.session), self.region_name, self.bucket_name)
+
     def _validate_bucket(self) -> None:
         """Validate that the bucket exists and is accessible"""
         try:
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            metadata_cache.get_or_load(
+                self._validation_cache_key,
+                lambda: self.s3_client.head_bucket(Bucket=self.bucket_name),
+                self.validation_ttl
+            )
         except ClientError as error:
             logger.error(f"Bucket {self.bucket_name} does not exist or is inaccessible")
             raise error
 
+    def _log_throughput(self, action: str, size: int, started_at: float) -> None:
+        """Log size and throughput of a completed transfer, recording it as a metric"""
+        elapsed = max(time.monotonic() - started_at, 1e-6)
+        logger.debug(f"{action} {size} bytes in {elapsed:.2f}s ({size / elapsed / MB:.2f} MB/s)")
+        if self.metrics is not None:
+            uploaded = action == "Uploaded"
+            self.metrics.record(
+                self.bucket_name,
+                'upload_file' if uploaded else 'download_file',
+                elapsed * 1000,
+                bytes_in=0 if uploaded else size,
+                bytes_out=size if uploaded else 0
+            )
+
+    def _upload_codec(
+        self,
+        object_key: str,
+        extra_args: Optional[Dict[str, Any]],
+        size: Optional[int] = None
+    ) -> Optional[str]:
+        """Codec an upload is compressed with, None when it is stored as is"""
+        if self.compression is None or (extra_args and 'ContentEncoding' in extra_args):
+            return None
+        if size is not None and size < self.compression.min_size:
+            return None
+        return self.compression.codec_for(object_key, (extra_args or {}).get('ContentType'))
+
+    @staticmethod
+    def _encoded_args(
+        extra_args: Optional[Dict[str, Any]],
+        codec: str,
+        original_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Extra arguments marking an upload as compressed with a codec"""
+        encoded_args = dict(extra_args or {})
+        encoded_args['ContentEncoding'] = codecs.CONTENT_ENCODINGS[codec]
+        metadata = dict(encoded_args.get('Metadata') or {})
+        metadata[codecs.CODEC_METADATA_KEY] = codec
+        if original_size is not None:
+            metadata[codecs.ORIGINAL_SIZE_METADATA_KEY] = str(original_size)
+        encoded_args['Metadata'] = metadata
+        return encoded_args
+
+    def _response_codec(self, content_encoding: Optional[str]) -> Optional[str]:
+        """Codec to decode an object with, None when it is returned as stored"""
+        if self.compression is None:
+            return None
+        return codecs.codec_from_encoding(content_encoding)
+
     def upload_file(
         self, 
         file_path: str, 
         object_key: str,
-        extra_args: Optional[Dict[str, Any]] = None
+        extra_args: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        transfer_config: Optional[TransferConfig] = None
     ) -> str:
         """
         Upload a file to S3.
@@ -53,6 +206,8 @@ class S3Helper:
         :param file_path: Local path to the file.
         :param object_key: Key name in S3.
         :param extra_args: Extra arguments to pass to upload_file.
+        :param callback: Progress callback receiving transferred bytes (e.g. TransferProgress).
+        :param transfer_config: Transfer settings overriding the helper defaults.
         :return: S3 path of the uploaded file.
         """
         s3_path = f"s3://{self.bucket_name}/{object_key}"
@@ -68,12 +223,30 @@ class S3Helper:
                 if content_type:
                     extra_args['ContentType'] = content_type
             
-            self.s3_client.upload_file(
-                file_path,
-                self.bucket_name,
-                object_key,
-                ExtraArgs=extra_args
-            )
+            started_at = time.monotonic()
+            size = os.path.getsize(file_path)
+            codec = self._upload_codec(object_key, extra_args, size)
+            if codec:
+                # Compress while uploading instead of writing a compressed copy first
+                with open(file_path, 'rb') as source:
+                    self.s3_client.upload_fileobj(
+                        CompressingReader(source, codec, self.compression.level),
+                        self.bucket_name,
+                        object_key,
+                        ExtraArgs=self._encoded_args(extra_args, codec, size),
+                        Callback=callback,
+                        Config=transfer_config or self.transfer_config
+                    )
+            else:
+                self.s3_client.upload_file(
+                    file_path,
+                    self.bucket_name,
+                    object_key,
+                    ExtraArgs=extra_args,
+                    Callback=callback,
+                    Config=transfer_config or self.transfer_config
+                )
+            self._log_throughput("Uploaded", size, started_at)
             logger.info(f"File uploaded successfully: {s3_path}")
             return s3_path
         except ClientError as error:
@@ -88,7 +261,9 @@ class S3Helper:
         self,
         fileobj,
         object_key: str,
-        extra_args: Optional[Dict[str, Any]] = None
+        extra_args: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        transfer_config: Optional[TransferConfig] = None
     ) -> str:
         """
         Upload a file object to S3.
@@ -96,17 +271,25 @@ class S3Helper:
         :param fileobj: File-like object to upload.
         :param object_key: Key name in S3.
         :param extra_args: Extra arguments to pass to upload_fileobj.
+        :param callback: Progress callback receiving transferred bytes (e.g. TransferProgress).
+        :param transfer_config: Transfer settings overriding the helper defaults.
         :return: S3 path of the uploaded file.
         """
         s3_path = f"s3://{self.bucket_name}/{object_key}"
         logger.info(f"Uploading file object to S3: {s3_path}")
         
         try:
+            codec = self._upload_codec(object_key, extra_args)
+            if codec:
+                fileobj = CompressingReader(fileobj, codec, self.compression.level)
+                extra_args = self._encoded_args(extra_args, codec)
             self.s3_client.upload_fileobj(
                 fileobj,
                 self.bucket_name,
                 object_key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Callback=callback,
+                Config=transfer_config or self.transfer_config
             )
             logger.info(f"File object uploaded successfully: {s3_path}")
             return s3_path
@@ -122,7 +305,9 @@ class S3Helper:
         self,
         object_key: str,
         file_path: str,
-        extra_args: Optional[Dict[str, Any]] = None
+        extra_args: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        transfer_config: Optional[TransferConfig] = None
     ) -> None:
         """
         Download a file from S3.
@@ -130,16 +315,51 @@ class S3Helper:
         :param object_key: Key name in S3.
         :param file_path: Local path to save the file.
         :param extra_args: Extra arguments to pass to download_file.
+        :param callback: Progress callback receiving transferred bytes (e.g. TransferProgress).
+        :param transfer_config: Transfer settings overriding the helper defaults.
         """
         logger.info(f"Downloading file from S3: s3://{self.bucket_name}/{object_key}")
         
         try:
+            if self.object_cache is not None and not extra_args:
+                cached, encoding = self.object_cache.open(self.s3_client, self.bucket_name, object_key)
+                codec = self._response_codec(encoding)
+                with cached, open(file_path, 'wb') as output:
+                    source = codecs.open_decompressed(cached, codec) if codec else cached
+                    shutil.copyfileobj(source, output, 1 * MB)
+                logger.info(f"File copied from local cache to: {file_path}")
+                return
+
+            if self.compression is not None:
+                started_at = time.monotonic()
+                # Written next to the destination and renamed on success, so a failed
+                # download leaves an existing file untouched
+                temp_path = f"{file_path}.{os.urandom(4).hex()}.part"
+                try:
+                    with open(temp_path, 'wb') as output:
+                        codec = self._download_decoded(object_key, output, extra_args, callback, transfer_config)
+                    os.replace(temp_path, file_path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+                self._log_throughput("Downloaded", os.path.getsize(file_path), started_at)
+                logger.info(
+                    f"File downloaded and decompressed to: {file_path}" if codec
+                    else f"File downloaded successfully to: {file_path}"
+                )
+                return
+
+            started_at = time.monotonic()
             self.s3_client.download_file(
                 self.bucket_name,
                 object_key,
                 file_path,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Callback=callback,
+                Config=transfer_config or self.transfer_config
             )
+            self._log_throughput("Downloaded", os.path.getsize(file_path), started_at)
             logger.info(f"File downloaded successfully to: {file_path}")
         except ClientError as error:
             logger.error(
@@ -153,7 +373,9 @@ class S3Helper:
         self,
         object_key: str,
         fileobj,
-        extra_args: Optional[Dict[str, Any]] = None
+        extra_args: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        transfer_config: Optional[TransferConfig] = None
     ) -> None:
         """
         Download file content to a file object.
@@ -161,15 +383,26 @@ class S3Helper:
         :param object_key: Key name in S3.
         :param fileobj: File-like object to write to.
         :param extra_args: Extra arguments to pass to download_fileobj.
+        :param callback: Progress callback receiving transferred bytes (e.g. TransferProgress).
+        :param transfer_config: Transfer settings overriding the helper defaults.
         """
         logger.info(f"Downloading file object from S3: s3://{self.bucket_name}/{object_key}")
         
         try:
+            if self.compression is not None:
+                codec = self._download_decoded(object_key, fileobj, extra_args, callback, transfer_config)
+                logger.info(
+                    "File object downloaded and decompressed successfully" if codec
+                    else "File object downloaded successfully"
+                )
+                return
             self.s3_client.download_fileobj(
                 self.bucket_name,
                 object_key,
                 fileobj,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Callback=callback,
+                Config=transfer_config or self.transfer_config
             )
             logger.info(f"File object downloaded successfully")
         except ClientError as error:
@@ -180,11 +413,127 @@ class S3Helper:
             )
             raise error
 
-    def get_object(self, object_key: str) -> Dict[str, Any]:
+    def _download_decoded(
+        self,
+        object_key: str,
+        fileobj,
+        extra_args: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        transfer_config: Optional[TransferConfig] = None
+    ) -> Optional[str]:
+        """
+        Stream an object into a file object with parallel Range GETs, decompressing
+        it when the first GET response reports a supported Content-Encoding.
+
+        The callback receives stored bytes, compressed or not, as for downloads
+        without a compression policy.
+
+        :return: Codec the object was decompressed with, None when written as stored.
+        """
+        with RangedDownloadStream(
+            self.s3_client,
+            self.bucket_name,
+            object_key,
+            transfer_config or self.transfer_config,
+            extra_args=extra_args,
+            callback=callback
+        ) as stream:
+            codec = codecs.codec_from_encoding(stream.content_encoding)
+            source = codecs.open_decompressed(stream, codec) if codec else stream
+            shutil.copyfileobj(source, fileobj, 1 * MB)
+        return codec
+
+    def sync(
+        self,
+        local_dir: str,
+        prefix: str,
+        direction: str = 'upload',
+        delete: bool = False,
+        check_etag: bool = True,
+        max_workers: int = 8,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Mirror a local directory and a prefix, transferring only changed files.
+
+        Files are compared by size and modification time; when only the mtime
+        differs the local MD5 (or multipart ETag) is checked against the listed
+        ETag before transferring. With a compression policy, objects compressed
+        by this helper are compared by the uncompressed size in their metadata.
+
+        :param local_dir: Local directory.
+        :param prefix: S3 prefix.
+        :param direction: 'upload' (local to S3) or 'download' (S3 to local).
+        :param delete: Delete destination files that do not exist on the source.
+        :param check_etag: Confirm content changes with ETags when only mtimes differ.
+        :param max_workers: Number of files compared and transferred concurrently.
+        :param dry_run: Only compute what would be transferred and deleted.
+        :return: Dict with transferred, skipped, deleted and failed lists.
+        """
+        logger.info(
+            f"Syncing {local_dir} with s3://{self.bucket_name}/{prefix} - Direction: {direction}"
+        )
+        return prefix_sync.sync(
+            self,
+            local_dir,
+            prefix,
+            direction=direction,
+            delete=delete,
+            check_etag=check_etag,
+            max_workers=max_workers,
+            dry_run=dry_run
+        )
+
+    def audit_checksums(
+        self,
+        local_dir: str,
+        prefix: str,
+        algorithm: str = 'auto',
+        max_workers: Optional[int] = None,
+        max_fetch_workers: int = 32,
+        use_processes: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Verify that a local directory and a prefix hold identical content.
+
+        Local files are hashed on a process pool (MD5 / multipart ETag, SHA-256
+        or CRC32C, each file read once) and compared with the listed ETags or
+        the ChecksumSHA256 / ChecksumCRC32C attributes, fetched concurrently.
+
+        :param local_dir: Local directory holding the source files.
+        :param prefix: S3 prefix.
+        :param algorithm: 'auto' (the checksum each object was uploaded with, else its ETag),
+            'etag', 'sha256' or 'crc32c'.
+        :param max_workers: Hashing processes (defaults to the CPU count).
+        :param max_fetch_workers: Concurrent requests fetching object checksums.
+        :param use_processes: Hash on processes instead of threads (falls back to threads
+            where processes are unavailable, e.g. AWS Lambda).
+        :return: Dict with matched, mismatched, missing_remote, missing_local, no_checksum
+            and failed lists plus a summary.
+        """
+        logger.info(
+            f"Auditing {local_dir} against s3://{self.bucket_name}/{prefix} - Algorithm: {algorithm}"
+        )
+        return prefix_audit.audit(
+            self,
+            local_dir,
+            prefix,
+            algorithm=algorithm,
+            max_workers=max_workers,
+            max_fetch_workers=max_fetch_workers,
+            use_processes=use_processes
+        )
+
+    def get_object(self, object_key: str, decode: bool = True) -> Dict[str, Any]:
         """
         Get object content and metadata.
 
+        With a compression policy configured, the Body of an object stored with a
+        supported Content-Encoding is replaced by a stream of its decompressed bytes
+        (ContentLength still describes the stored size).
+
         :param object_key: Key name in S3.
+        :param decode: Decompress the Body when the object is compressed.
         :return: Object content and metadata.
         """
         logger.info(f"Getting object from S3: s3://{self.bucket_name}/{object_key}")
@@ -194,6 +543,9 @@ class S3Helper:
                 Bucket=self.bucket_name,
                 Key=object_key
             )
+            codec = self._response_codec(response.get('ContentEncoding')) if decode else None
+            if codec:
+                response['Body'] = record_reader.open_binary_stream(response['Body'], codec)
             logger.info("Object retrieved successfully")
             return response
         except ClientError as error:
@@ -204,265 +556,1224 @@ class S3Helper:
             )
             raise error
 
-    def put_object(
-        self,
-        object_key: str,
-        body: Union[str, bytes, io.IOBase],
-        extra_args: Optional[Dict[str, Any]] = None
-    ) -> str:
+    def read_object(self, object_key: str) -> bytes:
         """
-        Put object content to S3.
+        Read the whole object content, through the object cache when configured.
+
+        Compressed objects are decompressed when a compression policy is configured.
 
         :param object_key: Key name in S3.
-        :param body: Content to upload.
-        :param extra_args: Extra arguments to pass to put_object.
-        :return: S3 path of the uploaded object.
+        :return: Object content.
         """
-        s3_path = f"s3://{self.bucket_name}/{object_key}"
-        logger.info(f"Putting object to S3: {s3_path}")
-        
+        logger.info(f"Reading object from S3: s3://{self.bucket_name}/{object_key}")
+
         try:
-            put_args = {
-                'Bucket': self.bucket_name,
-                'Key': object_key,
-                'Body': body
-            }
-            
-            if extra_args:
-                put_args.update(extra_args)
-            
-            self.s3_client.put_object(**put_args)
-            logger.info(f"Object put successfully: {s3_path}")
-            return s3_path
+            if self.object_cache is not None:
+                data, encoding = self.object_cache.read(self.s3_client, self.bucket_name, object_key)
+            else:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_key)
+                data = response['Body'].read()
+                encoding = response.get('ContentEncoding')
+            codec = self._response_codec(encoding)
+            return codecs.decompress_bytes(data, codec) if codec else data
         except ClientError as error:
             logger.error(
-                f"Failed to put object - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Failed to read object - Bucket: {self.bucket_name} | Key: {object_key} | "
                 f"Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
-    def delete_object(self, object_key: str) -> None:
+    def open_reader(
+        self,
+        object_key: str,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_blocks: int = 32,
+        readahead_blocks: int = 4
+    ) -> S3RangeReader:
         """
-        Delete an object from S3.
+        Open a seekable, read-only file object that fetches only the byte ranges read.
+
+        Useful to let pandas, pyarrow or zipfile read a Parquet footer or a single
+        archive member without downloading the whole object.
 
         :param object_key: Key name in S3.
+        :param block_size: Size in bytes of each cached block.
+        :param cache_blocks: Maximum number of blocks kept in memory.
+        :param readahead_blocks: Extra blocks fetched when reads are sequential.
+        :return: S3RangeReader file object.
         """
-        logger.info(f"Deleting object from S3: s3://{self.bucket_name}/{object_key}")
-        
+        logger.info(f"Opening range reader for object: s3://{self.bucket_name}/{object_key}")
+
         try:
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=object_key
+            return S3RangeReader(
+                self.s3_client,
+                self.bucket_name,
+                object_key,
+                block_size=block_size,
+                cache_blocks=cache_blocks,
+                readahead_blocks=readahead_blocks
             )
-            logger.info("Object deleted successfully")
         except ClientError as error:
             logger.error(
-                f"Failed to delete object - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Failed to open range reader - Bucket: {self.bucket_name} | Key: {object_key} | "
                 f"Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
-    def delete_objects(self, object_keys: List[str]) -> Dict[str, Any]:
-        """
-        Delete multiple objects from S3.
-
-        :param object_keys: List of key names in S3.
-        :return: Response from delete_objects call.
-        """
-        logger.info(f"Deleting {len(object_keys)} objects from S3")
-        
+    def _open_record_stream(self, object_key: str, compression: Optional[str]):
+        """Open the object body as a decompressing binary stream"""
         try:
-            objects = [{'Key': key} for key in object_keys]
-            response = self.s3_client.delete_objects(
-                Bucket=self.bucket_name,
-                Delete={'Objects': objects}
-            )
-            
-            deleted = response.get('Deleted', [])
-            errors = response.get('Errors', [])
-            
-            logger.info(f"Successfully deleted {len(deleted)} objects")
-            if errors:
-                logger.warning(f"Failed to delete {len(errors)} objects")
-            
-            return response
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=object_key)
         except ClientError as error:
             logger.error(
-                f"Failed to delete objects - Bucket: {self.bucket_name} | "
+                f"Failed to open object stream - Bucket: {self.bucket_name} | Key: {object_key} | "
                 f"Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
-    def copy_object(
+        if compression == 'infer':
+            compression = record_reader.infer_compression(object_key, response.get('ContentEncoding'))
+        return record_reader.open_binary_stream(response['Body'], compression)
+
+    def iter_records(
         self,
-        source_key: str,
-        destination_key: str,
-        source_bucket: Optional[str] = None,
-        extra_args: Optional[Dict[str, Any]] = None
-    ) -> str:
+        object_key: str,
+        format: str = 'infer',
+        compression: Optional[str] = 'infer',
+        batch_size: Optional[int] = None,
+        encoding: str = 'utf-8',
+        **csv_options: Any
+    ) -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
-        Copy an object within S3.
+        Stream records from a CSV or JSON-lines object with constant memory.
 
-        :param source_key: Source object key.
-        :param destination_key: Destination object key.
-        :param source_bucket: Source bucket (defaults to current bucket).
-        :param extra_args: Extra arguments to pass to copy_object.
-        :return: S3 path of the copied object.
+        A '.json' key is read as a JSON array or as JSON lines depending on its
+        first character; an array is parsed whole before records are yielded.
+
+        :param object_key: Key name in S3.
+        :param format: 'csv', 'json' (array or lines), 'jsonl' or 'infer' from the key extension.
+        :param compression: 'gzip', 'zstd', 'lz4', None or 'infer' from Content-Encoding/extension.
+        :param batch_size: Yield lists of this many records instead of single records (optional).
+        :param encoding: Text encoding of the object.
+        :param csv_options: Extra keyword arguments for csv.DictReader (e.g. delimiter;
+            tab is used for '.tsv' keys unless a delimiter or dialect is given).
+        :return: Iterator of records (dicts) or record batches.
         """
-        source_bucket = source_bucket or self.bucket_name
-        source = f"{source_bucket}/{source_key}"
-        destination_path = f"s3://{self.bucket_name}/{destination_key}"
-        
-        logger.info(f"Copying object from {source} to {destination_path}")
-        
+        if format == 'infer':
+            format = record_reader.infer_format(object_key)
+        delimiter = record_reader.infer_delimiter(object_key)
+        if format == 'csv' and delimiter and not {'delimiter', 'dialect'} & set(csv_options):
+            csv_options['delimiter'] = delimiter
+        logger.info(f"Streaming {format} records from S3: s3://{self.bucket_name}/{object_key}")
+
+        stream = self._open_record_stream(object_key, compression)
         try:
-            copy_args = {
-                'CopySource': source,
-                'Bucket': self.bucket_name,
-                'Key': destination_key
-            }
-            
-            if extra_args:
-                copy_args.update(extra_args)
-            
-            self.s3_client.copy_object(**copy_args)
-            logger.info("Object copied successfully")
-            return destination_path
-        except ClientError as error:
-            logger.error(
-                f"Failed to copy object - Source: {source} | Destination: {destination_path} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
+            yield from record_reader.iter_records(
+                stream, format, batch_size=batch_size, encoding=encoding, **csv_options
             )
-            raise error
+        finally:
+            stream.close()
 
-    def object_exists(self, object_key: str) -> bool:
+    def iter_dataframes(
+        self,
+        object_key: str,
+        chunksize: int = 100000,
+        format: str = 'infer',
+        compression: Optional[str] = 'infer',
+        **pandas_options: Any
+    ) -> Iterator[Any]:
         """
-        Check if an object exists.
+        Stream a CSV or JSON-lines object as pandas DataFrames of chunksize rows.
 
         :param object_key: Key name in S3.
-        :return: True if object exists, False otherwise.
+        :param chunksize: Rows per DataFrame.
+        :param format: 'csv', 'json' (array or lines), 'jsonl' or 'infer' from the key extension.
+        :param compression: 'gzip', 'zstd', 'lz4', None or 'infer' from Content-Encoding/extension.
+        :param pandas_options: Extra keyword arguments for pandas.read_csv / read_json
+            (sep defaults to tab for '.tsv' keys).
+        :return: Iterator of DataFrames.
         """
+        import pandas as pd
+
+        if format == 'infer':
+            format = record_reader.infer_format(object_key)
+        delimiter = record_reader.infer_delimiter(object_key)
+        if format == 'csv' and delimiter and not {'sep', 'delimiter', 'dialect'} & set(pandas_options):
+            pandas_options['sep'] = delimiter
+        logger.info(f"Streaming {format} DataFrames from S3: s3://{self.bucket_name}/{object_key}")
+
+        stream = self._open_record_stream(object_key, compression)
         try:
-            self.s3_client.head_object(
-                Bucket=self.bucket_name,
-                Key=object_key
-            )
-            return True
-        except ClientError as error:
-            if error.response['Error']['Code'] == '404':
-                return False
+            if format == 'json':
+                stream, format = record_reader.detect_json_layout(stream)
+            if format == 'json':
+                # A JSON array cannot be parsed in chunks, so it is loaded whole and sliced
+                frame = pd.read_json(stream, **pandas_options)
+                for start in range(0, len(frame), chunksize):
+                    yield frame.iloc[start:start + chunksize]
+                return
+            if format == 'csv':
+                reader = pd.read_csv(stream, chunksize=chunksize, **pandas_options)
+            elif format == 'jsonl':
+                reader = pd.read_json(stream, lines=True, chunksize=chunksize, **pandas_options)
             else:
-                logger.error(
-                    f"Error checking object existence - Bucket: {self.bucket_name} | Key: {object_key} | "
-                    f"Error: {error.response['Error']['Code']}"
-                )
-                raise error
+                raise ValueError(f"Unsupported record format: {format}")
+            with reader:
+                yield from reader
+        finally:
+            stream.close()
 
-    def get_object_metadata(self, object_key: str) -> Dict[str, Any]:
+    def list_archive(self, object_key: str, archive_format: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Get object metadata without downloading the content.
+        List the members of a zip or tar archive without downloading it.
 
-        :param object_key: Key name in S3.
-        :return: Object metadata.
+        Zip archives only fetch their central directory with Range GETs; tar
+        archives have no index and are streamed through once.
+
+        :param object_key: Key name of the archive in S3.
+        :param archive_format: 'zip' or 'tar' (detected from the key or content if not given).
+        :return: List of dicts with name, size, compressed_size, last_modified and is_dir.
         """
-        logger.info(f"Getting metadata for object: s3://{self.bucket_name}/{object_key}")
-        
+        logger.info(f"Listing archive: s3://{self.bucket_name}/{object_key}")
+
         try:
-            response = self.s3_client.head_object(
-                Bucket=self.bucket_name,
-                Key=object_key
-            )
-            
-            # Remove the ResponseMetadata
-            metadata = dict(response)
-            metadata.pop('ResponseMetadata', None)
-            
-            logger.info("Object metadata retrieved successfully")
-            return metadata
+            members = S3Archive(self.s3_client, self.bucket_name, object_key, archive_format).list_members()
+            logger.info(f"Archive members found: {len(members)}")
+            return members
         except ClientError as error:
             logger.error(
-                f"Failed to get object metadata - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Failed to list archive - Bucket: {self.bucket_name} | Key: {object_key} | "
                 f"Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
-    def get_presigned_url(
+    def open_archive_member(
         self,
         object_key: str,
-        expiration: int = 3600,
-        http_method: str = 'get_object'
-    ) -> str:
+        member_name: str,
+        archive_format: Optional[str] = None
+    ) -> io.BufferedIOBase:
         """
-        Generate a presigned URL for an object.
+        Open one member of a zip or tar archive as a decompressing stream.
 
-        :param object_key: Key name in S3.
-        :param expiration: Expiration time in seconds.
-        :param http_method: HTTP method (get_object, put_object, etc.).
-        :return: Presigned URL.
+        A zip member is fetched with a single Range GET of its own bytes; a tar
+        archive is streamed from the start and the download stops at the member.
+
+        :param object_key: Key name of the archive in S3.
+        :param member_name: Member name as listed by list_archive.
+        :param archive_format: 'zip' or 'tar' (detected from the key or content if not given).
+        :return: Binary file-like object (use it as a context manager).
         """
-        logger.info(f"Generating presigned URL for object: s3://{self.bucket_name}/{object_key}")
-        
+        logger.info(f"Opening archive member {member_name} of: s3://{self.bucket_name}/{object_key}")
+
         try:
-            url = self.s3_client.generate_presigned_url(
-                http_method,
-                Params={
-                    'Bucket': self.bucket_name,
-                    'Key': object_key
-                },
-                ExpiresIn=expiration
-            )
-            logger.info("Presigned URL generated successfully")
-            return url
+            return S3Archive(self.s3_client, self.bucket_name, object_key, archive_format).open_member(member_name)
         except ClientError as error:
             logger.error(
-                f"Failed to generate presigned URL - Bucket: {self.bucket_name} | Key: {object_key} | "
-                f"Error: {error.response['Error']['Code']} | "
+                f"Failed to open archive member - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Member: {member_name} | Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
-    def set_bucket_policy(self, policy: Union[Dict[str, Any], str]) -> None:
+    def read_archive_member(
+        self,
+        object_key: str,
+        member_name: str,
+        archive_format: Optional[str] = None
+    ) -> bytes:
         """
-        Set the bucket policy.
+        Read one member of a zip or tar archive without downloading the whole archive.
 
-        :param policy: Bucket policy as dict or JSON string.
+        :param object_key: Key name of the archive in S3.
+        :param member_name: Member name as listed by list_archive.
+        :param archive_format: 'zip' or 'tar' (detected from the key or content if not given).
+        :return: Decompressed member content.
         """
-        logger.info(f"Setting bucket policy for bucket: {self.bucket_name}")
-        
+        with self.open_archive_member(object_key, member_name, archive_format) as stream:
+            return stream.read()
+
+    def write_dataset(
+        self,
+        data,
+        prefix: str,
+        partition_cols: Optional[List[str]] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = 'snappy',
+        max_workers: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Write tabular data as a Hive-partitioned Parquet dataset (prefix/col=value/part-*.parquet).
+
+        Each partition streams into its own multipart upload and partitions are
+        encoded and uploaded in parallel.
+
+        :param data: pandas DataFrame, pyarrow Table or RecordBatch, or an iterable of them.
+        :param prefix: Prefix of the dataset.
+        :param partition_cols: Columns encoded in the key instead of the files (optional).
+        :param row_group_size: Rows per Parquet row group.
+        :param compression: Parquet compression codec ('snappy', 'zstd', 'gzip', 'none', ...).
+        :param max_workers: Row groups encoded and uploaded concurrently.
+        :return: Dict with the written keys, rows, partitions and bytes uploaded.
+        """
+        logger.info(f"Writing dataset to S3: s3://{self.bucket_name}/{prefix}")
+
         try:
-            if isinstance(policy, dict):
-                policy = json.dumps(policy)
-            
-            self.s3_client.put_bucket_policy(
-                Bucket=self.bucket_name,
-                Policy=policy
+            return ParquetDataset(self.s3_client, self.bucket_name, prefix).write(
+                data,
+                partition_cols=partition_cols,
+                row_group_size=row_group_size,
+                compression=compression,
+                part_size=max(self.transfer_config.multipart_chunksize, MIN_PART_SIZE),
+                max_workers=max_workers
             )
-            logger.info("Bucket policy set successfully")
         except ClientError as error:
             logger.error(
-                f"Failed to set bucket policy - Bucket: {self.bucket_name} | "
+                f"Failed to write dataset - Bucket: {self.bucket_name} | Prefix: {prefix} | "
                 f"Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
-    def get_bucket_policy(self) -> Dict[str, Any]:
+    def read_dataset(
+        self,
+        prefix: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        max_workers: int = 8,
+        as_arrow: bool = False,
+        partition_schema: Optional[Dict[str, Any]] = None
+    ):
         """
-        Get the bucket policy.
+        Read a Hive-partitioned Parquet dataset, fetching only what the filters can match.
 
-        :return: Bucket policy as dict.
+        Partitions are pruned from their keys, row groups from the footer
+        min/max statistics, and only the needed column chunks are fetched
+        with Range GETs.
+
+        :param prefix: Prefix of the dataset.
+        :param columns: Columns to return, partition columns included (all if not given).
+        :param filters: Predicates in the pyarrow.parquet format, e.g.
+            [('year', '=', 2024), ('amount', '>', 100)] or a list of such lists to OR them.
+        :param max_workers: Files read concurrently.
+        :param as_arrow: Return a pyarrow Table instead of a pandas DataFrame.
+        :param partition_schema: Column -> pyarrow type of partition columns (stored types
+            or inferred ones are used if not given).
+        :return: pandas DataFrame (or pyarrow Table).
         """
-        logger.info(f"Getting bucket policy for bucket: {self.bucket_name}")
-        
+        logger.info(f"Reading dataset from S3: s3://{self.bucket_name}/{prefix}")
+
         try:
-            response = self.s3_client.get_bucket_policy(Bucket=self.bucket_name)
-            policy = json.loads(response['Policy'])
-            logger.info("Bucket policy retrieved successfully")
+            dataset = ParquetDataset(self.s3_client, self.bucket_name, prefix)
+            table = dataset.read(
+                columns=columns,
+                filters=filters,
+                objects=self.iter_objects(prefix=dataset.prefix),
+                max_workers=max_workers,
+                partition_schema=partition_schema
+            )
+            return table if as_arrow else table.to_pandas()
+        except ClientError as error:
+            logger.error(
+                f"Failed to read dataset - Bucket: {self.bucket_name} | Prefix: {prefix} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def put_object(
+        self,
+        object_key: str,
+        body: Union[str, bytes, io.IOBase],
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Put object content to S3.
+
+        :param object_key: Key name in S3.
+        :param body: Content to upload.
+        :param extra_args: Extra arguments to pass to put_object.
+        :return: S3 path of the uploaded object.
+        """
+        s3_path = f"s3://{self.bucket_name}/{object_key}"
+        logger.info(f"Putting object to S3: {s3_path}")
+        
+        try:
+            put_args = {
+                'Bucket': self.bucket_name,
+                'Key': object_key,
+                'Body': body
+            }
+            
+            if extra_args:
+                put_args.update(extra_args)
+
+            codec = self._upload_codec(object_key, extra_args, _body_size(body))
+            if codec:
+                return self._put_compressed(object_key, body, extra_args, codec)
+            
+            self.s3_client.put_object(**put_args)
+            logger.info(f"Object put successfully: {s3_path}")
+            return s3_path
+        except ClientError as error:
+            logger.error(
+                f"Failed to put object - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def _put_compressed(
+        self,
+        object_key: str,
+        body: Union[str, bytes, io.IOBase],
+        extra_args: Optional[Dict[str, Any]],
+        codec: str
+    ) -> str:
+        """Compress a put_object body and upload it with its Content-Encoding"""
+        s3_path = f"s3://{self.bucket_name}/{object_key}"
+        if isinstance(body, (str, bytes, bytearray)):
+            data = body.encode('utf-8') if isinstance(body, str) else bytes(body)
+            payload = codecs.compress_bytes(data, codec, self.compression.level)
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                Body=payload,
+                **self._encoded_args(extra_args, codec, len(data))
+            )
+        else:
+            # Streams are compressed straight into a multipart stream, their
+            # original size is not known up front so it is not recorded
+            with S3StreamWriter(
+                self.s3_client,
+                self.bucket_name,
+                object_key,
+                compression=codec,
+                compression_level=self.compression.level,
+                part_size=max(self.transfer_config.multipart_chunksize, MIN_PART_SIZE),
+                extra_args=self._encoded_args(extra_args, codec)
+            ) as writer:
+                shutil.copyfileobj(body, writer, 1 * MB)
+        logger.info(f"Object put compressed with {codec} successfully: {s3_path}")
+        return s3_path
+
+    def benchmark_compression(
+        self,
+        sample: Union[str, bytes],
+        codecs_to_test: Iterable[str] = ('gzip', 'zstd', 'lz4'),
+        levels: Optional[Dict[str, Iterable[Optional[int]]]] = None,
+        sample_size: int = 8 * MB,
+        repeat: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Compare compression ratio against CPU time of each codec on representative data.
+
+        :param sample: Object key to sample (its first sample_size bytes) or the bytes themselves.
+        :param codecs_to_test: Codecs to measure.
+        :param levels: Codec -> levels to measure (default level only if not given).
+        :param sample_size: Bytes read from the object when sampling a key.
+        :param repeat: Runs per measurement; the fastest is kept.
+        :return: One dict per codec and level, best ratio first.
+        """
+        if isinstance(sample, str):
+            logger.info(f"Benchmarking compression on: s3://{self.bucket_name}/{sample}")
+            response = self.get_object(sample)
+            with response['Body'] as body:
+                sample = body.read(sample_size)
+        results = codecs.benchmark_codecs(sample, codecs_to_test, levels=levels, repeat=repeat)
+        return sorted(results, key=lambda result: -result.get('ratio', 0))
+
+    def open_writer(
+        self,
+        object_key: str,
+        mode: str = 'wb',
+        encoding: str = 'utf-8',
+        compression: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = 4,
+        extra_args: Optional[Dict[str, Any]] = None
+    ) -> S3StreamWriter:
+        """
+        Open a writable file object that streams into a multipart upload.
+
+        Use it as a context manager: the upload is completed on close and
+        aborted if the block raises.
+
+        :param object_key: Key name in S3.
+        :param mode: 'wb' for bytes or 'w' for text.
+        :param encoding: Text encoding in 'w' mode.
+        :param compression: 'gzip', 'zstd' or 'lz4' to compress the stream (sets Content-Encoding).
+        :param part_size: Size in bytes of each uploaded part (minimum 5 MB).
+        :param max_workers: Number of parts uploaded concurrently.
+        :param extra_args: Extra arguments for the object (ContentType, Metadata, ...).
+        :return: S3StreamWriter file object.
+        """
+        logger.info(f"Opening stream writer for object: s3://{self.bucket_name}/{object_key}")
+
+        extra_args = dict(extra_args or {})
+        if 'ContentType' not in extra_args:
+            content_type, _ = mimetypes.guess_type(object_key)
+            if content_type:
+                extra_args['ContentType'] = content_type
+
+        return S3StreamWriter(
+            self.s3_client,
+            self.bucket_name,
+            object_key,
+            mode=mode,
+            encoding=encoding,
+            compression=compression,
+            part_size=part_size,
+            max_workers=max_workers,
+            extra_args=extra_args
+        )
+
+    def put_dedup(
+        self,
+        object_key: str,
+        body: Union[str, bytes, io.IOBase],
+        extra_args: Optional[Dict[str, Any]] = None,
+        mode: str = 'copy',
+        dedup_prefix: str = dedup.DEFAULT_DEDUP_PREFIX
+    ) -> Dict[str, Any]:
+        """
+        Put object content, uploading each distinct content only once.
+
+        The content is hashed (SHA-256) in a streaming pass and stored once as a
+        content-addressed blob under dedup_prefix. The object key then receives
+        either a server-side copy of the blob ('copy', no bytes sent from here)
+        or an empty pointer object whose metadata names the blob ('pointer', no
+        duplicated storage; readers resolve it with resolve_dedup). Both carry
+        the digest in the 'content-sha256' user metadata, so re-putting the same
+        content under the same key is a no-op.
+
+        :param object_key: Key name in S3.
+        :param body: Content to upload.
+        :param extra_args: Extra arguments for the object (ContentType, Metadata, ...).
+        :param mode: 'copy' or 'pointer'.
+        :param dedup_prefix: Prefix of the content-addressed blob store.
+        :return: Dict with s3_path, digest, size, blob_key and status
+            ('unchanged', 'deduplicated' or 'uploaded').
+        """
+        if mode not in ('copy', 'pointer'):
+            raise ValueError(f"Unsupported dedup mode: {mode}")
+        s3_path = f"s3://{self.bucket_name}/{object_key}"
+        extra_args = dict(extra_args or {})
+        if 'ContentType' not in extra_args:
+            content_type, _ = mimetypes.guess_type(object_key)
+            if content_type:
+                extra_args['ContentType'] = content_type
+
+        digest, size, stream = dedup.hash_body(body)
+        blob = dedup.blob_key(digest, dedup_prefix)
+        metadata = {**extra_args.pop('Metadata', {}), dedup.DIGEST_METADATA_KEY: digest}
+        result = {'s3_path': s3_path, 'digest': digest, 'size': size, 'blob_key': blob}
+
+        try:
+            try:
+                current = self.s3_client.head_object(Bucket=self.bucket_name, Key=object_key)
+            except ClientError as error:
+                if error.response['Error']['Code'] != '404':
+                    raise error
+                current = {}
+            if current.get('Metadata', {}).get(dedup.DIGEST_METADATA_KEY) == digest:
+                logger.info(f"Object already holds this content, skipping: {s3_path}")
+                return {**result, 'status': 'unchanged'}
+
+            status = 'deduplicated'
+            if (self.bucket_name, digest) not in self._dedup_index and not self.object_exists(blob):
+                self.s3_client.upload_fileobj(
+                    stream,
+                    self.bucket_name,
+                    blob,
+                    ExtraArgs={**extra_args, 'Metadata': {dedup.DIGEST_METADATA_KEY: digest}},
+                    Config=self.transfer_config
+                )
+                status = 'uploaded'
+            self._dedup_index.add(self.bucket_name, digest)
+
+            if mode == 'pointer':
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    Body=b'',
+                    Metadata={**metadata, dedup.POINTER_METADATA_KEY: blob},
+                    **extra_args
+                )
+            else:
+                self.copy_object(
+                    blob,
+                    object_key,
+                    extra_args={**extra_args, 'Metadata': metadata, 'MetadataDirective': 'REPLACE'},
+                    multipart_threshold=COPY_MULTIPART_THRESHOLD,
+                    source_head={'ContentLength': size}
+                )
+        except ClientError as error:
+            if error.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                # The blob vanished after it was indexed, the next attempt re-uploads it
+                self._dedup_index.discard(self.bucket_name, digest)
+            logger.error(
+                f"Failed to put deduplicated object - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+        finally:
+            if stream is not body:
+                stream.close()
+
+        logger.info(f"Object put with deduplication ({status}): {s3_path} | Digest: {digest}")
+        return {**result, 'status': status}
+
+    def resolve_dedup(self, object_key: str) -> str:
+        """
+        Resolve the key holding the content of an object written by put_dedup.
+
+        :param object_key: Key name in S3.
+        :return: Blob key for pointer objects, otherwise object_key itself.
+        """
+        metadata = self.get_object_metadata(object_key).get('Metadata', {})
+        return metadata.get(dedup.POINTER_METADATA_KEY, object_key)
+
+    def delete_object(self, object_key: str) -> None:
+        """
+        Delete an object from S3.
+
+        :param object_key: Key name in S3.
+        """
+        logger.info(f"Deleting object from S3: s3://{self.bucket_name}/{object_key}")
+        
+        try:
+            self.s3_client.delete_object(
+                Bucket=self.bucket_name,
+                Key=object_key
+            )
+            logger.info("Object deleted successfully")
+        except ClientError as error:
+            logger.error(
+                f"Failed to delete object - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def delete_objects(self, object_keys: List[str]) -> Dict[str, Any]:
+        """
+        Delete multiple objects from S3.
+
+        Keys are sent in batches of 1000, the maximum accepted by a single
+        delete_objects request.
+
+        :param object_keys: List of key names in S3.
+        :return: Response from delete_objects call (Deleted and Errors merged across batches).
+        """
+        logger.info(f"Deleting {len(object_keys)} objects from S3")
+
+        response = {'Deleted': [], 'Errors': []}
+        try:
+            for batch in chunked(object_keys, DELETE_BATCH_SIZE):
+                objects = [{'Key': key} for key in batch]
+                batch_response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': objects}
+                )
+                response['Deleted'].extend(batch_response.get('Deleted', []))
+                response['Errors'].extend(batch_response.get('Errors', []))
+                response['ResponseMetadata'] = batch_response.get('ResponseMetadata')
+
+            logger.info(f"Successfully deleted {len(response['Deleted'])} objects")
+            if response['Errors']:
+                logger.warning(f"Failed to delete {len(response['Errors'])} objects")
+
+            return response
+        except ClientError as error:
+            logger.error(
+                f"Failed to delete objects - Bucket: {self.bucket_name} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def bulk_delete(
+        self,
+        objects: Iterable[Union[str, Dict[str, Any]]],
+        max_workers: int = 8,
+        max_retries: int = 3,
+        max_reported_errors: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Delete any number of objects in concurrent 1000-key batches.
+
+        Accepts plain keys or listing entries (e.g. the output of iter_objects),
+        consumed lazily. Keys failing with throttling or server errors are retried
+        with backoff; other errors are counted as failed.
+
+        :param objects: Iterable of keys or dicts with a 'Key' (and optional 'VersionId').
+        :param max_workers: Number of batches deleted concurrently.
+        :param max_retries: Retries for keys failing with retryable errors.
+        :param max_reported_errors: Maximum number of error entries kept in the result.
+        :return: Dict with deleted and failed counts and a sample of errors.
+        """
+        logger.info(f"Bulk deleting objects from bucket {self.bucket_name}")
+
+        def to_identifier(obj: Union[str, Dict[str, Any]]) -> Dict[str, str]:
+            if isinstance(obj, str):
+                return {'Key': obj}
+            identifier = {'Key': obj['Key']}
+            if obj.get('VersionId'):
+                identifier['VersionId'] = obj['VersionId']
+            return identifier
+
+        result = {'deleted': 0, 'failed': 0, 'batches': 0, 'errors': []}
+        batches = chunked((to_identifier(obj) for obj in objects), DELETE_BATCH_SIZE)
+        for deleted, errors in bounded_map(
+            lambda batch: self._delete_batch(batch, max_retries),
+            batches,
+            max_workers=max_workers
+        ):
+            result['batches'] += 1
+            result['deleted'] += deleted
+            result['failed'] += len(errors)
+            room = max_reported_errors - len(result['errors'])
+            if room > 0:
+                result['errors'].extend(errors[:room])
+
+        logger.info(
+            f"Bulk delete finished - Deleted: {result['deleted']} | "
+            f"Failed: {result['failed']} | Batches: {result['batches']}"
+        )
+        return result
+
+    def _delete_batch(
+        self,
+        identifiers: List[Dict[str, str]],
+        max_retries: int
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Delete one batch of up to 1000 keys, retrying retryable per-key errors"""
+        deleted = 0
+        pending = identifiers
+        errors: List[Dict[str, Any]] = []
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': pending, 'Quiet': True}
+                )
+            except ClientError as error:
+                code = error.response['Error']['Code']
+                if code in RETRYABLE_ERROR_CODES and attempt < max_retries:
+                    sleep_backoff(attempt + 1)
+                    continue
+                logger.error(
+                    f"Failed to delete batch - Bucket: {self.bucket_name} | "
+                    f"Keys: {len(pending)} | Error: {code}"
+                )
+                return deleted, errors + [
+                    {'Key': item['Key'], 'Code': code, 'Message': error.response['Error']['Message']}
+                    for item in pending
+                ]
+
+            # Quiet mode only reports failures, everything else was deleted
+            batch_errors = response.get('Errors', [])
+            deleted += len(pending) - len(batch_errors)
+            retryable = {e['Key'] for e in batch_errors if e.get('Code') in RETRYABLE_ERROR_CODES}
+            errors.extend(e for e in batch_errors if e['Key'] not in retryable)
+            if not retryable:
+                return deleted, errors
+            pending = [item for item in pending if item['Key'] in retryable]
+            if attempt < max_retries:
+                sleep_backoff(attempt + 1)
+
+        errors.extend(
+            {'Key': item['Key'], 'Code': 'RetriesExhausted', 'Message': 'Retryable error persisted'}
+            for item in pending
+        )
+        return deleted, errors
+
+    def copy_object(
+        self,
+        source_key: str,
+        destination_key: str,
+        source_bucket: Optional[str] = None,
+        extra_args: Optional[Dict[str, Any]] = None,
+        multipart_threshold: Optional[int] = None,
+        max_workers: int = 8,
+        source_head: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Copy an object within S3.
+
+        By default a single copy_object request is made; sources over its 5 GB
+        limit fall back to a multipart copy. With multipart_threshold, the source
+        size is read first (a HEAD unless source_head is given) and objects at or
+        above it are copied with concurrent UploadPartCopy byte ranges.
+
+        :param source_key: Source object key.
+        :param destination_key: Destination object key.
+        :param source_bucket: Source bucket (defaults to current bucket).
+        :param extra_args: Extra arguments to pass to copy_object.
+        :param multipart_threshold: Size from which the multipart copy is used (optional,
+            e.g. COPY_MULTIPART_THRESHOLD).
+        :param max_workers: Number of parts copied concurrently.
+        :param source_head: head_object response of the source, if already known.
+        :return: S3 path of the copied object.
+        """
+        source_bucket = source_bucket or self.bucket_name
+        source = f"{source_bucket}/{source_key}"
+        destination_path = f"s3://{self.bucket_name}/{destination_key}"
+        
+        logger.info(f"Copying object from {source} to {destination_path}")
+        
+        try:
+            if multipart_threshold is not None and source_head is None:
+                source_head = self.s3_client.head_object(Bucket=source_bucket, Key=source_key)
+
+            if multipart_threshold is not None and source_head['ContentLength'] >= multipart_threshold:
+                return self._multipart_copy(
+                    source_bucket, source_key, destination_key, source_head, extra_args, max_workers
+                )
+
+            copy_args = {
+                'CopySource': source,
+                'Bucket': self.bucket_name,
+                'Key': destination_key
+            }
+            
+            if extra_args:
+                copy_args.update(extra_args)
+            
+            try:
+                self.s3_client.copy_object(**copy_args)
+            except ClientError as error:
+                if error.response['Error']['Code'] != 'InvalidRequest':
+                    raise error
+                # Sources over 5 GB are rejected by copy_object
+                source_head = self.s3_client.head_object(Bucket=source_bucket, Key=source_key)
+                if source_head['ContentLength'] <= MAX_SINGLE_COPY_SIZE:
+                    raise error
+                logger.info(f"Source is larger than {MAX_SINGLE_COPY_SIZE} bytes, copying in parts")
+                return self._multipart_copy(
+                    source_bucket, source_key, destination_key, source_head, extra_args, max_workers
+                )
+            logger.info("Object copied successfully")
+            return destination_path
+        except ClientError as error:
+            logger.error(
+                f"Failed to copy object - Source: {source} | Destination: {destination_path} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def _multipart_copy(
+        self,
+        source_bucket: str,
+        source_key: str,
+        destination_key: str,
+        source_head: Dict[str, Any],
+        extra_args: Optional[Dict[str, Any]],
+        max_workers: int
+    ) -> str:
+        multipart_copy(
+            self.s3_client,
+            source_bucket,
+            source_key,
+            self.bucket_name,
+            destination_key,
+            source_head=source_head,
+            extra_args=extra_args,
+            max_workers=max_workers
+        )
+        logger.info("Object copied successfully")
+        return f"s3://{self.bucket_name}/{destination_key}"
+
+    def copy_prefix(
+        self,
+        source_prefix: str,
+        destination_prefix: str,
+        source_bucket: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        extra_args: Optional[Dict[str, Any]] = None,
+        max_workers: int = 16,
+        multipart_threshold: int = COPY_MULTIPART_THRESHOLD
+    ) -> Dict[str, Any]:
+        """
+        Copy every object under a prefix concurrently, server side.
+
+        :param source_prefix: Prefix of the objects to copy.
+        :param destination_prefix: Prefix replacing source_prefix in the destination keys.
+        :param source_bucket: Source bucket (defaults to current bucket).
+        :param metadata: User metadata merged over the source metadata of every copy (optional).
+        :param extra_args: Extra arguments for every destination object (optional).
+        :param max_workers: Number of objects copied concurrently.
+        :param multipart_threshold: Size from which objects are copied in parallel parts.
+        :return: Dict with copied and failed counts, copied bytes and a sample of errors.
+        """
+        source_bucket = source_bucket or self.bucket_name
+        logger.info(
+            f"Copying prefix s3://{source_bucket}/{source_prefix} to "
+            f"s3://{self.bucket_name}/{destination_prefix}"
+        )
+
+        def copy_one(obj: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+            source_key = obj['Key']
+            destination_key = destination_prefix + source_key[len(source_prefix):]
+            try:
+                copy_args = dict(extra_args or {})
+                source_head = None
+                # Large objects and metadata rewrites need the source headers
+                if metadata is not None or obj['Size'] >= multipart_threshold:
+                    source_head = self.s3_client.head_object(Bucket=source_bucket, Key=source_key)
+                if metadata is not None:
+                    copy_args = copy_create_args(source_head, copy_args)
+                    copy_args['Metadata'] = {**source_head.get('Metadata', {}), **metadata}
+                    copy_args['MetadataDirective'] = 'REPLACE'
+                    if 'TaggingDirective' in (extra_args or {}):
+                        copy_args['TaggingDirective'] = extra_args['TaggingDirective']
+
+                if source_head is not None and source_head['ContentLength'] >= multipart_threshold:
+                    multipart_copy(
+                        self.s3_client,
+                        source_bucket,
+                        source_key,
+                        self.bucket_name,
+                        destination_key,
+                        source_head=source_head,
+                        extra_args=copy_args
+                    )
+                else:
+                    self.s3_client.copy_object(
+                        CopySource={'Bucket': source_bucket, 'Key': source_key},
+                        Bucket=self.bucket_name,
+                        Key=destination_key,
+                        **copy_args
+                    )
+                return obj, None
+            except ClientError as error:
+                return obj, error.response['Error']['Code']
+
+        result = {'copied': 0, 'failed': 0, 'bytes': 0, 'errors': []}
+        source_objects = self.iter_objects(prefix=source_prefix, bucket_name=source_bucket)
+        for obj, error_code in bounded_map(copy_one, source_objects, max_workers=max_workers):
+            if error_code:
+                result['failed'] += 1
+                if len(result['errors']) < 100:
+                    result['errors'].append({'Key': obj['Key'], 'Code': error_code})
+            else:
+                result['copied'] += 1
+                result['bytes'] += obj['Size']
+
+        logger.info(
+            f"Prefix copy finished - Copied: {result['copied']} | Failed: {result['failed']} | "
+            f"Bytes: {result['bytes']}"
+        )
+        return result
+
+    def object_exists(self, object_key: str) -> bool:
+        """
+        Check if an object exists.
+
+        :param object_key: Key name in S3.
+        :return: True if object exists, False otherwise.
+        """
+        try:
+            self.s3_client.head_object(
+                Bucket=self.bucket_name,
+                Key=object_key
+            )
+            return True
+        except ClientError as error:
+            if error.response['Error']['Code'] == '404':
+                return False
+            else:
+                logger.error(
+                    f"Error checking object existence - Bucket: {self.bucket_name} | Key: {object_key} | "
+                    f"Error: {error.response['Error']['Code']}"
+                )
+                raise error
+
+    def get_object_metadata(self, object_key: str) -> Dict[str, Any]:
+        """
+        Get object metadata without downloading the content.
+
+        :param object_key: Key name in S3.
+        :return: Object metadata.
+        """
+        logger.info(f"Getting metadata for object: s3://{self.bucket_name}/{object_key}")
+        
+        try:
+            response = self.s3_client.head_object(
+                Bucket=self.bucket_name,
+                Key=object_key
+            )
+            
+            # Remove the ResponseMetadata
+            metadata = dict(response)
+            metadata.pop('ResponseMetadata', None)
+            
+            logger.info("Object metadata retrieved successfully")
+            return metadata
+        except ClientError as error:
+            logger.error(
+                f"Failed to get object metadata - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def _list_known_keys(
+        self,
+        keys: List[str],
+        max_pages: Optional[int]
+    ) -> Tuple[Dict[str, Optional[Dict[str, Any]]], List[str]]:
+        """
+        Resolve sorted keys with one listing of their common prefix.
+
+        :return: Listing entry (or None if missing) for each key the listing
+            reached, and the keys left unresolved when the page budget ran out.
+        """
+        ordered = sorted(set(keys))
+        prefix = os.path.commonprefix(ordered)
+        wanted = set(ordered)
+        last_key = ordered[-1]
+        kwargs = {'Bucket': self.bucket_name, 'Prefix': prefix}
+        # A proper prefix of the first key sorts right before it
+        if len(ordered[0]) > len(prefix):
+            kwargs['StartAfter'] = ordered[0][:-1]
+
+        found: Dict[str, Dict[str, Any]] = {}
+        listed_until = None
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page_count, page in enumerate(paginator.paginate(**kwargs), start=1):
+            contents = page.get('Contents', [])
+            for obj in contents:
+                if obj['Key'] in wanted:
+                    found[obj['Key']] = obj
+            if contents:
+                listed_until = contents[-1]['Key']
+            if not page.get('IsTruncated') or (listed_until and listed_until >= last_key):
+                listed_until = last_key
+                break
+            if max_pages and page_count >= max_pages:
+                break
+
+        resolved = {
+            key: found.get(key)
+            for key in ordered
+            if listed_until is not None and key <= listed_until
+        }
+        return resolved, [key for key in ordered if key not in resolved]
+
+    def _batch_lookup(
+        self,
+        keys: List[str],
+        strategy: str,
+        max_workers: int,
+        list_min_keys: int
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Look up many keys with a listing, concurrent HEADs or both"""
+        if strategy not in ('auto', 'list', 'head'):
+            raise ValueError(f"Unsupported lookup strategy: {strategy}")
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        remaining = list(dict.fromkeys(keys))
+        use_listing = strategy == 'list' or (
+            strategy == 'auto'
+            and len(remaining) >= list_min_keys
+            and os.path.commonprefix(remaining)
+        )
+        if use_listing and remaining:
+            # A listing page costs about one HEAD round trip while HEADs run
+            # max_workers at a time, so 'auto' stops listing once it would be slower
+            max_pages = None if strategy == 'list' else max(1, len(remaining) // max_workers)
+            results, remaining = self._list_known_keys(remaining, max_pages)
+            logger.info(
+                f"Resolved {len(results)} keys with a listing, {len(remaining)} left for HEAD requests"
+            )
+
+        def head(key: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            try:
+                response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            except ClientError as error:
+                if error.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                    return key, None
+                logger.error(
+                    f"Error checking object existence - Bucket: {self.bucket_name} | Key: {key} | "
+                    f"Error: {error.response['Error']['Code']}"
+                )
+                raise error
+            response.pop('ResponseMetadata', None)
+            return key, response
+
+        for key, metadata in bounded_map(head, remaining, max_workers=max_workers):
+            results[key] = metadata
+        return results
+
+    def objects_exist(
+        self,
+        object_keys: List[str],
+        strategy: str = 'auto',
+        max_workers: int = 16,
+        list_min_keys: int = 50
+    ) -> Dict[str, bool]:
+        """
+        Check the existence of many objects at once.
+
+        With 'auto', key lists sharing a prefix are answered by listing that
+        prefix, falling back to concurrent HEADs for keys the listing did not
+        reach within its budget; sparse keys go straight to concurrent HEADs.
+
+        :param object_keys: Key names in S3.
+        :param strategy: 'auto', 'list' or 'head'.
+        :param max_workers: Number of concurrent HEAD requests.
+        :param list_min_keys: Minimum number of keys for 'auto' to try a listing.
+        :return: Dict mapping each key to True if it exists.
+        """
+        logger.info(f"Checking existence of {len(object_keys)} objects in bucket {self.bucket_name}")
+        results = self._batch_lookup(object_keys, strategy, max_workers, list_min_keys)
+        return {key: results[key] is not None for key in object_keys}
+
+    def get_objects_metadata(
+        self,
+        object_keys: List[str],
+        strategy: str = 'head',
+        max_workers: int = 16,
+        list_min_keys: int = 50
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get metadata of many objects at once.
+
+        'head' returns full head_object metadata fetched concurrently. 'list' and
+        'auto' may answer from a listing, whose entries only carry Key, Size,
+        ETag, LastModified and StorageClass.
+
+        :param object_keys: Key names in S3.
+        :param strategy: 'head', 'auto' or 'list'.
+        :param max_workers: Number of concurrent HEAD requests.
+        :param list_min_keys: Minimum number of keys for 'auto' to try a listing.
+        :return: Dict mapping each key to its metadata, or None if it does not exist.
+        """
+        logger.info(f"Getting metadata of {len(object_keys)} objects in bucket {self.bucket_name}")
+        results = self._batch_lookup(object_keys, strategy, max_workers, list_min_keys)
+        return {key: results[key] for key in object_keys}
+
+    def get_presigned_url(
+        self,
+        object_key: str,
+        expiration: int = 3600,
+        http_method: str = 'get_object'
+    ) -> str:
+        """
+        Generate a presigned URL for an object.
+
+        :param object_key: Key name in S3.
+        :param expiration: Expiration time in seconds.
+        :param http_method: HTTP method (get_object, put_object, etc.).
+        :return: Presigned URL.
+        """
+        logger.info(f"Generating presigned URL for object: s3://{self.bucket_name}/{object_key}")
+        
+        try:
+            url = self.s3_client.generate_presigned_url(
+                http_method,
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': object_key
+                },
+                ExpiresIn=expiration
+            )
+            logger.info("Presigned URL generated successfully")
+            return url
+        except ClientError as error:
+            logger.error(
+                f"Failed to generate presigned URL - Bucket: {self.bucket_name} | Key: {object_key} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def get_presigned_urls(
+        self,
+        object_keys: Iterable[str],
+        expiration: int = 3600,
+        http_method: str = 'get_object',
+        use_cache: bool = True
+    ) -> Dict[str, str]:
+        """
+        Generate presigned URLs for many objects at once.
+
+        Signing reuses one credentials snapshot and endpoint resolution for the
+        whole batch, once checked to produce the same URLs as get_presigned_url,
+        and URLs still valid for at least half of the requested expiration are
+        served from the presign cache without re-signing.
+
+        :param object_keys: Key names in S3.
+        :param expiration: Expiration time in seconds.
+        :param http_method: HTTP method (get_object, put_object, etc.).
+        :param use_cache: Whether to reuse and remember URLs in the presign cache.
+        :return: Dict mapping each key to its presigned URL.
+        """
+        try:
+            urls = presign_batch(
+                self.s3_client,
+                self.bucket_name,
+                object_keys,
+                expiration=expiration,
+                http_method=http_method,
+                cache=self.presign_cache if use_cache else None,
+                credentials=self.session.get_credentials()
+            )
+        except ClientError as error:
+            logger.error(
+                f"Failed to generate presigned URLs - Bucket: {self.bucket_name} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+        logger.info(f"Generated {len(urls)} presigned URLs for bucket: {self.bucket_name}")
+        return urls
+
+    def set_bucket_policy(self, policy: Union[Dict[str, Any], str]) -> None:
+        """
+        Set the bucket policy.
+
+        :param policy: Bucket policy as dict or JSON string.
+        """
+        logger.info(f"Setting bucket policy for bucket: {self.bucket_name}")
+        
+        try:
+            if isinstance(policy, dict):
+                policy = json.dumps(policy)
+            
+            self.s3_client.put_bucket_policy(
+                Bucket=self.bucket_name,
+                Policy=policy
+            )
+            logger.info("Bucket policy set successfully")
+        except ClientError as error:
+            logger.error(
+                f"Failed to set bucket policy - Bucket: {self.bucket_name} | "
+                f"Error: {error.response['Error']['Code']} | "
+                f"Message: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def get_bucket_policy(self) -> Dict[str, Any]:
+        """
+        Get the bucket policy.
+
+        :return: Bucket policy as dict.
+        """
+        logger.info(f"Getting bucket policy for bucket: {self.bucket_name}")
+        
+        try:
+            response = self.s3_client.get_bucket_policy(Bucket=self.bucket_name)
+            policy = json.loads(response['Policy'])
+            logger.info("Bucket policy retrieved successfully")
             return policy
         except ClientError as error:
             if error.response['Error']['Code'] == 'NoSuchBucketPolicy':
@@ -476,63 +1787,117 @@ class S3Helper:
                 )
                 raise error
                       
-    def list_objects(
+    def _iter_pages(
         self,
         prefix: Optional[str] = None,
         delimiter: Optional[str] = None,
         max_keys: int = 1000,
-        max_pages: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        max_pages: Optional[int] = None,
+        start_after: Optional[str] = None,
+        bucket_name: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
         """
-        List objects in the bucket with pagination.
+        Yield raw list_objects_v2 pages, stopping after max_pages.
 
         :param prefix: Prefix to filter objects.
         :param delimiter: Delimiter for grouping keys.
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
-        :return: List of object metadata.
+        :param start_after: Key after which listing starts (optional).
+        :param bucket_name: Bucket to list (defaults to current bucket).
+        :return: Iterator of list_objects_v2 response pages.
         """
-        logger.info(f"Listing objects in bucket {self.bucket_name}")
-        all_objects = []
+        bucket_name = bucket_name or self.bucket_name
+        kwargs = {
+            'Bucket': bucket_name,
+            'MaxKeys': max_keys
+        }
+
+        if prefix:
+            kwargs['Prefix'] = prefix
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        if start_after:
+            kwargs['StartAfter'] = start_after
+
         page_count = 0
-        
         try:
-            kwargs = {
-                'Bucket': self.bucket_name,
-                'MaxKeys': max_keys
-            }
-            
-            if prefix:
-                kwargs['Prefix'] = prefix
-            if delimiter:
-                kwargs['Delimiter'] = delimiter
-            
-            # Create paginator
             paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(**kwargs)
-            
-            for page in pages:
+            for page in paginator.paginate(**kwargs):
                 page_count += 1
-                objects = page.get('Contents', [])
-                all_objects.extend(objects)
-                
-                logger.debug(f"Page {page_count}: Retrieved {len(objects)} objects")
-                
+                logger.debug(
+                    f"Page {page_count}: Retrieved {len(page.get('Contents', []))} objects, "
+                    f"{len(page.get('CommonPrefixes', []))} common prefixes"
+                )
+                yield page
+
                 # Check if we've reached max pages
                 if max_pages and page_count >= max_pages:
                     logger.info(f"Reached maximum page limit of {max_pages}")
                     break
-            
-            logger.info(f"Found {len(all_objects)} objects across {page_count} pages")
-            return all_objects
         except ClientError as error:
             logger.error(
-                f"Failed to list objects - Bucket: {self.bucket_name} | "
+                f"Failed to list objects - Bucket: {bucket_name} | Prefix: {prefix} | "
                 f"Error: {error.response['Error']['Code']} | "
                 f"Message: {error.response['Error']['Message']}"
             )
             raise error
 
+    def iter_objects(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None,
+        start_after: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        bucket_name: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over objects in the bucket, one page at a time.
+
+        Objects are yielded as soon as their page arrives, so memory stays
+        constant regardless of how many keys live under the prefix.
+
+        :param prefix: Prefix to filter objects.
+        :param delimiter: Delimiter for grouping keys.
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param start_after: Key after which listing starts (optional).
+        :param filters: Dict with filter criteria, same as list_objects_advanced.
+        :param bucket_name: Bucket to list (defaults to current bucket).
+        :return: Iterator of object metadata.
+        """
+        plan = ObjectFilterPlan(filters)
+        for page in self._iter_pages(prefix, delimiter, max_keys, max_pages, start_after, bucket_name):
+            yield from plan.filter_batch(page.get('Contents', []))
+
+    def list_objects(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List objects in the bucket with pagination.
+
+        :param prefix: Prefix to filter objects.
+        :param delimiter: Delimiter for grouping keys.
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :return: List of object metadata.
+        """
+        logger.info(f"Listing objects in bucket {self.bucket_name}")
+        all_objects = list(self.iter_objects(
+            prefix=prefix,
+            delimiter=delimiter,
+            max_keys=max_keys,
+            max_pages=max_pages
+        ))
+        logger.info(f"Found {len(all_objects)} objects")
+        return all_objects
+
     def list_objects_with_metadata(
         self,
         prefix: Optional[str] = None,
@@ -553,66 +1918,29 @@ class S3Helper:
         all_objects = []
         all_common_prefixes = []
         page_count = 0
-        total_objects_found = 0
-        
-        try:
-            kwargs = {
-                'Bucket': self.bucket_name,
-                'MaxKeys': max_keys
-            }
-            
-            if prefix:
-                kwargs['Prefix'] = prefix
-            if delimiter:
-                kwargs['Delimiter'] = delimiter
-            
-            # Create paginator
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(**kwargs)
-            
-            for page in pages:
-                page_count += 1
-                objects = page.get('Contents', [])
-                common_prefixes = page.get('CommonPrefixes', [])
-                
-                all_objects.extend(objects)
-                all_common_prefixes.extend(common_prefixes)
-                total_objects_found += len(objects)
-                
-                logger.debug(
-                    f"Page {page_count}: Retrieved {len(objects)} objects, "
-                    f"{len(common_prefixes)} common prefixes"
-                )
-                
-                # Check if we've reached max pages
-                if max_pages and page_count >= max_pages:
-                    logger.info(f"Reached maximum page limit of {max_pages}")
-                    break
-            
-            result = {
-                'objects': all_objects,
-                'common_prefixes': all_common_prefixes,
-                'metadata': {
-                    'total_objects': total_objects_found,
-                    'total_pages': page_count,
-                    'bucket': self.bucket_name,
-                    'prefix': prefix,
-                    'delimiter': delimiter
-                }
+
+        for page in self._iter_pages(prefix, delimiter, max_keys, max_pages):
+            page_count += 1
+            all_objects.extend(page.get('Contents', []))
+            all_common_prefixes.extend(page.get('CommonPrefixes', []))
+
+        result = {
+            'objects': all_objects,
+            'common_prefixes': all_common_prefixes,
+            'metadata': {
+                'total_objects': len(all_objects),
+                'total_pages': page_count,
+                'bucket': self.bucket_name,
+                'prefix': prefix,
+                'delimiter': delimiter
             }
-            
-            logger.info(
-                f"Found {total_objects_found} objects and {len(all_common_prefixes)} "
-                f"common prefixes across {page_count} pages"
-            )
-            return result
-        except ClientError as error:
-            logger.error(
-                f"Failed to list objects with metadata - Bucket: {self.bucket_name} | "
-                f"Error: {error.response['Error']['Code']} | "
-                f"Message: {error.response['Error']['Message']}"
-            )
-            raise error
+        }
+
+        logger.info(
+            f"Found {len(all_objects)} objects and {len(all_common_prefixes)} "
+            f"common prefixes across {page_count} pages"
+        )
+        return result
 
     def list_objects_by_last_modified(
         self,
@@ -620,7 +1948,9 @@ class S3Helper:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         max_keys: int = 1000,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        source: str = 'auto',
+        partition_layout: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         List objects filtered by last modified date.
@@ -630,35 +1960,46 @@ class S3Helper:
         :param end_date: End date in ISO format (e.g., "2023-12-31").
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param source: 'listing', 'index', 'inventory' or 'auto' (index when configured, else listing).
+        :param partition_layout: Date partition layout of the keys under prefix ('hive', 'path', ...).
+            When given with a start_date, only the partitions of the date range are listed; objects
+            written into a partition of another date are not seen.
         :return: List of object metadata within the date range.
         """
-        from datetime import datetime
-        
         logger.info(
             f"Listing objects by last modified date - "
             f"Start: {start_date}, End: {end_date}"
         )
-        
-        # Get all objects first
-        all_objects = self.list_objects(
-            prefix=prefix,
-            max_keys=max_keys,
-            max_pages=max_pages
-        )
-        
-        # Filter by date range if specified
-        filtered_objects = []
-        for obj in all_objects:
-            last_modified = obj.get('LastModified')
-            if last_modified:
-                if start_date:
-                    if last_modified.date() < datetime.fromisoformat(start_date).date():
-                        continue
-                if end_date:
-                    if last_modified.date() > datetime.fromisoformat(end_date).date():
-                        continue
-                filtered_objects.append(obj)
-        
+
+        source = self._resolve_listing_source(source, max_pages=max_pages)
+        if source == 'index':
+            filtered_objects = list(self.query_listing_index(
+                prefix=prefix,
+                start_date=start_date,
+                end_date=end_date
+            ))
+        elif source == 'inventory':
+            filtered_objects = list(self.inventory.iter_objects(
+                prefix=prefix,
+                filters={'date_range': {'start': start_date, 'end': end_date}}
+            ))
+        elif partition_layout and start_date:
+            filtered_objects = list(self.iter_objects_by_partition(
+                prefix=prefix,
+                start_date=start_date,
+                end_date=end_date,
+                layout=partition_layout,
+                max_keys=max_keys,
+                filters={'date_range': {'start': start_date, 'end': end_date}}
+            ))
+        else:
+            filtered_objects = list(self.iter_objects(
+                prefix=prefix,
+                max_keys=max_keys,
+                max_pages=max_pages,
+                filters={'date_range': {'start': start_date, 'end': end_date}}
+            ))
+
         logger.info(f"Found {len(filtered_objects)} objects in date range")
         return filtered_objects
 
@@ -668,7 +2009,8 @@ class S3Helper:
         min_size: Optional[int] = None,
         max_size: Optional[int] = None,
         max_keys: int = 1000,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        source: str = 'auto'
     ) -> List[Dict[str, Any]]:
         """
         List objects filtered by size.
@@ -678,178 +2020,363 @@ class S3Helper:
         :param max_size: Maximum size in bytes.
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param source: 'listing', 'index', 'inventory' or 'auto' (index when configured, else listing).
         :return: List of object metadata within the size range.
         """
         logger.info(f"Listing objects by size - Min: {min_size}, Max: {max_size}")
-        
-        # Get all objects first
-        all_objects = self.list_objects(
+
+        filters = {}
+        if min_size is not None:
+            filters['min_size'] = min_size
+        if max_size is not None:
+            filters['max_size'] = max_size
+
+        source = self._resolve_listing_source(source, max_pages=max_pages)
+        if source == 'index':
+            filtered_objects = list(self.query_listing_index(prefix=prefix, **filters))
+        elif source == 'inventory':
+            filtered_objects = list(self.inventory.iter_objects(prefix=prefix, filters=filters))
+        else:
+            filtered_objects = list(self.iter_objects(
+                prefix=prefix,
+                max_keys=max_keys,
+                max_pages=max_pages,
+                filters=filters
+            ))
+
+        logger.info(f"Found {len(filtered_objects)} objects in size range")
+        return filtered_objects
+
+    def iter_objects_by_partition(
+        self,
+        prefix: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        layout: str = 'hive',
+        max_workers: int = 16,
+        max_keys: int = 1000,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the objects of the date partitions within a range.
+
+        The range is expanded into partition sub-prefixes (whole months and
+        years collapse into one prefix) that are listed concurrently, so the
+        cost follows the size of the range, not of the prefix. Objects are
+        yielded in partition order as their pages arrive; at most max_workers
+        partitions are listed at once, each a few pages ahead of the consumer.
+
+        :param prefix: Prefix the partitions live under.
+        :param start_date: First partition day in ISO format (e.g., "2023-01-01").
+        :param end_date: Last partition day in ISO format (defaults to today in UTC).
+        :param layout: 'hive' (year=YYYY/month=MM/day=DD/), 'hive_unpadded', 'path'
+            (YYYY/MM/DD/) or a format string with {year}, {month} and {day}.
+        :param max_workers: Number of partitions listed concurrently.
+        :param max_keys: Maximum number of keys per request.
+        :param filters: Dict with filter criteria, same as list_objects_advanced.
+        :return: Iterator of object metadata.
+        """
+        if not start_date:
+            raise ValueError("Partition listing requires a start_date")
+        prefixes = partition_prefixes(prefix or '', start_date, end_date, layout=layout)
+        logger.info(
+            f"Listing {len(prefixes)} date partitions in bucket {self.bucket_name} - "
+            f"Prefix: {prefix} | Start: {start_date}, End: {end_date}"
+        )
+
+        plan = ObjectFilterPlan(filters)
+        lister = ParallelLister(self.s3_client, self.bucket_name, max_workers=max_workers)
+        objects = lister.iter_prefixes(prefixes, max_keys=max_keys)
+        yield from objects if plan.is_empty else filter(plan.matches, objects)
+
+    def list_objects_by_partition(
+        self,
+        prefix: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        layout: str = 'hive',
+        max_workers: int = 16,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List the objects of the date partitions within a range.
+
+        :param prefix: Prefix the partitions live under.
+        :param start_date: First partition day in ISO format (e.g., "2023-01-01").
+        :param end_date: Last partition day in ISO format (defaults to today in UTC).
+        :param layout: Partition layout (see iter_objects_by_partition).
+        :param max_workers: Number of partitions listed concurrently.
+        :param filters: Dict with filter criteria, same as list_objects_advanced.
+        :return: List of object metadata.
+        """
+        objects = list(self.iter_objects_by_partition(
+            prefix=prefix,
+            start_date=start_date,
+            end_date=end_date,
+            layout=layout,
+            max_workers=max_workers,
+            filters=filters
+        ))
+        logger.info(f"Found {len(objects)} objects in date partitions")
+        return objects
+
+    def _use_listing_index(
+        self,
+        delimiter: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> bool:
+        """The index holds flat, complete listings, so it only answers those"""
+        return self.listing_index is not None and not delimiter and not max_pages
+
+    def _resolve_listing_source(
+        self,
+        source: str,
+        delimiter: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> str:
+        """Pick the listing source of the filter methods, validating explicit choices"""
+        if source == 'auto':
+            return 'index' if self._use_listing_index(delimiter=delimiter, max_pages=max_pages) else 'listing'
+        if source == 'index' and self.listing_index is None:
+            raise ValueError("S3Helper was created without a listing_index")
+        if source == 'inventory':
+            if self.inventory is None:
+                raise ValueError("S3Helper was created without an inventory")
+            if delimiter:
+                raise ValueError("The inventory source only answers flat listings (no delimiter)")
+        if source not in ('listing', 'index', 'inventory'):
+            raise ValueError(f"Unsupported listing source: {source}")
+        return source
+
+    def refresh_listing_index(self, prefix: Optional[str] = None, full: bool = False) -> int:
+        """
+        Refresh the local listing index for a prefix.
+
+        :param prefix: Prefix to index.
+        :param full: Re-list the whole prefix instead of only keys after the last indexed one.
+        :return: Number of objects written to the index.
+        """
+        if self.listing_index is None:
+            raise ValueError("S3Helper was created without a listing_index")
+        return self.listing_index.refresh(self.s3_client, self.bucket_name, prefix or '', full=full)
+
+    def query_listing_index(
+        self,
+        prefix: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Query the local listing index, refreshing it first when it is stale.
+
+        :param prefix: Prefix to filter objects.
+        :param min_size: Minimum size in bytes.
+        :param max_size: Maximum size in bytes.
+        :param start_date: Start date in ISO format (e.g., "2023-01-01").
+        :param end_date: End date in ISO format (e.g., "2023-12-31").
+        :return: Iterator of object metadata.
+        """
+        if self.listing_index is None:
+            raise ValueError("S3Helper was created without a listing_index")
+        self.listing_index.ensure_fresh(self.s3_client, self.bucket_name, prefix or '')
+        return self.listing_index.query(
+            self.bucket_name,
+            prefix=prefix or '',
+            min_size=min_size,
+            max_size=max_size,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+    def iter_objects_parallel(
+        self,
+        prefix: Optional[str] = None,
+        strategy: str = 'delimiter',
+        max_workers: int = 16,
+        depth: int = 1,
+        boundaries: Optional[List[str]] = None,
+        shards: int = 16,
+        max_keys: int = 1000,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over objects listing prefix shards concurrently, merged in key order.
+
+        :param prefix: Prefix to filter objects.
+        :param strategy: 'delimiter' to shard by '/' prefixes, 'range' to shard by StartAfter ranges.
+        :param max_workers: Number of shards listed concurrently.
+        :param depth: Delimiter levels expanded into shards ('delimiter' strategy).
+        :param boundaries: Explicit split keys ('range' strategy).
+        :param shards: Number of generated shards when boundaries are not given ('range' strategy).
+        :param max_keys: Maximum number of keys per request.
+        :param max_pages: Maximum number of pages to retrieve, listed serially in key order (None for all).
+        :return: Iterator of object metadata.
+        """
+        lister = ParallelLister(self.s3_client, self.bucket_name, max_workers=max_workers)
+        return lister.iter_objects(
             prefix=prefix,
+            strategy=strategy,
+            depth=depth,
+            boundaries=boundaries,
+            shards=shards,
             max_keys=max_keys,
             max_pages=max_pages
         )
-        
-        # Filter by size range if specified
-        filtered_objects = []
-        for obj in all_objects:
-            size = obj.get('Size', 0)
-            if min_size is not None and size < min_size:
-                continue
-            if max_size is not None and size > max_size:
-                continue
-            filtered_objects.append(obj)
-        
-        logger.info(f"Found {len(filtered_objects)} objects in size range")
-        return filtered_objects
 
     def list_objects_recursively(
         self,
         prefix: Optional[str] = None,
         max_keys: int = 1000,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        max_workers: int = 16
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         List objects recursively, organizing by directory structure.
 
+        The prefix is listed once with concurrent shards and the directory tree
+        is rebuilt from the keys, instead of one round trip per directory. With
+        max_pages the tree is walked level by level, as before, so the limit
+        applies to each directory.
+
         :param prefix: Prefix to filter objects.
         :param max_keys: Maximum number of keys per request.
-        :param max_pages: Maximum number of pages to retrieve (None for all).
+        :param max_pages: Maximum number of pages to retrieve per directory (None for all).
+        :param max_workers: Number of shards listed concurrently.
         :return: Dict with directory structure.
         """
         logger.info(f"Listing objects recursively in bucket {self.bucket_name}")
-        
-        # Get objects with delimiter first to find directories
+        if max_pages:
+            return self._list_directory_levels(prefix, max_keys, max_pages)
+        prefix = prefix or ''
+
+        directory_structure = {
+            'files': [],
+            'directories': {}
+        }
+
+        for obj in self.iter_objects_parallel(
+            prefix=prefix,
+            max_workers=max_workers,
+            max_keys=max_keys,
+            max_pages=max_pages
+        ):
+            node = directory_structure
+            node_prefix = prefix
+            for part in obj['Key'][len(prefix):].split('/')[:-1]:
+                node_prefix = f"{node_prefix}{part}/"
+                if node_prefix not in node['directories']:
+                    logger.debug(f"Processing directory: {node_prefix}")
+                    node['directories'][node_prefix] = {'files': [], 'directories': {}}
+                node = node['directories'][node_prefix]
+            node['files'].append(obj)
+
+        return directory_structure
+
+    def _list_directory_levels(
+        self,
+        prefix: Optional[str],
+        max_keys: int,
+        max_pages: int
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Walk the directory tree with one delimiter listing per level"""
         result = self.list_objects_with_metadata(
             prefix=prefix,
             delimiter='/',
             max_keys=max_keys,
             max_pages=max_pages
         )
-        
         directory_structure = {
             'files': result['objects'],
             'directories': {}
         }
-        
-        # Process common prefixes (directories)
         for common_prefix in result['common_prefixes']:
             prefix_key = common_prefix['Prefix']
             logger.debug(f"Processing directory: {prefix_key}")
-            
-            # Recursively get contents of this directory
-            subdir_result = self.list_objects_recursively(
-                prefix=prefix_key,
-                max_keys=max_keys,
-                max_pages=max_pages
+            directory_structure['directories'][prefix_key] = self._list_directory_levels(
+                prefix_key, max_keys, max_pages
             )
-            
-            directory_structure['directories'][prefix_key] = subdir_result
-        
         return directory_structure
-    
+
     def list_objects_advanced(
         self,
         prefix: Optional[str] = None,
         delimiter: Optional[str] = None,
         max_keys: int = 1000,
         max_pages: Optional[int] = None,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        source: str = 'auto'
     ) -> Dict[str, Any]:
         """
         List objects with advanced filtering options.
 
+        With the inventory source the filters are pushed into the report scan,
+        and original_count is the number of inventory rows scanned.
+
         :param prefix: Prefix to filter objects.
         :param delimiter: Delimiter for grouping keys.
         :param max_keys: Maximum number of keys per request.
         :param max_pages: Maximum number of pages to retrieve (None for all).
         :param filters: Dict with filter criteria (e.g., 'extension', 'min_size', 'max_size', 'date_range').
+        :param source: 'listing', 'index', 'inventory' or 'auto' (index when configured, else listing).
         :return: Dict containing filtered objects and metadata.
         """
         logger.info(f"Listing objects with advanced filters in bucket {self.bucket_name}")
-        
-        # Get all objects first
-        all_objects = self.list_objects(
-            prefix=prefix,
-            delimiter=delimiter,
-            max_keys=max_keys,
-            max_pages=max_pages
-        )
-        
+
+        source = self._resolve_listing_source(source, delimiter=delimiter, max_pages=max_pages)
+        if source == 'inventory':
+            scan_stats: Dict[str, int] = {}
+            filtered_objects = list(self.inventory.iter_objects(prefix=prefix, filters=filters, stats=scan_stats))
+            original_count = scan_stats['rows_scanned']
+        elif source == 'index':
+            # Size and date criteria run as SQL over the index, only key criteria per object
+            plan = ObjectFilterPlan(filters)
+            date_range = (filters or {}).get('date_range') or {}
+            objects = self.query_listing_index(
+                prefix=prefix,
+                min_size=plan.min_size,
+                max_size=plan.max_size,
+                start_date=date_range.get('start'),
+                end_date=date_range.get('end')
+            )
+            filtered_objects = [obj for obj in objects if not plan.has_key or plan.key_matches(obj['Key'])]
+            original_count = self.listing_index.count(self.bucket_name, prefix or '')
+        else:
+            plan = ObjectFilterPlan(filters)
+            original_count = 0
+            filtered_objects = []
+            for page in chunked(self.iter_objects(
+                prefix=prefix,
+                delimiter=delimiter,
+                max_keys=max_keys,
+                max_pages=max_pages
+            ), max_keys):
+                original_count += len(page)
+                filtered_objects.extend(plan.filter_batch(page))
+
         if not filters:
             return {
-                'objects': all_objects,
+                'objects': filtered_objects,
                 'metadata': {
-                    'total_count': len(all_objects),
+                    'total_count': len(filtered_objects),
                     'bucket': self.bucket_name
                 }
             }
-        
-        filtered_objects = []
-        for obj in all_objects:
-            # Apply filters
-            if not _apply_object_filters(obj, filters):
-                continue
-            filtered_objects.append(obj)
-        
+
         result = {
             'objects': filtered_objects,
             'metadata': {
                 'total_count': len(filtered_objects),
-                'original_count': len(all_objects),
+                'original_count': original_count,
                 'bucket': self.bucket_name,
                 'filters_applied': filters
             }
         }
-        
+
         logger.info(
-            f"Applied filters: {len(filtered_objects)} objects out of {len(all_objects)} "
+            f"Applied filters: {len(filtered_objects)} objects out of {original_count} "
             f"matched the criteria"
         )
         return result
 
-
-    def _apply_object_filters(obj: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-        """
-        Apply filters to object metadata.
-
-        :param obj: Object metadata.
-        :param filters: Filter criteria.
-        :return: True if object passes all filters.
-        """
-        # Extension filter
-        if 'extension' in filters:
-            expected_ext = filters['extension']
-            key = obj.get('Key', '')
-            if not key.lower().endswith(f".{expected_ext.lower()}"):
-                return False
-        
-        # Size filters
-        size = obj.get('Size', 0)
-        if 'min_size' in filters and size < filters['min_size']:
-            return False
-        if 'max_size' in filters and size > filters['max_size']:
-            return False
-        
-        # Date filter
-        if 'date_range' in filters:
-            from datetime import datetime
-            last_modified = obj.get('LastModified')
-            if last_modified:
-                date_range = filters['date_range']
-                start_date = date_range.get('start')
-                end_date = date_range.get('end')
-                
-                if start_date and last_modified.date() < datetime.fromisoformat(start_date).date():
-                    return False
-                if end_date and last_modified.date() > datetime.fromisoformat(end_date).date():
-                    return False
-        
-        # Key pattern filter
-        if 'key_pattern' in filters:
-            import re
-            pattern = filters['key_pattern']
-            key = obj.get('Key', '')
-            if not re.search(pattern, key):
-                return False
-        
-        return True
\ No newline at end of file
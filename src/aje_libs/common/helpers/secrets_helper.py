@@ -1,6 +1,5 @@
 # Built-in imports
 import json
-import boto3
 from typing import Union, Optional
 
 # External imports
@@ -8,6 +7,7 @@ from botocore.exceptions import ClientError
 
 # Own imports
 from ..logger import custom_logger
+from .client_registry import get_client
 
 logger = custom_logger(__name__)
 
@@ -19,7 +19,7 @@ class SecretsHelper:
         :param secret_name (str): Nombre del secreto a recuperar.
         """
         self.secret_name = secret_name
-        self.client_sm = boto3.client("secretsmanager")
+        self.client_sm = get_client("secretsmanager")
         logger.info(f"Inicializando SecretsHelper para el secreto: {secret_name}")
 
     def get_secret_value(self, key_name: Optional[str] = None) -> Union[str, None]:
@@ -2,11 +2,11 @@
 from typing import Optional
 
 # External imports
-import boto3
 from botocore.exceptions import ClientError
 
 # Own imports
 from ..logger import custom_logger
+from .client_registry import get_client
 
 logger = custom_logger(__name__)
 
@@ -18,7 +18,7 @@ class SSMParameterHelper:
         :param parameter_name (str): Nombre del parámetro a recuperar.
         """
         self.parameter_name = parameter_name
-        self.client_ssm = boto3.client("ssm")
+        self.client_ssm = get_client("ssm")
         logger.info(f"Inicializando SSMParameterHelper para el parámetro: {parameter_name}")
 
     def get_parameter_value(self, with_decryption: bool = True) -> Optional[str]:
@@ -0,0 +1,42 @@
+# tests/conftest.py
+import os
+import sys
+
+import boto3
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+moto = pytest.importorskip('moto')
+
+from aje_libs.common.helpers import client_registry, metadata_cache  # noqa: E402
+
+BUCKET = 'aje-test-bucket'
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    """Fake credentials and a moto S3 backend, with no client or validation state leaking between tests"""
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_SESSION_TOKEN', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setattr(boto3, 'DEFAULT_SESSION', None)
+    client_registry.clear_clients()
+    metadata_cache.invalidate()
+    with moto.mock_aws():
+        yield
+    client_registry.clear_clients()
+
+
+@pytest.fixture
+def bucket(aws):
+    boto3.client('s3').create_bucket(Bucket=BUCKET)
+    return BUCKET
+
+
+@pytest.fixture
+def s3_helper(bucket):
+    from aje_libs.common.helpers.s3_helper import S3Helper
+
+    return S3Helper(bucket)
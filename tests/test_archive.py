@@ -0,0 +1,82 @@
+# tests/test_archive.py
+import io
+import os
+import tarfile
+import zipfile
+from functools import lru_cache
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+BIG = os.urandom(3 * 1024 * 1024)
+TEXT = b'name,value\n' + b'row,1\n' * 20000
+MEMBERS = {'data/big.bin': BIG, 'data/rows.csv': TEXT, 'README': b'read me'}
+
+
+@lru_cache()
+def _zip_bytes():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('data/big.bin', BIG, compress_type=zipfile.ZIP_STORED)
+        archive.writestr('data/rows.csv', TEXT, compress_type=zipfile.ZIP_DEFLATED)
+        archive.writestr('README', b'read me', compress_type=zipfile.ZIP_BZIP2)
+    return buffer.getvalue()
+
+
+@lru_cache()
+def _tar_bytes(mode):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as archive:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def archives(bucket):
+    s3 = boto3.client('s3')
+    s3.put_object(Bucket=bucket, Key='bundles/bundle.zip', Body=_zip_bytes())
+    s3.put_object(Bucket=bucket, Key='bundles/bundle.tar.gz', Body=_tar_bytes('w:gz'))
+    # No extension: the format comes from the magic bytes
+    s3.put_object(Bucket=bucket, Key='bundles/upload-1', Body=_zip_bytes())
+    s3.put_object(Bucket=bucket, Key='bundles/upload-2', Body=_tar_bytes('w:bz2'))
+    return bucket
+
+
+@pytest.mark.parametrize('key', ['bundles/bundle.zip', 'bundles/bundle.tar.gz', 'bundles/upload-1', 'bundles/upload-2'])
+def test_list_and_read_members(s3_helper, archives, key):
+    members = {member['name']: member for member in s3_helper.list_archive(key)}
+
+    assert {name: member['size'] for name, member in members.items()} == {
+        name: len(data) for name, data in MEMBERS.items()
+    }
+    for name, data in MEMBERS.items():
+        assert s3_helper.read_archive_member(key, name) == data
+
+
+def test_zip_member_reads_fetch_only_its_bytes(archives):
+    metrics = InMemoryMetrics()
+    helper = S3Helper(archives, metrics=metrics, validation='lazy')
+
+    with helper.open_archive_member('bundles/bundle.zip', 'data/rows.csv') as stream:
+        assert stream.read(11) == b'name,value\n'
+        assert stream.read() == TEXT[11:]
+
+    fetched = sum(record['bytes_in'] for record in metrics.records)
+    assert fetched < len(BIG) / 4
+
+
+def test_missing_member(s3_helper, archives):
+    for key in ('bundles/bundle.zip', 'bundles/bundle.tar.gz'):
+        with pytest.raises(KeyError):
+            s3_helper.read_archive_member(key, 'missing.txt')
+
+
+def test_unsupported_format(s3_helper, archives):
+    with pytest.raises(ValueError):
+        s3_helper.list_archive('bundles/bundle.zip', archive_format='rar')
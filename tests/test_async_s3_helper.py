@@ -0,0 +1,104 @@
+# tests/test_async_s3_helper.py
+import asyncio
+import socket
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.async_s3_helper import AsyncS3Helper, SyncS3BatchHelper
+
+pytest.importorskip('aiobotocore')
+requests = pytest.importorskip('requests')
+moto_server = pytest.importorskip('moto.server')
+
+BUCKET = 'aje-async-bucket'
+
+
+@pytest.fixture(scope='module')
+def endpoint_url():
+    """aiobotocore goes through aiohttp, which moto's in-process mock does not intercept"""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    server = moto_server.ThreadedMotoServer(ip_address='127.0.0.1', port=port, verbose=False)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def bucket(endpoint_url, monkeypatch):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    requests.post(f"{endpoint_url}/moto-api/reset")
+    boto3.client('s3', endpoint_url=endpoint_url).create_bucket(Bucket=BUCKET)
+    return BUCKET
+
+
+def test_batch_round_trip(bucket, endpoint_url):
+    async def scenario():
+        async with AsyncS3Helper(bucket, endpoint_url=endpoint_url, max_concurrency=8) as helper:
+            objects = {f"data/{index:04d}.txt": f"body {index}".encode() for index in range(50)}
+            await helper.put_objects(objects)
+
+            assert await helper.read_objects(objects) == objects
+            exists = await helper.objects_exist(['data/0000.txt', 'missing.txt'])
+            metadata = await helper.get_objects_metadata(['data/0001.txt', 'missing.txt'])
+            copied = await helper.copy_objects([('data/0002.txt', 'copy/0002.txt')])
+            listed = await helper.list_objects(prefix='data/', max_keys=7)
+            return exists, metadata, copied, listed, await helper.read_object('copy/0002.txt')
+
+    exists, metadata, copied, listed, copy_body = asyncio.run(scenario())
+    assert exists == {'data/0000.txt': True, 'missing.txt': False}
+    assert metadata['data/0001.txt']['ContentLength'] == len(b'body 1')
+    assert metadata['missing.txt'] is None
+    assert copied == [f"s3://{bucket}/copy/0002.txt"]
+    assert listed == [f"data/{index:04d}.txt" for index in range(50)]
+    assert copy_body == b'body 2'
+
+
+def test_requests_in_flight_never_exceed_max_concurrency(bucket, endpoint_url):
+    in_flight = peak = 0
+
+    async def scenario():
+        async with AsyncS3Helper(bucket, endpoint_url=endpoint_url, max_concurrency=4) as helper:
+            client = await helper._get_client()
+            head_object = client.head_object
+
+            async def counting_head_object(**kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    return await head_object(**kwargs)
+                finally:
+                    in_flight -= 1
+
+            client.head_object = counting_head_object
+            return await helper.get_objects_metadata(f"key-{index}" for index in range(40))
+
+    results = asyncio.run(scenario())
+    assert len(results) == 40 and not any(results.values())
+    assert peak == 4
+
+
+def test_sync_facade_deletes_in_batches(bucket, endpoint_url):
+    keys = [f"bulk/{index:05d}" for index in range(1203)]
+    with SyncS3BatchHelper(bucket, endpoint_url=endpoint_url) as helper:
+        helper.put_objects({key: b'x' for key in keys})
+        response = helper.delete_objects(keys)
+        remaining = helper.list_objects(prefix='bulk/')
+
+    assert len(response['Deleted']) == len(keys)
+    assert response['Errors'] == []
+    assert remaining == []
+
+
+def test_sync_facade_works_inside_a_running_loop(bucket, endpoint_url):
+    async def caller():
+        with SyncS3BatchHelper(bucket, endpoint_url=endpoint_url) as helper:
+            helper.put_objects({'inside.txt': b'loop'})
+            return helper.read_objects(['inside.txt'])
+
+    assert asyncio.run(caller()) == {'inside.txt': b'loop'}
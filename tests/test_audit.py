@@ -0,0 +1,90 @@
+# tests/test_audit.py
+import os
+
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+
+from aje_libs.common.helpers.s3.transfer import MB
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+PREFIX = 'backup/'
+
+
+def _write(root, name, data):
+    path = os.path.join(root, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as handle:
+        handle.write(data)
+    return path
+
+
+@pytest.fixture
+def synced(bucket, tmp_path):
+    """Local tree and its uploaded copy, with one file of each kind of difference"""
+    root = str(tmp_path)
+    s3 = boto3.client('s3')
+    for index in range(40):
+        data = f"file {index}\n".encode() * (index + 1)
+        _write(root, f"dir{index % 3}/file{index:02d}.txt", data)
+        s3.put_object(Bucket=bucket, Key=f"{PREFIX}dir{index % 3}/file{index:02d}.txt", Body=data)
+
+    _write(root, 'changed.bin', b'local content')
+    s3.put_object(Bucket=bucket, Key=f"{PREFIX}changed.bin", Body=b'other content')
+    _write(root, 'resized.bin', b'short')
+    s3.put_object(Bucket=bucket, Key=f"{PREFIX}resized.bin", Body=b'longer content')
+    _write(root, 'only_local.txt', b'local')
+    s3.put_object(Bucket=bucket, Key=f"{PREFIX}only_remote.txt", Body=b'remote')
+    return root
+
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_audit_reports_every_kind_of_difference(bucket, synced, use_processes):
+    helper = S3Helper(bucket)
+    result = helper.audit_checksums(synced, PREFIX, max_workers=2, use_processes=use_processes)
+
+    assert len(result['matched']) == 40
+    mismatched = sorted(result['mismatched'], key=lambda item: item['name'])
+    assert [(item['name'], item['check']) for item in mismatched] == [('changed.bin', 'md5'), ('resized.bin', 'size')]
+    assert result['missing_remote'] == ['only_local.txt']
+    assert result['missing_local'] == ['only_remote.txt']
+    assert result['failed'] == []
+    assert result['summary']['ok'] is False
+
+
+def test_audit_of_identical_trees_is_ok(bucket, tmp_path):
+    root = str(tmp_path)
+    for index in range(10):
+        _write(root, f"part-{index}.csv", os.urandom(1000 + index))
+    helper = S3Helper(bucket)
+    for name in os.listdir(root):
+        helper.upload_file(os.path.join(root, name), PREFIX + name)
+
+    result = helper.audit_checksums(root, PREFIX, use_processes=False)
+    assert result['summary']['ok'] is True
+    assert result['summary']['matched'] == 10
+
+
+def test_audit_matches_multipart_etags(bucket, tmp_path):
+    root = str(tmp_path)
+    path = _write(root, 'large.bin', os.urandom(12 * MB + 123))
+    helper = S3Helper(bucket, transfer_config=TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB))
+    helper.upload_file(path, PREFIX + 'large.bin')
+    assert helper.get_object_metadata(PREFIX + 'large.bin')['ETag'].endswith('-3"')
+
+    result = helper.audit_checksums(root, PREFIX, algorithm='etag', use_processes=False)
+    assert result['matched'] == ['large.bin']
+
+
+def test_audit_with_sha256_checksums(bucket, tmp_path):
+    root = str(tmp_path)
+    s3 = boto3.client('s3')
+    for name, data in (('a.txt', b'alpha'), ('b.txt', b'bravo')):
+        _write(root, name, data)
+        s3.put_object(Bucket=bucket, Key=PREFIX + name, Body=data, ChecksumAlgorithm='SHA256')
+    _write(root, 'c.txt', b'charlie')
+    s3.put_object(Bucket=bucket, Key=PREFIX + 'c.txt', Body=b'CHARLIE', ChecksumAlgorithm='SHA256')
+
+    result = S3Helper(bucket).audit_checksums(root, PREFIX, algorithm='sha256', use_processes=False)
+    assert sorted(result['matched']) == ['a.txt', 'b.txt']
+    assert [(item['name'], item['check']) for item in result['mismatched']] == [('c.txt', 'sha256')]
@@ -0,0 +1,78 @@
+# tests/test_batch_lookup.py
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+STORED = [f"orders/2024/{index:04d}.json" for index in range(0, 120, 2)]
+REQUESTED = [f"orders/2024/{index:04d}.json" for index in range(100)]
+
+
+@pytest.fixture
+def orders_bucket(bucket):
+    s3 = boto3.client('s3')
+    for key in STORED:
+        s3.put_object(Bucket=bucket, Key=key, Body=b'{}', Metadata={'source': 'erp'})
+    s3.put_object(Bucket=bucket, Key='orders/2023/0001.json', Body=b'{}')
+    return bucket
+
+
+@pytest.fixture
+def metrics():
+    return InMemoryMetrics()
+
+
+@pytest.fixture
+def helper(orders_bucket, metrics):
+    return S3Helper(orders_bucket, metrics=metrics, validation='lazy')
+
+
+def _calls(metrics, operation):
+    return sum(record['operation'] == operation for record in metrics.records)
+
+
+@pytest.mark.parametrize('strategy', ['auto', 'list', 'head'])
+def test_objects_exist(helper, strategy):
+    result = helper.objects_exist(REQUESTED + ['orders/2023/0001.json', 'missing.json'], strategy=strategy)
+
+    assert result == {
+        **{key: key in STORED for key in REQUESTED},
+        'orders/2023/0001.json': True,
+        'missing.json': False,
+    }
+
+
+def test_auto_answers_shared_prefixes_with_a_listing(helper, metrics):
+    result = helper.objects_exist(REQUESTED)
+
+    assert sum(result.values()) == 50
+    assert _calls(metrics, 'ListObjectsV2') == 1
+    assert _calls(metrics, 'HeadObject') == 0
+
+
+def test_auto_falls_back_to_head_when_the_listing_budget_runs_out(helper, metrics):
+    # One page of 1000 keys is allowed: only part of a longer listing fits
+    s3 = boto3.client('s3')
+    for index in range(1000):
+        s3.put_object(Bucket=helper.bucket_name, Key=f"orders/2024/0001.json.{index:04d}", Body=b'')
+    metrics.records.clear()
+
+    result = helper.objects_exist(REQUESTED, max_workers=64, list_min_keys=10)
+
+    assert result == {key: key in STORED for key in REQUESTED}
+    assert _calls(metrics, 'ListObjectsV2') == 1
+    assert 0 < _calls(metrics, 'HeadObject') < len(REQUESTED)
+
+
+def test_get_objects_metadata(helper, metrics):
+    result = helper.get_objects_metadata(['orders/2024/0002.json', 'orders/2024/0003.json'])
+
+    assert result['orders/2024/0002.json']['Metadata'] == {'source': 'erp'}
+    assert result['orders/2024/0003.json'] is None
+    assert _calls(metrics, 'HeadObject') == 2
+
+
+def test_unknown_strategy_is_rejected(helper):
+    with pytest.raises(ValueError):
+        helper.objects_exist(REQUESTED, strategy='scan')
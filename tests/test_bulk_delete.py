@@ -0,0 +1,99 @@
+# tests/test_bulk_delete.py
+import threading
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from aje_libs.common.helpers import s3_helper as s3_helper_module
+
+KEY_COUNT = 2100
+# Deleting missing keys succeeds, so retry tests need no stored objects
+KEYS = [f"tmp/{index:05d}" for index in range(KEY_COUNT)]
+
+
+@pytest.fixture
+def many_objects(bucket):
+    s3 = boto3.client('s3')
+    for key in KEYS:
+        s3.put_object(Bucket=bucket, Key=key, Body=b'')
+    s3.put_object(Bucket=bucket, Key='keep/file', Body=b'')
+    return KEYS
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(s3_helper_module, 'sleep_backoff', lambda attempt: None)
+
+
+def _remaining(bucket):
+    paginator = boto3.client('s3').get_paginator('list_objects_v2')
+    return [obj['Key'] for page in paginator.paginate(Bucket=bucket) for obj in page.get('Contents', [])]
+
+
+def _throttle(monkeypatch, client, decide):
+    """Route delete_objects through decide(call number, request, original), which may raise or answer"""
+    original = client.delete_objects
+    calls = []
+    lock = threading.Lock()
+
+    def delete_objects(**kwargs):
+        with lock:
+            calls.append(kwargs)
+            number = len(calls)
+        return decide(number, kwargs, original) or original(**kwargs)
+
+    monkeypatch.setattr(client, 'delete_objects', delete_objects)
+    return calls
+
+
+def test_bulk_delete_chunks_a_listing(s3_helper, bucket, many_objects):
+    result = s3_helper.bulk_delete(s3_helper.iter_objects(prefix='tmp/'), max_workers=3)
+
+    assert result == {'deleted': KEY_COUNT, 'failed': 0, 'batches': 3, 'errors': []}
+    assert _remaining(bucket) == ['keep/file']
+
+
+def test_bulk_delete_retries_throttled_batches(s3_helper, monkeypatch):
+    def decide(number, request, original):
+        if number == 1:
+            raise ClientError({'Error': {'Code': 'SlowDown', 'Message': 'Reduce your request rate'}}, 'DeleteObjects')
+
+    calls = _throttle(monkeypatch, s3_helper.s3_client, decide)
+
+    result = s3_helper.bulk_delete(KEYS, max_workers=1)
+
+    assert result['deleted'] == KEY_COUNT and result['failed'] == 0
+    assert len(calls) == 4
+
+
+def test_bulk_delete_retries_only_throttled_keys(s3_helper, monkeypatch):
+    throttled = KEYS[:3]
+
+    def decide(number, request, original):
+        if number == 1:
+            # First request: delete everything but report three keys as throttled
+            keys = [item['Key'] for item in request['Delete']['Objects'] if item['Key'] not in throttled]
+            original(Bucket=request['Bucket'], Delete={'Objects': [{'Key': key} for key in keys]})
+            return {'Errors': [{'Key': key, 'Code': 'SlowDown', 'Message': 'Slow down'} for key in throttled]}
+
+    calls = _throttle(monkeypatch, s3_helper.s3_client, decide)
+
+    result = s3_helper.bulk_delete(KEYS[:1000], max_workers=1)
+
+    assert result['deleted'] == 1000 and result['failed'] == 0
+    assert [item['Key'] for item in calls[1]['Delete']['Objects']] == throttled
+
+
+def test_bulk_delete_reports_persistent_errors(s3_helper, monkeypatch):
+    def decide(number, request, original):
+        raise ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}, 'DeleteObjects')
+
+    calls = _throttle(monkeypatch, s3_helper.s3_client, decide)
+
+    result = s3_helper.bulk_delete(KEYS, max_workers=2, max_reported_errors=10)
+
+    assert result['deleted'] == 0 and result['failed'] == KEY_COUNT
+    assert len(result['errors']) == 10
+    assert result['errors'][0]['Code'] == 'AccessDenied'
+    assert len(calls) == 3
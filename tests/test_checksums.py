@@ -0,0 +1,59 @@
+# tests/test_checksums.py
+import os
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.checksums import compute_etag, etag_matches, verify_file
+from aje_libs.common.helpers.s3.transfer import MB, build_transfer_config
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+PART_SIZE = 5 * MB
+
+
+@pytest.fixture
+def multipart_helper(bucket):
+    return S3Helper(bucket, transfer_config=build_transfer_config(part_size=PART_SIZE))
+
+
+def _file(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+
+@pytest.mark.parametrize('size, suffix', [(1 * MB, None), (PART_SIZE, '-1'), (12 * MB, '-3')])
+def test_etag_round_trip(multipart_helper, bucket, tmp_path, size, suffix):
+    path = _file(tmp_path, 'data.bin', size)
+    multipart_helper.upload_file(path, 'data.bin')
+    etag = boto3.client('s3').head_object(Bucket=bucket, Key='data.bin')['ETag'].strip('"')
+
+    if suffix:
+        assert etag.endswith(suffix)
+    else:
+        assert '-' not in etag
+    assert compute_etag(path, PART_SIZE) == etag
+    assert etag_matches(path, etag, size)
+    assert etag_matches(path, etag, size, (PART_SIZE,))
+    assert verify_file(path, {'md5': etag}, size)['matched']
+
+
+def test_etag_mismatch(tmp_path):
+    path = _file(tmp_path, 'data.bin', PART_SIZE)
+    other = _file(tmp_path, 'other.bin', PART_SIZE)
+
+    assert not etag_matches(path, compute_etag(other, PART_SIZE), PART_SIZE)
+    assert not etag_matches(path, compute_etag(other))
+
+
+def test_sync_skips_single_part_multipart_objects(multipart_helper, tmp_path):
+    source = tmp_path / 'source'
+    source.mkdir()
+    _file(source, 'one_part.bin', PART_SIZE)
+    _file(source, 'small.bin', 100)
+
+    first = multipart_helper.sync(str(source), 'mirror/')
+    second = multipart_helper.sync(str(source), 'mirror/')
+
+    assert sorted(first['transferred']) == ['one_part.bin', 'small.bin']
+    assert second['transferred'] == []
@@ -0,0 +1,67 @@
+# tests/test_client_registry.py
+import threading
+
+import boto3
+from botocore.config import Config
+
+from aje_libs.common.helpers import client_registry
+from aje_libs.common.helpers.dynamodb_helper import DynamoDBHelper
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+def test_helpers_share_one_client(bucket):
+    first = S3Helper(bucket)
+    second = S3Helper(bucket)
+
+    assert first.s3_client is second.s3_client
+    assert first.s3_client is client_registry.get_client('s3')
+
+
+def test_clients_are_keyed_by_region_and_config(aws):
+    default = client_registry.get_client('s3')
+
+    assert client_registry.get_client('s3', region_name='eu-west-1') is not default
+    pooled = client_registry.get_client('s3', config=Config(max_pool_connections=50))
+    assert pooled is not default
+    assert client_registry.get_client('s3', config=Config(max_pool_connections=50)) is pooled
+    assert client_registry.get_client('s3', config=Config(max_pool_connections=50), cache_key='pool') is not pooled
+
+
+def test_replacing_the_default_session_rebuilds_clients(aws):
+    previous = client_registry.get_client('s3')
+
+    boto3.setup_default_session(region_name='eu-west-1')
+
+    client = client_registry.get_client('s3')
+    assert client is not previous
+    assert client.meta.region_name == 'eu-west-1'
+
+
+def test_clear_clients(aws):
+    previous = client_registry.get_client('dynamodb')
+    resource = client_registry.get_resource('dynamodb')
+
+    client_registry.clear_clients()
+
+    assert client_registry.get_client('dynamodb') is not previous
+    assert client_registry.get_resource('dynamodb') is not resource
+
+
+def test_resources_are_cached_per_thread(aws):
+    resource = client_registry.get_resource('dynamodb')
+    assert client_registry.get_resource('dynamodb') is resource
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(client_registry.get_resource('dynamodb')))
+    thread.start()
+    thread.join()
+    assert other[0] is not resource
+
+
+def test_prewarm_builds_the_clients_helpers_use(aws):
+    client_registry.prewarm(['dynamodb', ('s3', 'eu-west-1')])
+
+    helper = DynamoDBHelper('aje-test-table', 'pk', validation='lazy')
+
+    assert helper.dynamodb_client is client_registry.get_client('dynamodb')
+    assert client_registry.get_client('s3', 'eu-west-1') is client_registry.get_client('s3', region_name='eu-west-1')
@@ -0,0 +1,145 @@
+# tests/test_compression.py
+import io
+import os
+
+import boto3
+import pytest
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from aje_libs.common.helpers.s3 import codecs
+from aje_libs.common.helpers.s3.codecs import CompressionPolicy
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3.transfer import MB
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+# Small parts so a few MB already take several ranged GETs
+PARTS = TransferConfig(multipart_chunksize=1 * MB, max_concurrency=4)
+
+
+@pytest.fixture
+def metrics():
+    return InMemoryMetrics()
+
+
+@pytest.fixture
+def compressed_helper(bucket, metrics):
+    return S3Helper(
+        bucket,
+        compression=CompressionPolicy(default='gzip'),
+        metrics=metrics,
+        validation='lazy',
+        transfer_config=PARTS,
+    )
+
+
+def _operations(metrics):
+    return [record['operation'] for record in metrics.records]
+
+
+def _payload(size):
+    # Half random, half repetitive: several parts even once compressed
+    return os.urandom(size // 2) + b'aje-libs ' * (size // 18)
+
+
+def test_download_of_raw_object_makes_no_head_request(compressed_helper, metrics, bucket, tmp_path):
+    data = os.urandom(3 * MB + 17)
+    boto3.client('s3').put_object(Bucket=bucket, Key='raw.bin', Body=data)
+    received = []
+
+    target = tmp_path / 'raw.bin'
+    compressed_helper.download_file('raw.bin', str(target), callback=received.append)
+
+    assert target.read_bytes() == data
+    assert sum(received) == len(data)
+    operations = _operations(metrics)
+    assert 'HeadObject' not in operations
+    assert operations.count('GetObject') == 4
+
+
+def test_download_decompresses_with_stored_byte_progress(compressed_helper, metrics, bucket):
+    data = _payload(6 * MB)
+    compressed_helper.upload_fileobj(io.BytesIO(data), 'data/blob.bin')
+    stored_size = boto3.client('s3').head_object(Bucket=bucket, Key='data/blob.bin')['ContentLength']
+    assert stored_size < len(data)
+    metrics.records.clear()
+    received = []
+
+    output = io.BytesIO()
+    compressed_helper.download_fileobj('data/blob.bin', output, callback=received.append)
+
+    assert output.getvalue() == data
+    assert sum(received) == stored_size
+    assert 'HeadObject' not in _operations(metrics)
+    assert _operations(metrics).count('GetObject') > 1
+
+
+def test_download_of_empty_object(compressed_helper, bucket):
+    boto3.client('s3').put_object(Bucket=bucket, Key='empty.txt', Body=b'')
+
+    output = io.BytesIO()
+    compressed_helper.download_fileobj('empty.txt', output)
+
+    assert output.getvalue() == b''
+
+
+def test_put_object_streams_compressed_body(compressed_helper, metrics, bucket):
+    data = b'line of text\n' * 100000
+
+    compressed_helper.put_object('logs/app.log', io.BytesIO(data))
+
+    stored = boto3.client('s3').get_object(Bucket=bucket, Key='logs/app.log')
+    assert stored['ContentEncoding'] == 'gzip'
+    assert stored['Metadata'][codecs.CODEC_METADATA_KEY] == 'gzip'
+    assert codecs.decompress_bytes(stored['Body'].read(), 'gzip') == data
+    assert compressed_helper.read_object('logs/app.log') == data
+
+
+def test_sync_does_not_reupload_compressed_objects(compressed_helper, tmp_path):
+    for index in range(5):
+        (tmp_path / f"file{index}.txt").write_bytes(f"row {index}\n".encode() * 2000)
+
+    first = compressed_helper.sync(str(tmp_path), 'mirror/')
+    second = compressed_helper.sync(str(tmp_path), 'mirror/')
+
+    assert len(first['transferred']) == 5
+    assert second['transferred'] == []
+    assert len(second['skipped']) == 5
+
+
+def test_sync_transfers_changed_compressed_object(compressed_helper, tmp_path):
+    path = tmp_path / 'file.txt'
+    path.write_bytes(b'original\n' * 2000)
+    compressed_helper.sync(str(tmp_path), 'mirror/')
+
+    path.write_bytes(b'changed content\n' * 2000)
+    result = compressed_helper.sync(str(tmp_path), 'mirror/')
+
+    assert result['transferred'] == ['file.txt']
+    assert compressed_helper.read_object('mirror/file.txt') == b'changed content\n' * 2000
+
+
+def test_failed_download_keeps_the_existing_file(compressed_helper, tmp_path):
+    target = tmp_path / 'report.csv'
+    target.write_bytes(b'previous content')
+
+    with pytest.raises(ClientError):
+        compressed_helper.download_file('missing.csv', str(target))
+
+    assert target.read_bytes() == b'previous content'
+    assert os.listdir(tmp_path) == ['report.csv']
+
+
+def test_interrupted_download_keeps_the_existing_file(compressed_helper, tmp_path):
+    compressed_helper.upload_fileobj(io.BytesIO(_payload(3 * MB)), 'data/blob.bin')
+    target = tmp_path / 'blob.bin'
+    target.write_bytes(b'previous content')
+
+    def interrupt(_):
+        raise RuntimeError("connection dropped")
+
+    with pytest.raises(RuntimeError):
+        compressed_helper.download_file('data/blob.bin', str(target), callback=interrupt)
+
+    assert target.read_bytes() == b'previous content'
+    assert os.listdir(tmp_path) == ['blob.bin']
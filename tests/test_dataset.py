@@ -0,0 +1,67 @@
+# tests/test_dataset.py
+import datetime
+
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+
+from aje_libs.common.helpers.s3.dataset import COMMON_METADATA_FILE  # noqa: E402
+
+
+@pytest.fixture
+def sales():
+    return pa.table({
+        'm': ['01', '02', '01', '02', '10'],
+        'year': [2023, 2024, 2024, 2024, 2023],
+        'day': [datetime.date(2024, 1, day) for day in (1, 2, 1, 2, 1)],
+        'amount': [10, 20, 30, 40, 50],
+    })
+
+
+def test_string_partitions_keep_their_type(s3_helper, sales):
+    s3_helper.write_dataset(sales, 'sales/', partition_cols=['m'])
+
+    table = s3_helper.read_dataset('sales/', as_arrow=True)
+    filtered = s3_helper.read_dataset('sales/', filters=[('m', '=', '01')], as_arrow=True)
+
+    assert table.schema.field('m').type == pa.string()
+    assert sorted(table['m'].to_pylist()) == ['01', '01', '02', '02', '10']
+    assert sorted(filtered['amount'].to_pylist()) == [10, 30]
+
+
+def test_typed_partitions_round_trip(s3_helper, sales):
+    s3_helper.write_dataset(sales, 'sales/', partition_cols=['year', 'day'])
+
+    table = s3_helper.read_dataset('sales/', filters=[('day', '=', datetime.date(2024, 1, 2))], as_arrow=True)
+
+    assert table.schema.field('year').type == pa.int64()
+    assert table.schema.field('day').type == pa.date32()
+    assert sorted(table['amount'].to_pylist()) == [20, 40]
+
+
+def test_partition_types_are_inferred_without_metadata(s3_helper, sales, bucket):
+    s3_helper.write_dataset(sales, 'sales/', partition_cols=['m'])
+    s3_helper.delete_object(f"sales/{COMMON_METADATA_FILE}")
+
+    inferred = s3_helper.read_dataset('sales/', filters=[('m', '=', 1)], as_arrow=True)
+    declared = s3_helper.read_dataset(
+        'sales/', filters=[('m', '=', '01')], partition_schema={'m': pa.string()}, as_arrow=True
+    )
+
+    assert sorted(inferred['amount'].to_pylist()) == [10, 30]
+    assert sorted(declared['amount'].to_pylist()) == [10, 30]
+    with pytest.raises(ValueError, match="partition column 'm'"):
+        s3_helper.read_dataset('sales/', filters=[('m', '=', '01')])
+
+
+def test_filters_prune_partitions_and_row_groups(s3_helper, sales):
+    from aje_libs.common.helpers.s3.dataset import ParquetDataset
+
+    s3_helper.write_dataset(sales, 'sales/', partition_cols=['year'], row_group_size=1)
+    dataset = ParquetDataset(s3_helper.s3_client, s3_helper.bucket_name, 'sales/')
+
+    table = dataset.read(filters=[('year', '=', 2024), ('amount', '>', 25)])
+
+    assert sorted(table['amount'].to_pylist()) == [30, 40]
+    assert dataset.stats['files_pruned'] == 1
+    assert dataset.stats['row_groups_skipped'] == 1
@@ -0,0 +1,72 @@
+# tests/test_dedup.py
+import hashlib
+import io
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from aje_libs.common.helpers.s3 import dedup
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+CONTENT = b'id,amount\n1,10\n2,20\n' * 1000
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+
+
+def _body(bucket, key):
+    return boto3.client('s3').get_object(Bucket=bucket, Key=key)['Body'].read()
+
+
+def test_same_content_is_uploaded_once(s3_helper, bucket):
+    first = s3_helper.put_dedup('reports/a.csv', CONTENT)
+    second = s3_helper.put_dedup('reports/b.csv', io.BytesIO(CONTENT))
+    third = s3_helper.put_dedup('reports/a.csv', CONTENT.decode('utf-8'))
+
+    assert [first['status'], second['status'], third['status']] == ['uploaded', 'deduplicated', 'unchanged']
+    assert first['digest'] == DIGEST and first['size'] == len(CONTENT)
+    assert first['blob_key'] == dedup.blob_key(DIGEST)
+    for key in ('reports/a.csv', 'reports/b.csv'):
+        assert _body(bucket, key) == CONTENT
+        stored = boto3.client('s3').head_object(Bucket=bucket, Key=key)
+        assert stored['Metadata'] == {dedup.DIGEST_METADATA_KEY: DIGEST}
+        assert stored['ContentType'] == 'text/csv'
+
+
+def test_pointer_mode_stores_no_copy(s3_helper, bucket):
+    s3_helper.put_dedup('reports/a.csv', CONTENT, extra_args={'Metadata': {'owner': 'finance'}}, mode='pointer')
+
+    stored = boto3.client('s3').head_object(Bucket=bucket, Key='reports/a.csv')
+    assert stored['ContentLength'] == 0
+    assert stored['Metadata']['owner'] == 'finance'
+    blob = s3_helper.resolve_dedup('reports/a.csv')
+    assert blob == dedup.blob_key(DIGEST)
+    assert _body(bucket, blob) == CONTENT
+    assert s3_helper.resolve_dedup(blob) == blob
+
+
+def test_new_helpers_find_existing_blobs(bucket):
+    S3Helper(bucket).put_dedup('reports/a.csv', CONTENT)
+    metrics = InMemoryMetrics()
+
+    result = S3Helper(bucket, metrics=metrics, validation='lazy').put_dedup('reports/b.csv', CONTENT)
+
+    assert result['status'] == 'deduplicated'
+    operations = [record['operation'] for record in metrics.records]
+    assert 'PutObject' not in operations and 'UploadPart' not in operations
+
+
+def test_deleted_blob_is_uploaded_again(s3_helper, bucket):
+    s3_helper.put_dedup('reports/a.csv', CONTENT)
+    boto3.client('s3').delete_object(Bucket=bucket, Key=dedup.blob_key(DIGEST))
+
+    # The in-process index still lists the blob: the copy fails and drops it
+    with pytest.raises(ClientError):
+        s3_helper.put_dedup('reports/b.csv', CONTENT)
+    assert s3_helper.put_dedup('reports/b.csv', CONTENT)['status'] == 'uploaded'
+    assert _body(bucket, 'reports/b.csv') == CONTENT
+
+
+def test_unknown_mode_is_rejected(s3_helper):
+    with pytest.raises(ValueError):
+        s3_helper.put_dedup('reports/a.csv', CONTENT, mode='link')
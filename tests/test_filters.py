@@ -0,0 +1,53 @@
+# tests/test_filters.py
+from datetime import datetime, timezone
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.filters import ObjectFilterPlan
+from aje_libs.common.helpers.s3.listing_index import ListingIndex
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+FILTERS = {'extension': 'CSV', 'min_size': 100, 'max_size': 1000, 'key_pattern': r'/20\d\d/'}
+
+
+def _object(key, size, day):
+    return {'Key': key, 'Size': size, 'LastModified': datetime(2024, 1, day, 12, tzinfo=timezone.utc)}
+
+
+def test_plan_criteria():
+    plan = ObjectFilterPlan({**FILTERS, 'date_range': {'start': '2024-01-02', 'end': '2024-01-03T00:00:00'}})
+
+    assert plan.matches(_object('logs/2024/a.csv', 500, 2))
+    assert plan.matches(_object('logs/2024/a.CSV', 1000, 3))
+    assert not plan.matches(_object('logs/2024/a.csv', 500, 1))
+    assert not plan.matches(_object('logs/2024/a.csv', 500, 4))
+    assert not plan.matches(_object('logs/2024/a.csv', 1001, 2))
+    assert not plan.matches(_object('logs/2024/a.json', 500, 2))
+    assert not plan.matches(_object('logs/misc/a.csv', 500, 2))
+    assert ObjectFilterPlan().is_empty
+
+
+@pytest.fixture
+def filtered_bucket(bucket):
+    s3 = boto3.client('s3')
+    for index in range(30):
+        extension = 'csv' if index % 2 else 'json'
+        folder = '2024' if index % 3 else 'misc'
+        s3.put_object(Bucket=bucket, Key=f"logs/{folder}/{index:02d}.{extension}", Body=b'x' * (index * 40))
+    return bucket
+
+
+@pytest.mark.parametrize('source', ['listing', 'index'])
+def test_list_objects_advanced_sources_agree(filtered_bucket, tmp_path, source):
+    helper = S3Helper(filtered_bucket, listing_index=ListingIndex(str(tmp_path / 'index.db')))
+    expected = sorted(
+        f"logs/{'2024' if index % 3 else 'misc'}/{index:02d}.csv"
+        for index in range(30) if index % 2 and index % 3 and 100 <= index * 40 <= 1000
+    )
+
+    result = helper.list_objects_advanced(prefix='logs/', filters=FILTERS, source=source, max_keys=7)
+
+    assert sorted(obj['Key'] for obj in result['objects']) == expected
+    assert result['metadata']['original_count'] == 30
+    assert result['metadata']['total_count'] == len(expected)
@@ -0,0 +1,190 @@
+# tests/test_inventory.py
+import csv
+import gzip
+import io
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.inventory import S3Inventory
+
+SOURCE_BUCKET = 'inventoried-bucket'
+DESTINATION_BUCKET = 'inventory-reports'
+CONFIG_PATH = f"{SOURCE_BUCKET}/daily"
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+ROWS = 4000
+
+
+def _rows():
+    """Inventory rows: keys under logs/ and data/, growing sizes, one day apart every 100 rows"""
+    for index in range(ROWS):
+        folder = 'logs' if index % 2 else 'data'
+        yield {
+            'key': f"{folder}/file-{index:05d}.{'json' if index % 4 == 1 else 'csv'}",
+            'size': index * 10,
+            'last_modified_date': START + timedelta(days=index // 100),
+            'e_tag': f"{index:032x}",
+            'storage_class': 'STANDARD',
+            'is_latest': index != 7,
+            'is_delete_marker': index == 9,
+        }
+
+
+def _expected(prefix='', min_size=None, extension=None, end_day=None):
+    return sorted(
+        row['key'] for row in _rows()
+        if row['key'].startswith(prefix)
+        and row['is_latest'] and not row['is_delete_marker']
+        and (min_size is None or row['size'] >= min_size)
+        and (extension is None or row['key'].endswith(f".{extension}"))
+        and (end_day is None or row['last_modified_date'].date() <= end_day)
+    )
+
+
+def _manifest(file_format, files, schema=''):
+    return {
+        'sourceBucket': SOURCE_BUCKET,
+        'destinationBucket': f"arn:aws:s3:::{DESTINATION_BUCKET}",
+        'fileFormat': file_format,
+        'fileSchema': schema,
+        'files': [{'key': key, 'size': len(data), 'MD5checksum': ''} for key, data in files],
+    }
+
+
+def _csv_report():
+    schema = 'Bucket, Key, Size, LastModifiedDate, ETag, StorageClass, IsLatest, IsDeleteMarker'
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in _rows():
+        writer.writerow([
+            SOURCE_BUCKET, row['key'], row['size'],
+            row['last_modified_date'].strftime('%Y-%m-%dT%H:%M:%S.000Z'), row['e_tag'], row['storage_class'],
+            str(row['is_latest']).lower(), str(row['is_delete_marker']).lower(),
+        ])
+    data = gzip.compress(buffer.getvalue().encode('utf-8'))
+    return [(f"{CONFIG_PATH}/data/part-0.csv.gz", data)], schema
+
+
+def _parquet_report(row_group_size=500):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    rows = list(_rows())
+    table = pa.Table.from_pylist(rows)
+    # Columns a real report carries that the scan never needs
+    table = table.append_column('bucket', pa.array([SOURCE_BUCKET] * len(rows)))
+    padding = [f"COMPLETED {index}" * 200 for index in range(len(rows))]
+    table = table.append_column('replication_status', pa.array(padding))
+    files = []
+    for part, start in enumerate(range(0, len(rows), ROWS // 2)):
+        sink = io.BytesIO()
+        pq.write_table(table.slice(start, ROWS // 2), sink, row_group_size=row_group_size, compression='none')
+        files.append((f"{CONFIG_PATH}/data/part-{part}.parquet", sink.getvalue()))
+    return files
+
+
+def _write_local(root, file_format, files, schema=''):
+    report = os.path.join(root, CONFIG_PATH, '2024-02-01T00-00Z')
+    os.makedirs(report)
+    for key, data in files:
+        path = os.path.join(root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as handle:
+            handle.write(data)
+    with open(os.path.join(report, 'manifest.json'), 'w') as handle:
+        json.dump(_manifest(file_format, files, schema), handle)
+    return os.path.join(root, CONFIG_PATH)
+
+
+def _write_remote(file_format, files, schema=''):
+    s3 = boto3.client('s3')
+    s3.create_bucket(Bucket=DESTINATION_BUCKET)
+    for key, data in files:
+        s3.put_object(Bucket=DESTINATION_BUCKET, Key=key, Body=data)
+    s3.put_object(
+        Bucket=DESTINATION_BUCKET,
+        Key=f"{CONFIG_PATH}/2024-02-01T00-00Z/manifest.json",
+        Body=json.dumps(_manifest(file_format, files, schema)).encode('utf-8'),
+    )
+    return f"s3://{DESTINATION_BUCKET}/{CONFIG_PATH}/"
+
+
+def _keys(inventory, **kwargs):
+    return sorted(obj['Key'] for obj in inventory.iter_objects(**kwargs))
+
+
+def test_local_csv_report(tmp_path):
+    files, schema = _csv_report()
+    inventory = S3Inventory.latest(None, _write_local(str(tmp_path), 'CSV', files, schema))
+
+    assert _keys(inventory) == _expected()
+    assert _keys(inventory, prefix='logs/', filters={'min_size': 20000}) == _expected('logs/', min_size=20000)
+    assert _keys(inventory, filters={'extension': 'json', 'date_range': {'end': '2024-01-05'}}) == \
+        _expected(extension='json', end_day=(START + timedelta(days=4)).date())
+
+    obj = next(inventory.iter_objects(prefix='data/file-00002'))
+    assert obj == {
+        'Key': 'data/file-00002.csv', 'Size': 20, 'LastModified': START,
+        'ETag': f'"{2:032x}"', 'StorageClass': 'STANDARD',
+    }
+
+
+def test_local_parquet_report_skips_row_groups(tmp_path):
+    inventory = S3Inventory.latest(None, _write_local(str(tmp_path), 'Parquet', _parquet_report()))
+
+    assert _keys(inventory) == _expected()
+    assert _keys(inventory, filters={'min_size': 35000}) == _expected(min_size=35000)
+    # Sizes grow with the row index, so only the last of eight row groups can match
+    assert inventory.stats['row_groups_skipped'] == 7
+    assert _keys(inventory, filters={'extension': 'JSON'}) == _expected(extension='json')
+
+
+def test_remote_parquet_report_fetches_only_needed_bytes(aws):
+    files = _parquet_report()
+    inventory = S3Inventory.latest(boto3.client('s3'), _write_remote('Parquet', files))
+
+    assert _keys(inventory, prefix='logs/', filters={'min_size': 35000}) == _expected('logs/', min_size=35000)
+    total = sum(len(data) for _, data in files)
+    assert inventory.stats['row_groups_skipped'] == 7
+    assert 0 < inventory.stats['bytes_fetched'] < total / 4
+    assert inventory.stats['requests'] > 0
+
+
+def test_remote_csv_report(aws):
+    files, schema = _csv_report()
+    inventory = S3Inventory.latest(boto3.client('s3'), _write_remote('CSV', files, schema))
+
+    assert _keys(inventory, prefix='data/') == _expected('data/')
+
+
+def test_interleaved_scans_keep_their_own_stats(tmp_path):
+    files, schema = _csv_report()
+    inventory = S3Inventory.latest(None, _write_local(str(tmp_path), 'CSV', files, schema))
+    first_stats, second_stats = {}, {}
+
+    first = inventory.iter_objects(prefix='logs/', stats=first_stats)
+    first_keys = [next(first)['Key']]
+    second_keys = _keys(inventory, prefix='data/', stats=second_stats)
+    first_keys += [obj['Key'] for obj in first]
+
+    assert sorted(first_keys) == _expected('logs/')
+    assert second_keys == _expected('data/')
+    assert first_stats['rows_scanned'] == second_stats['rows_scanned'] == ROWS
+    assert first_stats['rows_matched'] == len(first_keys)
+    assert second_stats['rows_matched'] == len(second_keys)
+
+
+def test_list_objects_advanced_over_inventory(aws, tmp_path):
+    from aje_libs.common.helpers.s3_helper import S3Helper
+
+    boto3.client('s3').create_bucket(Bucket=SOURCE_BUCKET)
+    files, schema = _csv_report()
+    inventory = S3Inventory.latest(None, _write_local(str(tmp_path), 'CSV', files, schema))
+    helper = S3Helper(SOURCE_BUCKET, inventory=inventory)
+
+    result = helper.list_objects_advanced(prefix='logs/', filters={'min_size': 20000}, source='inventory')
+
+    assert sorted(obj['Key'] for obj in result['objects']) == _expected('logs/', min_size=20000)
+    assert result['metadata']['original_count'] == ROWS
@@ -0,0 +1,64 @@
+# tests/test_listing.py
+import itertools
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+KEYS = [f"logs/{index:03d}.{'json' if index % 5 == 0 else 'csv'}" for index in range(25)]
+
+
+@pytest.fixture
+def listed_bucket(bucket):
+    s3 = boto3.client('s3')
+    for index, key in enumerate(KEYS):
+        s3.put_object(Bucket=bucket, Key=key, Body=b'x' * index)
+    s3.put_object(Bucket=bucket, Key='other/file.csv', Body=b'x')
+    return bucket
+
+
+@pytest.fixture
+def metrics():
+    return InMemoryMetrics()
+
+
+@pytest.fixture
+def helper(listed_bucket, metrics):
+    return S3Helper(listed_bucket, metrics=metrics, validation='lazy')
+
+
+def _list_calls(metrics):
+    return sum(record['operation'] == 'ListObjectsV2' for record in metrics.records)
+
+
+def test_iter_objects_fetches_pages_on_demand(helper, metrics):
+    objects = helper.iter_objects(prefix='logs/', max_keys=10)
+
+    first = list(itertools.islice(objects, 10))
+    assert [obj['Key'] for obj in first] == KEYS[:10]
+    assert _list_calls(metrics) == 1
+
+    rest = list(objects)
+    assert [obj['Key'] for obj in first + rest] == KEYS
+    assert _list_calls(metrics) == 3
+
+
+def test_iter_objects_options(helper):
+    assert len(list(helper.iter_objects(prefix='logs/', max_keys=10, max_pages=2))) == 20
+    assert [obj['Key'] for obj in helper.iter_objects(prefix='logs/', start_after=KEYS[22])] == KEYS[23:]
+    filtered = helper.iter_objects(prefix='logs/', filters={'extension': 'json', 'min_size': 10})
+    assert [obj['Key'] for obj in filtered] == ['logs/010.json', 'logs/015.json', 'logs/020.json']
+
+
+def test_list_objects_collects_every_page(helper):
+    assert [obj['Key'] for obj in helper.list_objects(prefix='logs/', max_keys=7)] == KEYS
+
+
+def test_list_objects_with_metadata_groups_prefixes(helper):
+    result = helper.list_objects_with_metadata(delimiter='/')
+
+    assert result['objects'] == []
+    assert [common['Prefix'] for common in result['common_prefixes']] == ['logs/', 'other/']
+    assert result['metadata']['total_pages'] == 1
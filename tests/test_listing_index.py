@@ -0,0 +1,68 @@
+# tests/test_listing_index.py
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.listing_index import ListingIndex
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+@pytest.fixture
+def events_bucket(bucket):
+    s3 = boto3.client('s3')
+    for index in range(5):
+        s3.put_object(Bucket=bucket, Key=f"events/{index:04d}.json", Body=b'x' * (index * 100))
+    return bucket
+
+
+def _keys(objects):
+    return [obj['Key'] for obj in objects]
+
+
+def test_index_persists_across_processes(events_bucket, tmp_path):
+    path = str(tmp_path / 'index.db')
+    first = ListingIndex(path)
+    assert first.refresh(boto3.client('s3'), events_bucket, 'events/') == 5
+    first.close()
+
+    reopened = ListingIndex(path, refresh_interval=None)
+
+    assert reopened.count(events_bucket, 'events/') == 5
+    assert _keys(reopened.query(events_bucket, 'events/', min_size=200, max_size=300)) == \
+        ['events/0002.json', 'events/0003.json']
+
+
+def test_incremental_and_full_refresh(events_bucket, tmp_path):
+    s3 = boto3.client('s3')
+    index = ListingIndex(str(tmp_path / 'index.db'))
+    index.refresh(s3, events_bucket, 'events/')
+
+    s3.put_object(Bucket=events_bucket, Key='events/0005.json', Body=b'new')
+    s3.delete_object(Bucket=events_bucket, Key='events/0000.json')
+    # Only keys after the last indexed one are listed, deletions are kept
+    assert index.refresh(s3, events_bucket, 'events/') == 1
+    assert index.count(events_bucket, 'events/') == 6
+
+    assert index.refresh(s3, events_bucket, 'events/', full=True) == 5
+    assert _keys(index.query(events_bucket, 'events/'))[0] == 'events/0001.json'
+
+
+def test_query_listing_index_lists_only_when_stale(events_bucket, tmp_path):
+    metrics = InMemoryMetrics()
+    helper = S3Helper(
+        events_bucket,
+        listing_index=ListingIndex(str(tmp_path / 'index.db'), refresh_interval=None),
+        metrics=metrics,
+        validation='lazy',
+    )
+
+    assert len(list(helper.query_listing_index(prefix='events/'))) == 5
+    # A narrower prefix is answered by the scan covering it
+    assert _keys(helper.query_listing_index(prefix='events/0004')) == ['events/0004.json']
+    listings = [record for record in metrics.records if record['operation'] == 'ListObjectsV2']
+    assert len(listings) == 1
+
+
+def test_query_listing_index_requires_an_index(s3_helper):
+    with pytest.raises(ValueError):
+        s3_helper.query_listing_index()
@@ -0,0 +1,42 @@
+# tests/test_metrics.py
+import gc
+import weakref
+
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics, instrument_client
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+def test_collector_only_sees_its_own_helper(bucket):
+    metrics = InMemoryMetrics()
+    instrumented = S3Helper(bucket, metrics=metrics, validation='lazy')
+    plain = S3Helper(bucket, validation='lazy')
+
+    plain.put_object('plain.txt', b'not recorded')
+    instrumented.put_object('recorded.txt', b'recorded')
+    plain.read_object('recorded.txt')
+
+    assert instrumented.s3_client is not plain.s3_client
+    assert [(record['operation'], record['bytes_out']) for record in metrics.records] == [('PutObject', 8)]
+
+
+def test_collector_is_released_with_its_helper(bucket):
+    metrics = InMemoryMetrics()
+    helper = S3Helper(bucket, metrics=metrics, validation='lazy')
+    helper.put_object('key.txt', b'data')
+    reference = weakref.ref(metrics)
+
+    del helper, metrics
+    gc.collect()
+    assert reference() is None
+
+
+def test_unregister_stops_recording(s3_helper):
+    metrics = InMemoryMetrics()
+    client = s3_helper.session.client('s3')
+    unregister = instrument_client(client, metrics, bucket=s3_helper.bucket_name)
+
+    client.put_object(Bucket=s3_helper.bucket_name, Key='one.txt', Body=b'1')
+    unregister()
+    client.put_object(Bucket=s3_helper.bucket_name, Key='two.txt', Body=b'2')
+
+    assert len(metrics.records) == 1
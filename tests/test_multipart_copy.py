@@ -0,0 +1,91 @@
+# tests/test_multipart_copy.py
+import os
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from aje_libs.common.helpers import s3_helper as s3_helper_module
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3.transfer import MB
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+DATA = os.urandom(12 * MB + 5)
+
+
+@pytest.fixture
+def source(bucket):
+    boto3.client('s3').put_object(
+        Bucket=bucket,
+        Key='zone/raw/data.bin',
+        Body=DATA,
+        ContentType='application/x-custom',
+        Metadata={'origin': 'raw'},
+        Tagging='team=data&tier=raw',
+    )
+    return 'zone/raw/data.bin'
+
+
+def _tags(bucket, key):
+    tag_set = boto3.client('s3').get_object_tagging(Bucket=bucket, Key=key)['TagSet']
+    return {tag['Key']: tag['Value'] for tag in tag_set}
+
+
+def test_copy_object_makes_a_single_request_by_default(bucket, source):
+    metrics = InMemoryMetrics()
+    helper = S3Helper(bucket, metrics=metrics, validation='lazy')
+
+    helper.copy_object(source, 'zone/curated/data.bin')
+
+    assert [record['operation'] for record in metrics.records] == ['CopyObject']
+    assert boto3.client('s3').get_object(Bucket=bucket, Key='zone/curated/data.bin')['Body'].read() == DATA
+
+
+def test_multipart_copy_keeps_headers_metadata_and_tags(s3_helper, bucket, source):
+    s3_helper.copy_object(source, 'zone/curated/data.bin', multipart_threshold=5 * MB)
+
+    s3 = boto3.client('s3')
+    copied = s3.get_object(Bucket=bucket, Key='zone/curated/data.bin')
+    assert copied['Body'].read() == DATA
+    assert copied['ETag'].strip('"').endswith('-1')
+    assert copied['ContentType'] == 'application/x-custom'
+    assert copied['Metadata'] == {'origin': 'raw'}
+    assert _tags(bucket, 'zone/curated/data.bin') == {'team': 'data', 'tier': 'raw'}
+
+
+def test_multipart_copy_replaces_tags(s3_helper, bucket, source):
+    s3_helper.copy_object(
+        source,
+        'zone/curated/data.bin',
+        extra_args={'TaggingDirective': 'REPLACE', 'Tagging': 'tier=curated'},
+        multipart_threshold=5 * MB,
+    )
+
+    assert _tags(bucket, 'zone/curated/data.bin') == {'tier': 'curated'}
+
+
+def test_copy_object_falls_back_to_parts_for_oversized_sources(s3_helper, bucket, source, monkeypatch):
+    def reject(**kwargs):
+        raise ClientError({'Error': {'Code': 'InvalidRequest', 'Message': 'source too large'}}, 'CopyObject')
+
+    monkeypatch.setattr(s3_helper.s3_client, 'copy_object', reject)
+    monkeypatch.setattr(s3_helper_module, 'MAX_SINGLE_COPY_SIZE', 5 * MB)
+
+    s3_helper.copy_object(source, 'zone/curated/data.bin')
+
+    copied = boto3.client('s3').get_object(Bucket=bucket, Key='zone/curated/data.bin')
+    assert copied['Body'].read() == DATA
+    assert _tags(bucket, 'zone/curated/data.bin') == {'team': 'data', 'tier': 'raw'}
+
+
+def test_copy_prefix_rewrites_metadata(s3_helper, bucket, source):
+    boto3.client('s3').put_object(Bucket=bucket, Key='zone/raw/small.txt', Body=b'small', Metadata={'origin': 'raw'})
+
+    result = s3_helper.copy_prefix('zone/raw/', 'zone/curated/', metadata={'stage': 'curated'}, multipart_threshold=5 * MB)
+
+    assert result['copied'] == 2 and result['failed'] == 0
+    assert result['bytes'] == len(DATA) + 5
+    s3 = boto3.client('s3')
+    for key in ('zone/curated/data.bin', 'zone/curated/small.txt'):
+        assert s3.head_object(Bucket=bucket, Key=key)['Metadata'] == {'origin': 'raw', 'stage': 'curated'}
+    assert _tags(bucket, 'zone/curated/data.bin') == {'team': 'data', 'tier': 'raw'}
@@ -0,0 +1,71 @@
+# tests/test_object_cache.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.object_cache import ObjectCache
+from aje_libs.common.helpers.s3.transfer import MB
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+@pytest.fixture
+def objects(bucket):
+    s3 = boto3.client('s3')
+    contents = {f"data/{index}.bin": os.urandom(MB // 2 + index) for index in range(8)}
+    for key, data in contents.items():
+        s3.put_object(Bucket=bucket, Key=key, Body=data)
+    return contents
+
+
+def test_read_through_and_revalidation(bucket, objects, tmp_path):
+    s3 = boto3.client('s3')
+    cache = ObjectCache(str(tmp_path), revalidate_after=0)
+
+    assert cache.get_bytes(s3, bucket, 'data/0.bin') == objects['data/0.bin']
+    assert cache.get_bytes(s3, bucket, 'data/0.bin') == objects['data/0.bin']
+    s3.put_object(Bucket=bucket, Key='data/0.bin', Body=b'changed')
+    assert cache.get_bytes(s3, bucket, 'data/0.bin') == b'changed'
+
+    stats = cache.stats()
+    assert (stats['misses'], stats['revalidations']) == (2, 1)
+
+
+def test_entries_survive_restart(bucket, objects, tmp_path):
+    s3 = boto3.client('s3')
+    ObjectCache(str(tmp_path)).get_bytes(s3, bucket, 'data/1.bin')
+
+    cache = ObjectCache(str(tmp_path), revalidate_after=None)
+
+    assert cache.get_bytes(s3, bucket, 'data/1.bin') == objects['data/1.bin']
+    assert cache.stats()['hits'] == 1
+
+
+def test_open_handle_survives_eviction(bucket, objects, tmp_path):
+    s3 = boto3.client('s3')
+    cache = ObjectCache(str(tmp_path), max_bytes=MB, memory_max_bytes=0)
+
+    handle, _ = cache.open(s3, bucket, 'data/0.bin')
+    for key in ('data/1.bin', 'data/2.bin'):
+        cache.get_bytes(s3, bucket, key)
+
+    with handle:
+        assert handle.read() == objects['data/0.bin']
+    assert cache.stats()['entries'] == 1
+    assert cache.stats()['disk_bytes'] <= MB
+
+
+def test_concurrent_downloads_through_a_small_cache(bucket, objects, tmp_path):
+    cache = ObjectCache(str(tmp_path / 'cache'), max_bytes=MB, memory_max_object_size=0, revalidate_after=None)
+    helper = S3Helper(bucket, object_cache=cache)
+    keys = list(objects) * 4
+
+    def download(item):
+        index, key = item
+        target = tmp_path / f"{index}.bin"
+        helper.download_file(key, str(target))
+        return target.read_bytes() == objects[key]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(download, enumerate(keys)))
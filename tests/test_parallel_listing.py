@@ -0,0 +1,58 @@
+# tests/test_parallel_listing.py
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+
+KEYS = [f"p/{folder}/{index:02d}" for folder in 'abc' for index in range(5)] + ['p/top']
+
+
+@pytest.fixture
+def listed(bucket):
+    s3 = boto3.client('s3')
+    for key in KEYS:
+        s3.put_object(Bucket=bucket, Key=key, Body=b'x')
+    return bucket
+
+
+@pytest.mark.parametrize('strategy', ['delimiter', 'range'])
+def test_parallel_listing_returns_every_key_in_order(s3_helper, listed, strategy):
+    keys = [obj['Key'] for obj in s3_helper.iter_objects_parallel('p/', strategy=strategy, max_keys=2, shards=4)]
+
+    assert keys == sorted(KEYS)
+
+
+def test_max_pages_returns_the_first_pages(s3_helper, listed):
+    for _ in range(5):
+        keys = [obj['Key'] for obj in s3_helper.iter_objects_parallel('p/', max_keys=2, max_pages=3)]
+        assert keys == sorted(KEYS)[:6]
+
+
+def test_max_pages_limits_requests_on_a_flat_prefix(bucket):
+    from aje_libs.common.helpers.s3_helper import S3Helper
+
+    s3 = boto3.client('s3')
+    for index in range(5):
+        s3.put_object(Bucket=bucket, Key=f"flat/{index}", Body=b'x')
+    metrics = InMemoryMetrics()
+    helper = S3Helper(bucket, metrics=metrics, validation='lazy')
+
+    keys = [obj['Key'] for obj in helper.iter_objects_parallel('flat/', max_keys=1, max_pages=1)]
+
+    assert keys == ['flat/0']
+    assert [record['operation'] for record in metrics.records] == ['ListObjectsV2']
+
+
+def test_recursive_listing_applies_max_pages_per_directory(s3_helper, listed):
+    tree = s3_helper.list_objects_recursively('p/', max_keys=2, max_pages=1)
+
+    assert [obj['Key'] for obj in tree['directories']['p/a/']['files']] == ['p/a/00', 'p/a/01']
+    assert [obj['Key'] for obj in tree['directories']['p/b/']['files']] == ['p/b/00', 'p/b/01']
+
+
+def test_recursive_listing_builds_the_tree(s3_helper, listed):
+    tree = s3_helper.list_objects_recursively('p/', max_keys=2)
+
+    assert [obj['Key'] for obj in tree['files']] == ['p/top']
+    assert sorted(tree['directories']) == ['p/a/', 'p/b/', 'p/c/']
+    assert len(tree['directories']['p/c/']['files']) == 5
@@ -0,0 +1,75 @@
+# tests/test_partitions.py
+from datetime import date, timedelta
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.metrics import InMemoryMetrics
+from aje_libs.common.helpers.s3.partitions import partition_prefixes
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+def test_ranges_collapse_into_month_and_year_prefixes():
+    assert partition_prefixes('sales', '2023-12-30', '2025-02-02') == [
+        'sales/year=2023/month=12/day=30/',
+        'sales/year=2023/month=12/day=31/',
+        'sales/year=2024/',
+        'sales/year=2025/month=01/',
+        'sales/year=2025/month=02/day=01/',
+        'sales/year=2025/month=02/day=02/',
+    ]
+
+
+@pytest.mark.parametrize('layout, expected', [
+    ('path', ['s/2024/02/28/', 's/2024/02/29/', 's/2024/03/']),
+    ('hive_unpadded', ['s/year=2024/month=2/day=28/', 's/year=2024/month=2/day=29/', 's/year=2024/month=3/']),
+    # Without a '/' before the day, a whole month is the key prefix up to it
+    ('dt={year:04d}-{month:02d}-{day:02d}/', ['s/dt=2024-02-28/', 's/dt=2024-02-29/', 's/dt=2024-03-']),
+])
+def test_layouts(layout, expected):
+    assert partition_prefixes('s/', '2024-02-28', date(2024, 3, 31), layout=layout) == expected
+
+
+def test_layout_must_hold_every_field():
+    with pytest.raises(ValueError):
+        partition_prefixes('s/', '2024-01-01', '2024-01-02', layout='{year}/{month}/')
+
+
+@pytest.fixture
+def partitioned_bucket(bucket):
+    s3 = boto3.client('s3')
+    day = date(2024, 1, 25)
+    while day <= date(2024, 3, 5):
+        for name in ('a.csv', 'b.json'):
+            s3.put_object(
+                Bucket=bucket, Key=f"sales/year={day.year}/month={day.month:02d}/day={day.day:02d}/{name}", Body=b'x'
+            )
+        day += timedelta(days=1)
+    return bucket
+
+
+def test_only_the_partitions_in_range_are_listed(partitioned_bucket):
+    metrics = InMemoryMetrics()
+    helper = S3Helper(partitioned_bucket, metrics=metrics, validation='lazy')
+
+    objects = helper.list_objects_by_partition(prefix='sales/', start_date='2024-01-30', end_date='2024-03-01')
+
+    keys = [obj['Key'] for obj in objects]
+    assert keys[0] == 'sales/year=2024/month=01/day=30/a.csv'
+    assert keys[-1] == 'sales/year=2024/month=03/day=01/b.json'
+    assert len(keys) == 2 * (2 + 29 + 1)
+    # Two days of January, all of February and one day of March
+    assert sum(record['operation'] == 'ListObjectsV2' for record in metrics.records) == 4
+
+
+def test_partition_listing_applies_filters(s3_helper, partitioned_bucket):
+    objects = s3_helper.iter_objects_by_partition(
+        prefix='sales', start_date='2024-03-01', end_date='2024-03-05', filters={'extension': 'json'}
+    )
+
+    assert [obj['Key'][-22:] for obj in objects] == [f"month=03/day={day:02d}/b.json" for day in range(1, 6)]
+
+
+def test_partition_listing_requires_a_start_date(s3_helper):
+    with pytest.raises(ValueError):
+        list(s3_helper.iter_objects_by_partition(prefix='sales/'))
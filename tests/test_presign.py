@@ -0,0 +1,58 @@
+# tests/test_presign.py
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+from botocore.config import Config
+
+from aje_libs.common.helpers.s3.presign import PresignCache, presign_batch
+
+KEYS = ['plain.txt', 'dir/with space+plus.csv', 'ñandú/ü~x.json']
+
+
+def _normalize(url):
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    # Signatures made in different seconds legitimately differ
+    for name in ('X-Amz-Date', 'X-Amz-Signature', 'Expires', 'Signature'):
+        query.pop(name, None)
+    return parts.scheme, parts.netloc, parts.path, query
+
+
+@pytest.mark.parametrize('config', [
+    None,
+    Config(signature_version='s3v4', s3={'addressing_style': 'virtual'}),
+    Config(s3={'addressing_style': 'path'}),
+    Config(signature_version='s3'),
+])
+@pytest.mark.parametrize('http_method', ['get_object', 'put_object', 'head_object', 'delete_object'])
+def test_batch_urls_match_generate_presigned_url(s3_helper, config, http_method):
+    client = s3_helper.session.client('s3', config=config, region_name='eu-west-1')
+    urls = presign_batch(
+        client, s3_helper.bucket_name, KEYS, expiration=600, http_method=http_method,
+        credentials=s3_helper.session.get_credentials()
+    )
+    for key in KEYS:
+        expected = client.generate_presigned_url(
+            http_method, Params={'Bucket': s3_helper.bucket_name, 'Key': key}, ExpiresIn=600
+        )
+        assert _normalize(urls[key]) == _normalize(expected)
+
+
+def test_batch_urls_download_the_object(s3_helper):
+    # moto intercepts the requests library, not urllib
+    requests = pytest.importorskip('requests')
+
+    s3_helper.put_object(KEYS[1], b'payload')
+    url = s3_helper.get_presigned_urls([KEYS[1]])[KEYS[1]]
+    assert requests.get(url).content == b'payload'
+
+
+def test_cache_reuses_urls_until_credentials_rotate(s3_helper):
+    cache = PresignCache()
+    credentials = s3_helper.session.get_credentials()
+    first = presign_batch(s3_helper.s3_client, s3_helper.bucket_name, KEYS, cache=cache, credentials=credentials)
+    again = presign_batch(s3_helper.s3_client, s3_helper.bucket_name, KEYS, cache=cache, credentials=credentials)
+    assert first == again
+    assert cache.stats()['hits'] == len(KEYS)
+
+    assert cache.get('get_object', s3_helper.bucket_name, KEYS[0], 3600, access_key='rotated') is None
@@ -0,0 +1,81 @@
+# tests/test_range_reader.py
+import io
+import os
+import zipfile
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from aje_libs.common.helpers.s3.transfer import MB
+
+DATA = os.urandom(4 * MB + 123)
+BLOCK = 256 * 1024
+
+
+@pytest.fixture
+def blob(bucket):
+    boto3.client('s3').put_object(Bucket=bucket, Key='blob.bin', Body=DATA)
+    return 'blob.bin'
+
+
+def test_seek_and_read(s3_helper, blob):
+    with s3_helper.open_reader(blob, block_size=BLOCK) as reader:
+        assert reader.seek(-100, io.SEEK_END) == len(DATA) - 100
+        assert reader.read() == DATA[-100:]
+        assert reader.read() == b''
+        reader.seek(BLOCK - 10)
+        assert reader.read(20) == DATA[BLOCK - 10:BLOCK + 10]
+        assert reader.tell() == BLOCK + 10
+        assert reader.read_range(5, 15) == DATA[5:15]
+        assert reader.tell() == BLOCK + 10
+
+
+def test_adjacent_blocks_are_fetched_in_one_request(s3_helper, blob):
+    reader = s3_helper.open_reader(blob, block_size=BLOCK, readahead_blocks=0)
+
+    assert reader.read_range(0, 3 * BLOCK) == DATA[:3 * BLOCK]
+    assert reader.read_range(BLOCK, 2 * BLOCK) == DATA[BLOCK:2 * BLOCK]
+
+    assert reader.stats()['requests'] == 1
+    assert reader.stats()['bytes_fetched'] == 3 * BLOCK
+
+
+def test_sequential_reads_use_readahead(s3_helper, blob):
+    reader = s3_helper.open_reader(blob, block_size=BLOCK, readahead_blocks=3)
+
+    chunks = iter(lambda: reader.read(BLOCK // 2), b'')
+    assert b''.join(chunks) == DATA
+    # 17 blocks: the first read, then one request per four blocks
+    assert reader.stats()['requests'] == 5
+
+
+def test_cache_stays_bounded(s3_helper, blob):
+    reader = s3_helper.open_reader(blob, block_size=BLOCK, cache_blocks=2, readahead_blocks=0)
+
+    assert reader.read() == DATA
+    assert reader.stats()['cached_blocks'] == 2
+
+
+def test_overwrite_fails_instead_of_mixing_versions(s3_helper, bucket, blob):
+    reader = s3_helper.open_reader(blob, block_size=BLOCK, readahead_blocks=0)
+    reader.read(10)
+    boto3.client('s3').put_object(Bucket=bucket, Key=blob, Body=os.urandom(len(DATA)))
+
+    with pytest.raises(ClientError) as raised:
+        reader.read_range(2 * BLOCK, 3 * BLOCK)
+    assert raised.value.response['Error']['Code'] == 'PreconditionFailed'
+
+
+def test_zipfile_reads_one_member(s3_helper, bucket):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+        archive.writestr('big.bin', DATA)
+        archive.writestr('small.txt', b'hello')
+    boto3.client('s3').put_object(Bucket=bucket, Key='bundle.zip', Body=buffer.getvalue())
+
+    reader = s3_helper.open_reader('bundle.zip', block_size=64 * 1024, readahead_blocks=0)
+    with zipfile.ZipFile(reader) as archive:
+        assert archive.read('small.txt') == b'hello'
+
+    assert reader.stats()['bytes_fetched'] < 4 * 64 * 1024
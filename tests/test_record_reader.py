@@ -0,0 +1,53 @@
+# tests/test_record_reader.py
+import gzip
+import json
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3 import record_reader
+
+ROWS = [{'id': '1', 'name': 'a, b'}, {'id': '2', 'name': 'c'}]
+
+
+@pytest.fixture
+def records_bucket(bucket):
+    s3 = boto3.client('s3')
+    s3.put_object(Bucket=bucket, Key='data/rows.csv', Body=b'id,name\n1,"a, b"\n2,c\n')
+    s3.put_object(Bucket=bucket, Key='data/rows.tsv', Body=b'id\tname\n1\ta, b\n2\tc\n')
+    s3.put_object(Bucket=bucket, Key='data/rows.tsv.gz', Body=gzip.compress(b'id\tname\n1\ta, b\n2\tc\n'))
+    s3.put_object(Bucket=bucket, Key='data/rows.jsonl', Body=b''.join(json.dumps(r).encode() + b'\n' for r in ROWS))
+    s3.put_object(Bucket=bucket, Key='data/rows.json', Body=b'  \n' + json.dumps(ROWS).encode())
+    return bucket
+
+
+@pytest.mark.parametrize('key', ['data/rows.csv', 'data/rows.tsv', 'data/rows.tsv.gz', 'data/rows.jsonl', 'data/rows.json'])
+def test_iter_records(s3_helper, records_bucket, key):
+    assert list(s3_helper.iter_records(key)) == ROWS
+
+
+def test_iter_records_batches(s3_helper, records_bucket):
+    assert list(s3_helper.iter_records('data/rows.tsv', batch_size=1)) == [[ROWS[0]], [ROWS[1]]]
+
+
+def test_explicit_delimiter_overrides_the_extension(s3_helper, records_bucket):
+    rows = list(s3_helper.iter_records('data/rows.tsv', delimiter=','))
+
+    assert rows[0] == {'id\tname': '1\ta', None: [' b']}
+
+
+@pytest.mark.parametrize('key', ['data/rows.csv', 'data/rows.tsv.gz', 'data/rows.jsonl', 'data/rows.json'])
+def test_iter_dataframes(s3_helper, records_bucket, key):
+    pytest.importorskip('pandas')
+
+    frames = list(s3_helper.iter_dataframes(key, chunksize=1, dtype=str))
+
+    assert len(frames) == 2
+    assert [row for frame in frames for row in frame.to_dict('records')] == ROWS
+
+
+def test_infer_delimiter():
+    assert record_reader.infer_delimiter('a/b.TSV') == '\t'
+    assert record_reader.infer_delimiter('a/b.tsv.zst') == '\t'
+    assert record_reader.infer_delimiter('a/b.csv') is None
+    assert record_reader.infer_format('a/b.tsv.gz') == 'csv'
@@ -0,0 +1,74 @@
+# tests/test_stream_writer.py
+import gc
+import os
+import time
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from aje_libs.common.helpers.s3.transfer import MB
+
+
+def _exists(bucket, key):
+    try:
+        boto3.client('s3').head_object(Bucket=bucket, Key=key)
+        return True
+    except ClientError:
+        return False
+
+
+def _open_uploads(bucket):
+    return boto3.client('s3').list_multipart_uploads(Bucket=bucket).get('Uploads', [])
+
+
+def test_small_stream_is_written_with_a_single_put(s3_helper, bucket):
+    with s3_helper.open_writer('out.csv', mode='w') as writer:
+        writer.write('a,b\n1,2\n')
+
+    assert boto3.client('s3').get_object(Bucket=bucket, Key='out.csv')['Body'].read() == b'a,b\n1,2\n'
+
+
+def test_large_stream_is_written_in_parts(s3_helper, bucket):
+    data = os.urandom(12 * MB)
+    with s3_helper.open_writer('big.bin', part_size=5 * MB) as writer:
+        for offset in range(0, len(data), MB):
+            writer.write(data[offset:offset + MB])
+
+    assert boto3.client('s3').get_object(Bucket=bucket, Key='big.bin')['Body'].read() == data
+    assert _open_uploads(bucket) == []
+
+
+def test_exception_in_with_block_aborts_the_upload(s3_helper, bucket):
+    with pytest.raises(RuntimeError):
+        with s3_helper.open_writer('big.bin', part_size=5 * MB) as writer:
+            writer.write(os.urandom(6 * MB))
+            raise RuntimeError('producer failed')
+
+    assert not _exists(bucket, 'big.bin')
+    assert _open_uploads(bucket) == []
+
+
+def _produce_and_fail(s3_helper, key, size):
+    writer = s3_helper.open_writer(key, part_size=5 * MB)
+    writer.write(b'x' * size)
+    raise RuntimeError('producer failed')
+
+
+@pytest.mark.parametrize('size', [10, 6 * MB])
+def test_unclosed_writer_is_aborted_on_garbage_collection(s3_helper, bucket, size):
+    # pytest.raises would keep the traceback, and with it the writer, alive
+    try:
+        _produce_and_fail(s3_helper, 'out.csv', size)
+    except RuntimeError:
+        pass
+    # Parts still uploading keep the writer alive until they finish
+    deadline = time.monotonic() + 10
+    while True:
+        gc.collect()
+        if not _open_uploads(bucket) or time.monotonic() > deadline:
+            break
+        time.sleep(0.05)
+
+    assert not _exists(bucket, 'out.csv')
+    assert _open_uploads(bucket) == []
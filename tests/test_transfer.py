@@ -0,0 +1,70 @@
+# tests/test_transfer.py
+import os
+
+import boto3
+import pytest
+
+from aje_libs.common.helpers.s3.transfer import (
+    MAX_PARTS,
+    MB,
+    TransferProgress,
+    build_transfer_config,
+    part_size_for,
+)
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+def test_build_transfer_config_bounds_buffered_parts():
+    config = build_transfer_config(part_size=8 * MB, max_workers=16, max_in_flight_bytes=64 * MB)
+
+    assert config.multipart_chunksize == config.multipart_threshold == 8 * MB
+    assert config.max_concurrency == 16
+    assert config.max_in_memory_upload_chunks == config.max_in_memory_download_chunks == 8
+
+
+@pytest.mark.parametrize('arguments', [{'part_size': 4 * MB}, {'max_workers': 0}])
+def test_build_transfer_config_rejects_invalid_settings(arguments):
+    with pytest.raises(ValueError):
+        build_transfer_config(**arguments)
+
+
+def test_part_size_for_stays_within_the_part_limit():
+    assert part_size_for(100 * MB) == 16 * MB
+    assert part_size_for(100 * MB, part_size=1) == 5 * MB
+    size = part_size_for(200 * 1024 * MB * 1024)
+    assert 200 * 1024 * MB * 1024 <= size * MAX_PARTS
+
+
+def test_transfer_progress_reports_completion():
+    updates = []
+    progress = TransferProgress(total_bytes=10, on_update=updates.append, report_interval=3600, label='file')
+
+    for _ in range(10):
+        progress(1)
+
+    assert progress.transferred_bytes == 10
+    # The first call reports, then only the completed transfer within the interval
+    assert [update['percent'] for update in updates] == [10.0, 100.0]
+    assert progress.snapshot()['label'] == 'file'
+
+
+def test_multipart_upload_and_download_round_trip(bucket, tmp_path):
+    helper = S3Helper(bucket, transfer_config=build_transfer_config(part_size=5 * MB, max_workers=4))
+    data = os.urandom(12 * MB + 3)
+    source = tmp_path / 'export.csv'
+    source.write_bytes(data)
+    upload_progress = TransferProgress(total_bytes=len(data))
+
+    helper.upload_file(str(source), 'exports/export.csv', callback=upload_progress)
+
+    stored = boto3.client('s3').head_object(Bucket=bucket, Key='exports/export.csv')
+    assert stored['ETag'].strip('"').endswith('-3')
+    assert stored['ContentType'] == 'text/csv'
+    assert upload_progress.transferred_bytes == len(data)
+
+    download_progress = TransferProgress(total_bytes=len(data))
+    target = tmp_path / 'copy.csv'
+    helper.download_file('exports/export.csv', str(target), callback=download_progress)
+
+    assert target.read_bytes() == data
+    assert download_progress.snapshot()['percent'] == 100.0
@@ -0,0 +1,76 @@
+# tests/test_validation.py
+import boto3
+import pytest
+
+from aje_libs.common.helpers.dynamodb_helper import DynamoDBHelper
+from aje_libs.common.helpers.s3_helper import S3Helper
+
+
+def _count_calls(event_name):
+    """Count the API calls of clients built from the current default session"""
+    calls = []
+    boto3._get_default_session().events.register(event_name, lambda **kwargs: calls.append(1))
+    return calls
+
+
+def _switch_credentials(monkeypatch, access_key):
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', access_key)
+    monkeypatch.setattr(boto3, 'DEFAULT_SESSION', None)
+
+
+def test_bucket_check_is_reused_for_the_same_credentials(bucket):
+    calls = _count_calls('before-call.s3.HeadBucket')
+
+    S3Helper(bucket)
+    S3Helper(bucket)
+    S3Helper(bucket, validation='lazy')
+
+    assert len(calls) == 1
+
+
+def test_bucket_check_is_repeated_for_other_credentials(bucket, monkeypatch):
+    S3Helper(bucket)
+    _switch_credentials(monkeypatch, 'other-principal')
+    calls = _count_calls('before-call.s3.HeadBucket')
+
+    S3Helper(bucket)
+    S3Helper(bucket)
+
+    assert len(calls) == 1
+
+
+def test_eager_validation_always_checks(bucket):
+    calls = _count_calls('before-call.s3.HeadBucket')
+
+    S3Helper(bucket)
+    S3Helper(bucket, validation='eager')
+
+    assert len(calls) == 2
+
+
+def test_missing_bucket_is_not_cached(aws):
+    from botocore.exceptions import ClientError
+
+    for _ in range(2):
+        with pytest.raises(ClientError):
+            S3Helper('aje-missing-bucket')
+
+
+def test_table_description_is_cached_per_credentials(aws, monkeypatch):
+    boto3.client('dynamodb').create_table(
+        TableName='aje-test-table',
+        KeySchema=[{'AttributeName': 'pk', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': 'pk', 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST',
+    )
+    calls = _count_calls('before-call.dynamodb.DescribeTable')
+    DynamoDBHelper('aje-test-table', 'pk')
+    helper = DynamoDBHelper('aje-test-table', 'pk')
+    assert helper.key_schema == [{'AttributeName': 'pk', 'KeyType': 'HASH'}]
+    assert len(calls) == 1
+
+    _switch_credentials(monkeypatch, 'other-principal')
+    calls = _count_calls('before-call.dynamodb.DescribeTable')
+    DynamoDBHelper('aje-test-table', 'pk')
+
+    assert len(calls) == 1